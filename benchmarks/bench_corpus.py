@@ -0,0 +1,103 @@
+"""누적 코퍼스: 파일 추가 시 전체 재처리(기존) vs 새 기사만 추가
+
+겹치는 구간이 있는 월별 내보내기 파일을 차례로 추가한다. 기존 방식은 파일이
+추가될 때마다 전체를 합쳐 중복을 지우고 검색 색인, 게시일 색인, 분석 큐브를 새로
+만든다. Corpus는 새 기사만 이어 붙이고 파생 구조를 새 기사 분량만 갱신한다.
+마지막에 두 방식의 검색/집계 결과가 같은지 확인한다.
+
+사용법: python benchmarks/bench_corpus.py --rows 200000 --files 6 --overlap 0.3
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd
+
+from benchmarks.synthetic import make_news_frame
+from news_analysis.corpus import Corpus
+from news_analysis.cube import AnalysisCube
+from news_analysis.dates import DateIndex
+from news_analysis.ingest import Dataset, normalize_news_df
+from news_analysis.keywords import KeywordStore
+from news_analysis.network import org_lists
+from news_analysis.search import SearchIndex
+
+QUERIES = ['탄소', '환경부 수소', '기관:청 OR 풍력', '"탄소 중립"']
+
+
+def build_derived(dataset):
+    """대시보드가 데이터셋마다 만드는 파생 구조"""
+    dataset.derived('search_index', SearchIndex)
+    dataset.derived('date_index', DateIndex.from_frame)
+    cube = dataset.derived('analysis_cube', AnalysisCube)
+    cube.dimension('keyword', KeywordStore.from_frame)
+    cube.dimension('org', lambda df: org_lists(df['관련기관']))
+
+
+def legacy_merge(files):
+    """기존 방식: 지금까지의 파일을 모두 합쳐 중복 제거 후 파생 구조를 새로 만듦"""
+    news_df = pd.concat(files, ignore_index=True)
+    news_df = news_df.drop_duplicates('기사링크').reset_index(drop=True)
+    dataset = Dataset('merged', news_df)
+    build_derived(dataset)
+    return dataset
+
+
+def results(dataset):
+    search = dataset.derived('search_index', SearchIndex)
+    dates = dataset.derived('date_index', DateIndex.from_frame)
+    cube = dataset.derived('analysis_cube', AnalysisCube)
+    return (
+        [search.search(query).tolist() for query in QUERIES],
+        dates.order.tolist(),
+        dates.trend('month').to_dict(),
+        cube.year_counts().to_dict(),
+        list(cube.top('keyword', 20).items()),
+        list(cube.frequency('org', years=cube.years[-2:]).items()),
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=200000)
+    parser.add_argument('--files', type=int, default=6)
+    parser.add_argument('--overlap', type=float, default=0.3)
+    args = parser.parse_args()
+
+    news_df = normalize_news_df(make_news_frame(args.rows, body_words=0))
+    news_df = news_df.sort_values('작성/게시일자', kind='stable').reset_index(drop=True)
+    # 파일마다 앞 파일과 overlap 비율만큼 겹치는 구간
+    size = int(args.rows / (args.files - (args.files - 1) * args.overlap))
+    step = int(size * (1 - args.overlap))
+    files = [news_df.iloc[i * step:i * step + size] for i in range(args.files)]
+    files[-1] = news_df.iloc[(args.files - 1) * step:]
+
+    corpus = Corpus()
+    legacy_total = corpus_total = 0.0
+    print(f"기사 {args.rows:,}건, 파일 {args.files}개 (파일당 약 {size:,}건, 겹침 {args.overlap:.0%})")
+    for i, part in enumerate(files):
+        start = time.perf_counter()
+        legacy = legacy_merge(files[:i + 1])
+        legacy_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        added = corpus.add(f'file-{i}', part, name=f'file-{i}')
+        if i == 0:
+            build_derived(corpus.dataset)
+        corpus_time = time.perf_counter() - start
+
+        legacy_total += legacy_time
+        corpus_total += corpus_time
+        print(f"  파일 {i + 1}: 새 기사 {added:,}건, 전체 {len(corpus):,}건 - "
+              f"전체 재처리 {legacy_time:.3f}s, 새 기사만 {corpus_time:.3f}s")
+
+    assert len(corpus) == len(legacy.news_df) == args.rows
+    assert results(corpus.dataset) == results(legacy)
+    print(f"  합계: 전체 재처리 {legacy_total:.3f}s, 새 기사만 {corpus_total:.3f}s ({legacy_total / corpus_total:.1f}x)")
+
+
+if __name__ == '__main__':
+    main()
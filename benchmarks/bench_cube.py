@@ -0,0 +1,88 @@
+"""연도별 사전 집계(AnalysisCube)와 기존 문자열 재집계 비교
+
+분석 1~3(지명 빈도수, 연도별 기사 수, 키워드 상위 N개)을 전체 데이터, 연도 선택,
+검색 결과(행 마스크)에 대해 각각 계산한다.
+
+사용법: python benchmarks/bench_cube.py --rows 100000
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from benchmarks.bench_keywords import legacy_top_keywords
+from benchmarks.bench_locations import legacy_org_location_frequency
+from benchmarks.synthetic import make_news_frame
+from news_analysis.cube import AnalysisCube
+from news_analysis.gazetteer import load_gazetteer
+from news_analysis.ingest import normalize_news_df
+from news_analysis.keywords import KeywordStore
+from news_analysis.locations import LocationMatcher, OrgResolutionTable, org_location_lists
+from news_analysis.network import org_lists
+
+
+def legacy_analyses(display_df, coords, top_n):
+    """기존 구현 (걸러낸 데이터프레임의 문자열을 매번 다시 집계)"""
+    return (
+        legacy_org_location_frequency(display_df['관련기관'], coords),
+        display_df['연도'].value_counts().sort_index(),
+        legacy_top_keywords(display_df['키워드'], top_n),
+    )
+
+
+def cube_analyses(cube, top_n, rows=None, years=None):
+    return (
+        cube.frequency('location', rows, years),
+        cube.year_counts(rows if years is None else cube.year_rows(years)),
+        cube.top('keyword', top_n, rows, years),
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=100000)
+    parser.add_argument('--top', type=int, default=20)
+    args = parser.parse_args()
+
+    news_df = normalize_news_df(make_news_frame(args.rows, body_words=0))
+    gazetteer = load_gazetteer()
+    coords = gazetteer.to_dict()
+    table = OrgResolutionTable(LocationMatcher(gazetteer.names))
+
+    start = time.perf_counter()
+    cube = AnalysisCube(news_df)
+    cube.dimension('location', lambda df: org_location_lists(df['관련기관'], table))
+    cube.dimension('keyword', KeywordStore.from_frame)
+    cube.dimension('org', lambda df: org_lists(df['관련기관']))
+    build = time.perf_counter() - start
+    print(f"기사 {args.rows:,}건, 연도 {len(cube.years)}개, 큐브 생성 {build:.3f}s (데이터셋당 한 번)")
+
+    rng = np.random.default_rng(0)
+    search_rows = np.sort(rng.choice(args.rows, args.rows // 20, replace=False))
+    recent_years = cube.years[-2:]
+    views = [
+        ('전체', None, None, news_df),
+        (f'연도 {",".join(recent_years)}', None, recent_years, news_df[news_df['연도'].isin(recent_years)]),
+        ('검색 결과 5%', search_rows, None, news_df.iloc[search_rows]),
+    ]
+    for name, rows, years, display_df in views:
+        start = time.perf_counter()
+        expected = legacy_analyses(display_df, coords, args.top)
+        legacy = time.perf_counter() - start
+
+        start = time.perf_counter()
+        actual = cube_analyses(cube, args.top, rows, years)
+        fast = time.perf_counter() - start
+
+        assert list(actual[0].items()) == list(expected[0].items()), name
+        assert actual[1].tolist() == expected[1].tolist() and list(actual[1].index) == list(expected[1].index), name
+        assert list(actual[2].items()) == list(expected[2].items()), name
+        print(f"  {name}: 기존 {legacy:.3f}s, 큐브 {fast:.4f}s ({legacy / fast:.0f}x)")
+
+
+if __name__ == '__main__':
+    main()
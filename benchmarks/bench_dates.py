@@ -0,0 +1,71 @@
+"""게시일 정렬 색인(DateIndex)과 문자열/마스크 방식 비교
+
+- 기간 필터: 전체 게시일 비교 마스크 vs 정렬된 일수에서 searchsorted
+- 추이 집계: 일자 문자열 자르기 + value_counts vs 일수 내림 + bincount
+
+사용법: python benchmarks/bench_dates.py --rows 1000000
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.bench_layout import timed
+from benchmarks.synthetic import make_news_frame
+from news_analysis.dates import DateIndex
+from news_analysis.ingest import DATE_COLUMN, normalize_news_df
+
+
+def legacy_range_rows(news_df, start, end):
+    """전체 게시일을 비교하는 마스크 방식"""
+    dates = news_df[DATE_COLUMN]
+    return np.flatnonzero(((dates >= pd.Timestamp(start)) & (dates <= pd.Timestamp(end))).to_numpy())
+
+
+def legacy_trend(news_df, length):
+    """일자 문자열 앞부분(연도 4자리, 연월 6자리)으로 센 기간별 기사 수"""
+    return news_df['작성/게시일자'].astype(str).str[:length].value_counts().sort_index()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=1000000)
+    args = parser.parse_args()
+
+    news_df = normalize_news_df(make_news_frame(args.rows, body_words=0))
+
+    start = time.perf_counter()
+    index = DateIndex.from_frame(news_df)
+    print(f"기사 {args.rows:,}건, 색인 생성 {time.perf_counter() - start:.3f}s (데이터셋당 한 번)")
+
+    for start_date, end_date in [('2020-03-01', '2020-03-31'), ('2016-01-01', '2023-12-31')]:
+        expected = legacy_range_rows(news_df, start_date, end_date)
+        actual = index.range_rows(start_date, end_date)
+        assert np.array_equal(actual, expected)
+        legacy = timed(lambda: legacy_range_rows(news_df, start_date, end_date))
+        fast = timed(lambda: index.range_rows(start_date, end_date))
+        print(f"  기간 {start_date}~{end_date} ({len(actual):,}건): 마스크 {legacy:.4f}s, "
+              f"searchsorted {fast:.4f}s ({legacy / fast:.0f}x)")
+
+    for granularity, length, fmt in [('year', 4, '%Y'), ('month', 6, '%Y%m')]:
+        expected = legacy_trend(news_df, length)
+        actual = index.trend(granularity)
+        assert list(actual.index.strftime(fmt)) == list(expected.index)
+        assert actual.tolist() == expected.tolist()
+        legacy = timed(lambda: legacy_trend(news_df, length))
+        fast = timed(lambda: index.trend(granularity))
+        print(f"  {granularity} 추이: 문자열 {legacy:.4f}s, bincount {fast:.4f}s ({legacy / fast:.0f}x)")
+
+    for granularity in ('week', 'day'):
+        fast = timed(lambda: index.trend(granularity))
+        assert index.trend(granularity).sum() == args.rows
+        print(f"  {granularity} 추이: bincount {fast:.4f}s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,73 @@
+"""유사 중복 기사 묶기: 모든 기사 쌍의 자카드 비교(기존 방식) vs MinHash/LSH
+
+작은 데이터에서는 모든 쌍의 정확한 자카드 유사도로 찾은 유사 중복 쌍을 기준으로
+LSH 묶음의 재현율(기준 쌍 중 같은 묶음에 들어간 비율)과 정밀도(같은 묶음으로 연결한
+쌍 중 기준 쌍의 비율)를 확인하고, 큰 데이터에서는 LSH 처리 시간만 잰다.
+
+사용법: python benchmarks/bench_dedup.py --pairwise-rows 1000 2000 --rows 100000
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from benchmarks.synthetic import make_wire_frame
+from news_analysis.dedup import NearDuplicates, lsh_edges, shingle_lists
+from news_analysis.ingest import normalize_news_df
+
+
+def pairwise_jaccard_pairs(lists, threshold):
+    """모든 기사 쌍의 자카드 유사도를 계산하여 threshold 이상인 쌍의 집합"""
+    sets = [set(lists.ids[lists.offsets[i]:lists.offsets[i + 1]].tolist()) for i in range(len(lists))]
+    pairs = set()
+    for i in range(len(sets)):
+        for j in range(i + 1, len(sets)):
+            union = len(sets[i] | sets[j])
+            if union and len(sets[i] & sets[j]) / union >= threshold:
+                pairs.add((i, j))
+    return pairs
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--pairwise-rows', type=int, nargs='+', default=[1000, 2000])
+    parser.add_argument('--rows', type=int, default=100000)
+    parser.add_argument('--threshold', type=float, default=0.8)
+    args = parser.parse_args()
+
+    for n_rows in args.pairwise_rows:
+        news_df = normalize_news_df(make_wire_frame(n_rows))
+        lists = shingle_lists(news_df)
+
+        start = time.perf_counter()
+        expected = pairwise_jaccard_pairs(lists, args.threshold)
+        naive = time.perf_counter() - start
+
+        start = time.perf_counter()
+        duplicates = NearDuplicates(news_df, threshold=args.threshold)
+        fast = time.perf_counter() - start
+
+        labels = duplicates.labels
+        recall = np.mean([labels[i] == labels[j] for i, j in expected]) if expected else 1.0
+        sources, targets = lsh_edges(duplicates.signatures, threshold=args.threshold)
+        linked = {(min(a, b), max(a, b)) for a, b in zip(sources.tolist(), targets.tolist())}
+        precision = len(linked & expected) / len(linked) if linked else 1.0
+        print(f"기사 {n_rows:,}건: 모든 쌍 비교 {naive:.2f}s ({len(expected):,}쌍), "
+              f"MinHash/LSH {fast:.3f}s ({naive / fast:.0f}x) - 재현율 {recall:.3f}, 정밀도 {precision:.3f}, "
+              f"제외 {duplicates.n_duplicates:,}건")
+
+    news_df = normalize_news_df(make_wire_frame(args.rows))
+    start = time.perf_counter()
+    duplicates = NearDuplicates(news_df, threshold=args.threshold)
+    fast = time.perf_counter() - start
+    last = args.pairwise_rows[-1]
+    print(f"기사 {args.rows:,}건: MinHash/LSH {fast:.2f}s, 묶음 {duplicates.n_clusters:,}개, "
+          f"제외 {duplicates.n_duplicates:,}건 (모든 쌍 비교는 약 {naive * (args.rows / last) ** 2 / 3600:.1f}시간 예상)")
+
+
+if __name__ == '__main__':
+    main()
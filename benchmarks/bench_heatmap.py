@@ -0,0 +1,105 @@
+"""히트맵 생성 비교 (iterrows로 만든 folium 지도 / 배열 연산 / HTML 캐시 적중)
+
+사용법: python benchmarks/bench_heatmap.py --rows 50000
+"""
+import argparse
+import os
+import sys
+import time
+import warnings
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import folium
+import pandas as pd
+from folium.plugins import HeatMap
+
+from benchmarks.synthetic import make_news_frame
+from news_analysis.gazetteer import load_gazetteer
+from news_analysis.heatmap import HeatmapCache, create_heatmap, render_map_html
+from news_analysis.locations import get_org_location_frequency
+
+
+def legacy_create_heatmap(location_counts, coords_dict):
+    """기존 구현 (apply로 좌표 조회, iterrows로 가중치 계산과 마커 추가)"""
+    df_locations = pd.DataFrame({
+        'location': list(location_counts.keys()),
+        'count': list(location_counts.values())
+    })
+    df_locations['lat'] = df_locations['location'].apply(lambda x: coords_dict.get(x, {}).get('lat'))
+    df_locations['lon'] = df_locations['location'].apply(lambda x: coords_dict.get(x, {}).get('lon'))
+    df_locations = df_locations.dropna(subset=['lat', 'lon'])
+    if df_locations.empty:
+        return None
+
+    m = folium.Map(location=[36.5, 127.5], zoom_start=7, tiles='cartodbpositron')
+    max_count = df_locations['count'].max()
+    min_count = df_locations['count'].min()
+    count_range = max(1, max_count - min_count)
+    heat_data = []
+    for _, row in df_locations.iterrows():
+        normalized_weight = 1.0 + 4.0 * (row['count'] - min_count) / count_range
+        heat_data.append([row['lat'], row['lon'], normalized_weight])
+    HeatMap(
+        heat_data, radius=20, blur=15, max_zoom=12, min_opacity=0.5,
+        gradient={0.4: 'blue', 0.6: 'lime', 0.8: 'orange', 1.0: 'red'}
+    ).add_to(m)
+
+    top_locations = df_locations.nlargest(10, 'count')
+    for _, row in top_locations.iterrows():
+        folium.CircleMarker(
+            location=[row['lat'], row['lon']],
+            radius=row['count'] / max(df_locations['count']) * 10 + 5,
+            popup=f"{row['location']}: {row['count']}건",
+            color='blue', fill=True, fill_opacity=0.4
+        ).add_to(m)
+    return m
+
+
+def map_layers(m):
+    """비교용: 히트맵 데이터와 마커 (좌표, 반경)"""
+    heat, markers = None, []
+    for child in m._children.values():
+        if isinstance(child, HeatMap):
+            heat = child.data
+        elif isinstance(child, folium.CircleMarker):
+            markers.append((tuple(child.location), child.options['radius']))
+    return heat, markers
+
+
+def timed(func, repeat=5):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=50000)
+    args = parser.parse_args()
+    # CartoDB 타일 API 키 경고는 비교와 무관
+    warnings.filterwarnings('ignore', category=UserWarning)
+
+    gazetteer = load_gazetteer()
+    coords_dict = gazetteer.to_dict()
+    location_counts = get_org_location_frequency(
+        make_news_frame(args.rows, body_words=0)['기관'], gazetteer
+    )
+    print(f"지명 {len(location_counts)}개")
+
+    assert map_layers(legacy_create_heatmap(location_counts, coords_dict)) == \
+        map_layers(create_heatmap(location_counts, gazetteer))
+
+    legacy = timed(lambda: render_map_html(legacy_create_heatmap(location_counts, coords_dict)))
+    vectorized = timed(lambda: render_map_html(create_heatmap(location_counts, gazetteer)))
+    cache = HeatmapCache()
+    cache.html(location_counts, gazetteer)
+    cached = timed(lambda: cache.html(location_counts, gazetteer))
+    print(f"  지도 생성 + HTML: 기존 {legacy:.4f}s, 배열 연산 {vectorized:.4f}s, 캐시 적중 {cached * 1000:.3f}ms")
+
+
+if __name__ == '__main__':
+    main()
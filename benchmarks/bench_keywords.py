@@ -0,0 +1,63 @@
+"""키워드 빈도수 계산 비교 (문자열 join/split + Counter / 정수 코드 bincount)
+
+사용법: python benchmarks/bench_keywords.py --rows 100000
+"""
+import argparse
+import os
+import sys
+import time
+from collections import Counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from benchmarks.synthetic import make_news_frame
+from news_analysis.keywords import KeywordStore
+
+
+def legacy_top_keywords(keyword_series, top_n):
+    """기존 구현 (전체 키워드를 하나의 문자열로 이어붙여 분리한 뒤 Counter)"""
+    all_keywords = ",".join(keyword_series.dropna().astype(str)).split(",")
+    filtered_keywords = [kw.strip() for kw in all_keywords if len(kw.strip()) > 1]
+    keyword_freq = Counter(filtered_keywords)
+    return dict(keyword_freq.most_common(top_n))
+
+
+def timed(func, repeat=3):
+    best, result = float('inf'), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=100000)
+    parser.add_argument('--top', type=int, default=100)
+    args = parser.parse_args()
+
+    keywords = make_news_frame(args.rows, body_words=0)['특성추출(가중치순 상위 50개)']
+    start = time.perf_counter()
+    store = KeywordStore(keywords)
+    build = time.perf_counter() - start
+    print(f"기사 {args.rows:,}건, 키워드 {len(store.ids):,}개 (어휘 {len(store.vocab):,}개), 저장소 생성 {build:.3f}s")
+
+    rng = np.random.default_rng(0)
+    subsets = {
+        '전체': None,
+        '10% 표본': np.sort(rng.choice(args.rows, args.rows // 10, replace=False)),
+        '1% 표본': np.sort(rng.choice(args.rows, args.rows // 100, replace=False)),
+    }
+    for name, rows in subsets.items():
+        series = keywords if rows is None else keywords.iloc[rows]
+        legacy, expected = timed(lambda: legacy_top_keywords(series, args.top))
+        fast, result = timed(lambda: store.top(args.top, rows))
+        assert list(result.items()) == list(expected.items()), name
+        print(f"  {name}: 기존 {legacy:.3f}s, bincount {fast:.4f}s ({legacy / fast:.0f}x)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,70 @@
+"""네트워크 배치 계산 비교 (networkx spring_layout / NumPy 배치 / 캐시 + 웜 스타트)
+
+사용법: python benchmarks/bench_layout.py --rows 50000 --nodes 30 100 300 500
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import networkx as nx
+
+from benchmarks.synthetic import make_news_frame
+from news_analysis.layout import LayoutCache, force_layout
+from news_analysis.network import build_org_graph
+
+
+def top_subgraph(G, node_count):
+    """연결 수 상위 node_count개 노드의 부분 그래프 (대시보드와 같은 방식)"""
+    top_nodes = sorted(G.degree, key=lambda x: x[1], reverse=True)[:node_count]
+    return G.subgraph([n for n, _ in top_nodes])
+
+
+def timed(func, repeat=3):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=50000)
+    parser.add_argument('--nodes', type=int, nargs='+', default=[30, 100, 300, 500])
+    args = parser.parse_args()
+
+    G = build_org_graph(make_news_frame(args.rows, body_words=0)['기관'])
+    print(f"기사 {args.rows:,}건, 기관 {G.number_of_nodes():,}개, 엣지 {G.number_of_edges():,}개")
+
+    print("\n[처음부터 계산]")
+    for node_count in args.nodes:
+        sub = top_subgraph(G, node_count)
+        spring = timed(lambda: nx.spring_layout(sub, seed=42))
+        numpy_ = timed(lambda: force_layout(sub))
+        print(f"  노드 {sub.number_of_nodes():4d}, 엣지 {sub.number_of_edges():6,}: "
+              f"spring_layout {spring:.3f}s, NumPy {numpy_:.3f}s ({spring / numpy_:.1f}x)")
+
+    # 슬라이더를 한 칸씩 움직이는 상황: 이전 배치에서 웜 스타트, 되돌아오면 캐시 적중
+    print("\n[슬라이더 이동 (캐시 + 웜 스타트)]")
+    start_count = args.nodes[-1] - 10
+    steps = list(range(start_count, start_count + 11)) + list(range(start_count + 9, start_count - 1, -1))
+    subgraphs = [top_subgraph(G, count) for count in steps]
+    cache = LayoutCache()
+    start = time.perf_counter()
+    for sub in subgraphs:
+        cache.layout(sub, method='numpy')
+    cached = time.perf_counter() - start
+    start = time.perf_counter()
+    for sub in subgraphs:
+        nx.spring_layout(sub, seed=42)
+    baseline = time.perf_counter() - start
+    print(f"  {len(steps)}회 이동: 매번 spring_layout {baseline:.3f}s, LayoutCache(NumPy) {cached:.3f}s "
+          f"({baseline / cached:.1f}x) {cache.stats()}")
+
+
+if __name__ == '__main__':
+    main()
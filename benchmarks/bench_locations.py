@@ -0,0 +1,82 @@
+"""Aho-Corasick 지명 추출과 기존 이중 반복문 비교
+
+사용법: python benchmarks/bench_locations.py --rows 30000
+(기사당 평균 3.5개 기관이므로 30,000건이면 약 10만 개 기관 언급)
+"""
+import argparse
+import os
+import re
+import sys
+import time
+from collections import defaultdict
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd
+
+from benchmarks.synthetic import ROOT, make_news_frame
+from news_analysis.locations import LocationMatcher, OrgResolutionTable, get_org_location_frequency
+
+
+def legacy_org_location_frequency(org_series, coords_dict):
+    """기존 구현 (기관마다 모든 시군구명에 대해 부분 문자열 검사)"""
+    location_counts = defaultdict(int)
+    excluded_districts = {'북구', '남구', '동구', '서구', '중구'}
+    filtered_locations = {
+        loc: loc.replace('시', '').replace('군', '').replace('구', '')
+        for loc in coords_dict.keys()
+        if not any(excluded in loc for excluded in excluded_districts)
+    }
+    for orgs in org_series.dropna():
+        if not isinstance(orgs, str):
+            continue
+        org_list = [org.strip() for org in orgs.split(',') if org.strip()]
+        for org in org_list:
+            org = re.sub(r'\([^)]*\)', '', org).strip()
+            for location, base_name in filtered_locations.items():
+                if base_name and base_name in org:
+                    location_counts[location] += 1
+                    break
+    return location_counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--rows', type=int, default=30000)
+    args = parser.parse_args()
+
+    coords = pd.read_csv(os.path.join(ROOT, 'sigungu_coordinates.csv'), encoding='utf-8-sig')
+    coords_dict = {row.sigungu: {'lat': row.lat, 'lon': row.lon} for row in coords.itertuples()}
+    org_series = make_news_frame(args.rows, body_words=0)['기관']
+    mentions = int(org_series.str.count(',').sum() + len(org_series))
+
+    start = time.perf_counter()
+    expected = legacy_org_location_frequency(org_series, coords_dict)
+    legacy_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    matcher = LocationMatcher(coords_dict.keys())
+    build_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    actual = get_org_location_frequency(org_series, coords_dict, matcher)
+    matcher_time = time.perf_counter() - start
+
+    # 변환표가 이미 채워진 상태 (같은 기관명을 다시 보는 재실행/다음 데이터셋)
+    table = OrgResolutionTable(matcher)
+    get_org_location_frequency(org_series, coords_dict, table=table)
+    start = time.perf_counter()
+    cached = get_org_location_frequency(org_series, coords_dict, table=table)
+    table_time = time.perf_counter() - start
+
+    assert dict(actual) == dict(expected) == dict(cached)
+    assert list(actual) == list(expected)
+    print(f"기관 언급 {mentions:,}개, 고유 기관명 {len(table):,}개, 시군구 {len(coords_dict)}개")
+    print(f"기존 반복문:      {legacy_time:.3f}s")
+    print(f"오토마톤 생성:    {build_time * 1000:.1f}ms")
+    print(f"Aho-Corasick:     {matcher_time:.3f}s ({legacy_time / matcher_time:.1f}x)")
+    print(f"변환표 재사용:    {table_time:.3f}s ({legacy_time / table_time:.1f}x)")
+
+
+if __name__ == '__main__':
+    main()
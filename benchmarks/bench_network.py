@@ -0,0 +1,64 @@
+"""희소 행렬 동시출현 계산과 기존 이중 반복문 비교
+
+사용법: python benchmarks/bench_network.py --rows 100000
+"""
+import argparse
+import os
+import sys
+import time
+from collections import Counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import networkx as nx
+
+from benchmarks.synthetic import make_news_frame
+from news_analysis.network import build_org_graph
+
+
+def legacy_org_graph(org_series):
+    """기존 구현 (기사마다 모든 기관 쌍을 순회)"""
+    co_occurrence = Counter()
+    for row in org_series.dropna():
+        orgs = list(set([o.strip() for o in str(row).split(",") if len(o.strip()) > 1]))
+        for i in range(len(orgs)):
+            for j in range(i + 1, len(orgs)):
+                edge = tuple(sorted([orgs[i], orgs[j]]))
+                co_occurrence[edge] += 1
+
+    filtered_edges = {pair: w for pair, w in co_occurrence.items() if w >= 2}
+
+    G = nx.Graph()
+    for (a, b), weight in filtered_edges.items():
+        G.add_edge(a, b, weight=weight)
+    return G
+
+
+def edge_set(G):
+    """비교용 (정렬된 기관 쌍, 가중치) 집합"""
+    return {(tuple(sorted((a, b))), w) for a, b, w in G.edges(data='weight')}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--rows', type=int, default=100000)
+    args = parser.parse_args()
+
+    org_series = make_news_frame(args.rows, body_words=0)['기관']
+
+    start = time.perf_counter()
+    expected = legacy_org_graph(org_series)
+    legacy_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    actual = build_org_graph(org_series)
+    sparse_time = time.perf_counter() - start
+
+    assert edge_set(actual) == edge_set(expected)
+    print(f"기사 {args.rows:,}건, 기관 {expected.number_of_nodes():,}개, 엣지 {expected.number_of_edges():,}개")
+    print(f"기존 반복문:   {legacy_time:.3f}s")
+    print(f"희소 행렬 AᵀA: {sparse_time:.3f}s ({legacy_time / sparse_time:.1f}x)")
+
+
+if __name__ == '__main__':
+    main()
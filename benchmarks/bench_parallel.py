@@ -0,0 +1,106 @@
+"""기사 구간별 분할 처리: 전체 한 번에 처리(기존) vs 작업 프로세스 1/2/4/8개
+
+관련기관 목록 분리, 키워드 목록 분리, 기관명 -> 지명 변환(빈 변환표에서 시작),
+동시출현 행렬 계산을 작업 프로세스 수별로 재고, 결과가 전체를 한 번에 처리한
+결과와 같은지 확인한다. 프로세스 풀을 띄우는 시간은 첫 측정 전에 한 번 빼 둔다.
+
+사용법: python benchmarks/bench_parallel.py --rows 300000 --workers 1 2 4 8
+"""
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from benchmarks.synthetic import make_news_frame
+from news_analysis.gazetteer import load_gazetteer
+from news_analysis.ingest import normalize_news_df
+from news_analysis.keywords import KeywordStore
+from news_analysis.locations import LocationMatcher, OrgResolutionTable, org_location_lists
+from news_analysis.network import co_occurrence_edges, incidence_matrix, org_lists
+from news_analysis.parallel import (
+    chunked_keyword_store, chunked_org_lists, chunked_org_location_lists, cpu_count, shutdown_executors,
+)
+
+
+def lists_state(lists):
+    return lists.vocab, lists.offsets.tolist(), lists.ids.tolist()
+
+
+def serial(news_df, names):
+    """기존 방식: 전체 기사를 한 번에 처리"""
+    orgs = org_lists(news_df['관련기관'])
+    return {
+        'org': orgs,
+        'keyword': KeywordStore.from_frame(news_df),
+        'location': org_location_lists(news_df['관련기관'], OrgResolutionTable(LocationMatcher(names))),
+        'edges': co_occurrence_edges(incidence_matrix(orgs)),
+    }
+
+
+def chunked(news_df, names, workers, chunk_rows):
+    orgs = chunked_org_lists(news_df['관련기관'], workers, chunk_rows)
+    table = OrgResolutionTable(LocationMatcher(names))
+    return {
+        'org': orgs,
+        'keyword': chunked_keyword_store(news_df['키워드'], workers, chunk_rows),
+        'location': chunked_org_location_lists(news_df['관련기관'], table, workers, chunk_rows),
+        'edges': co_occurrence_edges(incidence_matrix(orgs), workers=workers),
+    }
+
+
+def peak_memory(func):
+    """func 실행 중 최대 메모리 할당량 (MB)"""
+    tracemalloc.start()
+    func()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak / 1024 ** 2
+
+
+def same(a, b):
+    for name in ('org', 'keyword', 'location'):
+        if lists_state(a[name]) != lists_state(b[name]):
+            return False
+    return all(np.array_equal(x, y) for x, y in zip(a['edges'], b['edges']))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=300000)
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4, 8])
+    parser.add_argument('--chunk-rows', type=int, default=50000)
+    args = parser.parse_args()
+
+    news_df = normalize_news_df(make_news_frame(args.rows, body_words=0))
+    names = load_gazetteer().names
+    print(f"기사 {args.rows:,}건, 구간당 {args.chunk_rows:,}건, CPU {cpu_count()}개")
+
+    start = time.perf_counter()
+    expected = serial(news_df, names)
+    baseline = time.perf_counter() - start
+    print(f"  전체 한 번에 처리: {baseline:.2f}s")
+
+    for workers in args.workers:
+        if workers > 1:
+            # 프로세스 풀 시작과 작업 프로세스의 모듈 import는 재사용되므로 측정에서 제외
+            chunked(news_df.iloc[:workers * 10], names, workers, 10)
+        start = time.perf_counter()
+        result = chunked(news_df, names, workers, args.chunk_rows)
+        elapsed = time.perf_counter() - start
+        assert same(result, expected), f"작업 프로세스 {workers}개 결과가 다릅니다"
+        print(f"  작업 프로세스 {workers}개: {elapsed:.2f}s ({baseline / elapsed:.2f}x)")
+    shutdown_executors()
+
+    # 구간별 처리는 한 구간의 문자열만 동시에 펼치므로 작업 프로세스 1개여도 최대 메모리가 줄어듦
+    whole = peak_memory(lambda: KeywordStore.from_frame(news_df))
+    parts = peak_memory(lambda: chunked_keyword_store(news_df['키워드'], 1, args.chunk_rows))
+    print(f"  키워드 목록 최대 메모리: 한 번에 {whole:.0f}MB, 구간별 {parts:.0f}MB")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,74 @@
+"""컬럼 선택 리더와 pd.read_excel 전체 읽기 비교
+
+사용법: python benchmarks/bench_readers.py --rows 50000
+"""
+import argparse
+import io
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd
+
+from benchmarks.synthetic import make_news_frame, write_xlsx
+from news_analysis.ingest import COLUMN_MAPPING
+from news_analysis.readers import read_news_table
+
+
+def timed(func, repeat):
+    """repeat회 실행한 최소 시간과 마지막 결과 반환"""
+    best = float('inf')
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--rows', type=int, default=50000)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--workdir', default='bench_data')
+    args = parser.parse_args()
+
+    os.makedirs(args.workdir, exist_ok=True)
+    columns = list(COLUMN_MAPPING.keys())
+    df = make_news_frame(args.rows)
+
+    xlsx_path = os.path.join(args.workdir, f'news_{args.rows}.xlsx')
+    if not os.path.exists(xlsx_path):
+        write_xlsx(df, xlsx_path)
+    buf = io.BytesIO()
+    df.to_csv(buf, index=False, encoding='utf-8-sig')
+    csv_data = buf.getvalue()
+    buf = io.BytesIO()
+    df.to_parquet(buf, index=False)
+    parquet_data = buf.getvalue()
+    with open(xlsx_path, 'rb') as f:
+        xlsx_data = f.read()
+
+    cases = [
+        ('xlsx', lambda: pd.read_excel(io.BytesIO(xlsx_data), engine='openpyxl')[columns],
+         lambda: read_news_table(xlsx_data, columns)),
+        ('csv', lambda: pd.read_csv(io.BytesIO(csv_data), encoding='utf-8-sig')[columns],
+         lambda: read_news_table(csv_data, columns)),
+        ('parquet', lambda: pd.read_parquet(io.BytesIO(parquet_data))[columns],
+         lambda: read_news_table(parquet_data, columns)),
+    ]
+
+    print(f"{'형식':<8}{'전체 읽기(s)':>14}{'컬럼 선택(s)':>14}{'속도 향상':>10}")
+    for fmt, baseline, selective in cases:
+        base_time, expected = timed(baseline, args.repeat)
+        new_time, actual = timed(selective, args.repeat)
+        pd.testing.assert_frame_equal(
+            expected.reset_index(drop=True), actual.reset_index(drop=True), check_dtype=False
+        )
+        print(f"{fmt:<8}{base_time:>14.3f}{new_time:>14.3f}{base_time / new_time:>9.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+"""검색 역색인과 기존 행 단위 apply 검색 비교
+
+사용법: python benchmarks/bench_search.py --rows 50000
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from benchmarks.synthetic import make_news_frame
+from news_analysis.ingest import normalize_news_df
+from news_analysis.search import SearchCache, SearchIndex, apply_search
+
+QUERIES = ['탄소', '환경부', '시청', '탄소 중립', '기관:환경부', '수소 OR 풍력']
+
+# 검색어 입력 과정 (한 글자씩 확장)
+TYPING = ['강', '강릉', '강릉시', '강릉시청', '강릉시청 탄', '강릉시청 탄소', '강릉시청 탄소 중립']
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--rows', type=int, default=50000)
+    args = parser.parse_args()
+
+    news_df = normalize_news_df(make_news_frame(args.rows, body_words=0))
+    fields = ['기사제목', '관련기관', '키워드']
+
+    start = time.perf_counter()
+    index = SearchIndex(news_df)
+    print(f"색인 생성: {time.perf_counter() - start:.3f}s ({args.rows:,}건)")
+
+    print(f"{'검색어':<14}{'apply(s)':>10}{'색인(ms)':>10}{'결과 수':>10}")
+    for query in QUERIES:
+        start = time.perf_counter()
+        rows = index.search(query)
+        index_time = time.perf_counter() - start
+
+        # 단일 검색어는 기존 방식과 결과 비교 (검색 필드 범위 기준)
+        start = time.perf_counter()
+        if query in ('탄소', '환경부', '시청'):
+            expected = apply_search(news_df[fields], query)
+            assert np.array_equal(rows, np.flatnonzero(news_df.index.isin(expected.index)))
+        else:
+            apply_search(news_df[fields], query.split()[0].split(':')[-1])
+        apply_time = time.perf_counter() - start
+
+        print(f"{query:<14}{apply_time:>10.3f}{index_time * 1000:>10.2f}{len(rows):>10,}")
+
+    # 입력 중 재실행: 매번 색인 검색 vs 검색 결과 캐시
+    cache = SearchCache(index)
+    print(f"\n{'입력 중 검색어':<20}{'색인(ms)':>10}{'캐시(ms)':>10}{'결과 수':>10}")
+    for query in TYPING:
+        start = time.perf_counter()
+        expected = index.search(query)
+        index_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        rows = cache.search(query)
+        cache_time = time.perf_counter() - start
+        assert np.array_equal(rows, expected)
+
+        print(f"{query:<20}{index_time * 1000:>10.2f}{cache_time * 1000:>10.2f}{len(rows):>10,}")
+    print(cache.stats())
+
+
+if __name__ == '__main__':
+    main()
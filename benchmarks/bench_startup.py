@@ -0,0 +1,154 @@
+"""대시보드 첫 화면(파일 업로드 전) 시작 시간 측정
+
+새 파이썬 프로세스를 `python -X importtime`으로 띄워 streamlit AppTest로
+news_analyzer.py를 업로드 없이 한 번 실행하고 다음을 기록한다.
+
+- 첫 실행 시간: 스크립트 시작부터 업로드 화면 렌더링까지 (첫 화면 표시 시간)
+- 프로세스 전체 시간: 인터프리터 시작 포함
+- 스크립트 임포트: 스크립트가 직접 불러온 모듈의 누적 시간 (느린 순)
+- 첫 화면에서 불러온 분석용 라이브러리 목록
+
+--save-baseline으로 결과를 저장해 두고 --baseline으로 비교하면 첫 실행 시간이
+허용 비율(--tolerance)을 넘게 늘어났을 때 종료 코드 1을 반환한다. 기준값은 함께
+저장한 보정 작업(benchmarks/calibration.py) 시간의 비율로 이 머신 속도에 맞게
+환산하며, 보정 측정 없이 저장된 기준값은 비교하지 않는다.
+
+사용법:
+    python benchmarks/bench_startup.py --repeat 5 --save-baseline benchmarks/startup_baseline.json
+    python benchmarks/bench_startup.py --baseline benchmarks/startup_baseline.json --tolerance 0.2
+"""
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from benchmarks.calibration import calibrate, scaled_limit
+
+SCRIPT = os.path.join(ROOT, 'news_analyzer.py')
+
+# 첫 화면에 필요 없는 분석용 라이브러리
+HEAVY_PACKAGES = (
+    'plotly.express', 'networkx', 'scipy.sparse', 'folium', 'branca', 'wordcloud',
+    'matplotlib', 'streamlit_folium', 'PIL.Image',
+)
+
+_IMPORTTIME_RE = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \|(\s*)(\S+)$')
+_MARKER = '__startup_probe__'
+
+
+def probe(script):
+    """(하위 프로세스) 업로드 없이 스크립트를 한 번 실행하고 결과를 JSON으로 출력"""
+    from streamlit.testing.v1 import AppTest
+
+    app = AppTest.from_file(script, default_timeout=120)
+    # streamlit 자체가 이미 불러온 라이브러리는 제외
+    preloaded = set(sys.modules)
+    print(f'{_MARKER} start', file=sys.stderr, flush=True)
+    start = time.perf_counter()
+    app.run()
+    elapsed = time.perf_counter() - start
+    print(json.dumps({
+        'first_run': elapsed,
+        'exceptions': [str(e.value) for e in app.exception],
+        'heavy_loaded': [name for name in HEAVY_PACKAGES if name in sys.modules and name not in preloaded],
+    }))
+
+
+def parse_importtime(stderr):
+    """스크립트 실행 중의 임포트 기록 [(모듈, 누적 마이크로초, 깊이), ...]"""
+    lines = stderr.splitlines()
+    try:
+        lines = lines[lines.index(f'{_MARKER} start') + 1:]
+    except ValueError:
+        pass
+    records = []
+    for line in lines:
+        match = _IMPORTTIME_RE.match(line)
+        if match:
+            _, cumulative, indent, name = match.groups()
+            # 최상위 임포트는 공백 1칸, 한 단계 깊어질 때마다 2칸씩 늘어남
+            records.append((name, int(cumulative), (len(indent) - 1) // 2))
+    return records
+
+
+def measure(script):
+    """새 프로세스에서 한 번 측정"""
+    env = dict(os.environ, PYTHONPATH=ROOT + os.pathsep + os.environ.get('PYTHONPATH', ''))
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', os.path.abspath(__file__), '--probe', script],
+        capture_output=True, text=True, env=env, cwd=ROOT,
+    )
+    total = time.perf_counter() - start
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr[-2000:])
+    output = json.loads(result.stdout.strip().splitlines()[-1])
+    if output['exceptions']:
+        raise RuntimeError(output['exceptions'])
+    top_level = [(name, us) for name, us, depth in parse_importtime(result.stderr) if depth == 0]
+    return {
+        'first_run': output['first_run'],
+        'process': total,
+        'script_imports': sum(us for _, us in top_level) / 1e6,
+        'slowest_imports': {name: us / 1e6 for name, us in sorted(top_level, key=lambda item: -item[1])[:8]},
+        'heavy_loaded': output['heavy_loaded'],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--probe', help=argparse.SUPPRESS)
+    parser.add_argument('--script', default=SCRIPT)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--save-baseline')
+    parser.add_argument('--baseline')
+    parser.add_argument('--tolerance', type=float, default=0.2)
+    args = parser.parse_args()
+
+    if args.probe:
+        probe(args.probe)
+        return 0
+
+    runs = [measure(args.script) for _ in range(args.repeat)]
+    summary = {
+        'first_run': statistics.median(r['first_run'] for r in runs),
+        'process': statistics.median(r['process'] for r in runs),
+        'script_imports': statistics.median(r['script_imports'] for r in runs),
+        'slowest_imports': runs[-1]['slowest_imports'],
+        'heavy_loaded': runs[-1]['heavy_loaded'],
+        'calibration': calibrate(),
+    }
+    print(f"첫 실행(업로드 화면): {summary['first_run']:.3f}s")
+    print(f"프로세스 전체:        {summary['process']:.3f}s")
+    print(f"스크립트 임포트:      {summary['script_imports']:.3f}s")
+    for name, seconds in summary['slowest_imports'].items():
+        print(f"  {name}: {seconds:.3f}s")
+    print(f"첫 화면에서 불러온 분석용 라이브러리: {', '.join(summary['heavy_loaded']) or '없음'}")
+
+    if args.save_baseline:
+        with open(args.save_baseline, 'w', encoding='utf-8') as f:
+            json.dump(summary, f, ensure_ascii=False, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            baseline = json.load(f)
+        limit = scaled_limit(baseline['first_run'], baseline.get('calibration'), args.tolerance)
+        if limit is None:
+            print("기준값에 보정 측정이 없어 비교하지 않습니다 (--save-baseline으로 다시 저장).")
+            return 0
+        print(f"기준 {baseline['first_run']:.3f}s, 이 머신 기준 허용 {limit:.3f}s")
+        if summary['first_run'] > limit:
+            print("첫 실행 시간이 기준을 넘었습니다.")
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
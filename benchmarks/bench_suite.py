@@ -0,0 +1,228 @@
+"""주요 처리 경로 마이크로 벤치마크 (pytest-benchmark)
+
+합성 빅카인즈 데이터(benchmarks/synthetic.py, 기본 10k/100k건)로 다음을 잰다.
+
+- 업로드 파일 적재(process_data와 같은 load_news_bytes, parquet/xlsx)
+- 검색 색인 생성과 검색
+- 기관명 -> 지명 빈도수(get_org_location_frequency, 변환표 없이/있이)
+- 키워드 목록 생성과 상위 키워드 집계
+- 기관 동시출현 행렬
+- 네트워크 배치(NumPy 배치, networkx spring_layout)
+
+각 벤치마크의 중앙값이 저장된 기준값(suite_baseline.json)보다 허용 비율 이상
+느려지면 실패한다. 기준값은 저장할 때 함께 잰 보정 작업(benchmarks/calibration.py)
+시간과 이번 실행의 보정 작업 시간의 비율로 환산하여 다른 머신에서도 비교한다.
+기준값이 없는 항목, 보정 측정 없이 저장된 기준값(경고만 표시)과
+--benchmark-disable 실행은 비교하지 않는다.
+1M건은 NEWS_ANALYZER_BENCH_SIZES=10k,100k,1m 으로 켠다.
+
+사용법 (pip install pytest pytest-benchmark):
+    python -m pytest benchmarks/bench_suite.py --benchmark-json=/tmp/bench.json
+    python benchmarks/bench_suite.py --save-baseline /tmp/bench.json
+"""
+import argparse
+import json
+import os
+import sys
+import warnings
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+from benchmarks.calibration import calibrate, scaled_limit
+from benchmarks.synthetic import CORPUS_SIZES, corpus_file
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'suite_baseline.json')
+DEFAULT_TOLERANCE = 0.5
+
+SIZES = os.environ.get('NEWS_ANALYZER_BENCH_SIZES', '10k,100k').split(',')
+QUERY = '탄소 중립 OR 기관:환경부'
+
+if __name__ != '__main__':
+    # benchmark 픽스처는 pytest-benchmark 플러그인이 제공
+    pytest.importorskip('pytest_benchmark')
+
+
+def load_baseline(path=BASELINE_PATH):
+    try:
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+    except OSError:
+        return {'tolerance': DEFAULT_TOLERANCE, 'benchmarks': {}}
+
+
+def check_regression(benchmark):
+    """중앙값이 (이 머신 속도로 환산한 기준값) × (1 + 허용 비율)을 넘으면 실패"""
+    if benchmark.disabled or benchmark.stats is None:
+        return
+    baseline = load_baseline()
+    expected = baseline['benchmarks'].get(benchmark.name)
+    if expected is None:
+        return
+    tolerance = expected.get('tolerance', baseline.get('tolerance', DEFAULT_TOLERANCE))
+    limit = scaled_limit(expected['median'], baseline.get('calibration'), tolerance)
+    if limit is None:
+        warnings.warn(f"{benchmark.name}: 기준값에 보정 측정이 없어 비교하지 않음 "
+                      f"(--save-baseline으로 다시 저장)")
+        return
+    median = benchmark.stats.stats.median
+    assert median <= limit, (
+        f"{benchmark.name}: 중앙값 {median * 1000:.1f}ms, 기준 {expected['median'] * 1000:.1f}ms "
+        f"(이 머신 기준 허용 {limit * 1000:.1f}ms)"
+    )
+
+
+@pytest.fixture(scope='module', params=SIZES)
+def corpus(request):
+    """(크기 이름, 원본 parquet 바이트, 정규화된 데이터프레임)"""
+    from news_analysis.ingest import load_news_bytes
+
+    with open(corpus_file(CORPUS_SIZES[request.param], 'parquet'), 'rb') as f:
+        data = f.read()
+    return request.param, data, load_news_bytes(data, name='corpus.parquet')
+
+
+@pytest.fixture(scope='module')
+def gazetteer():
+    from news_analysis.gazetteer import load_gazetteer
+    return load_gazetteer()
+
+
+@pytest.fixture(scope='module')
+def org_graph_100(corpus):
+    """연결 수 상위 100개 기관의 동시출현 부분 그래프"""
+    from news_analysis.network import build_org_graph
+
+    G = build_org_graph(corpus[2]['관련기관'])
+    top_nodes = sorted(G.degree, key=lambda x: x[1], reverse=True)[:100]
+    return G.subgraph([n for n, _ in top_nodes]).copy()
+
+
+def _pedantic(benchmark, func, setup=None, rounds=5):
+    result = benchmark.pedantic(func, setup=setup, rounds=rounds, iterations=1, warmup_rounds=1 if setup is None else 0)
+    check_regression(benchmark)
+    return result
+
+
+def test_load_parquet(benchmark, corpus):
+    from news_analysis.ingest import load_news_bytes
+
+    _, data, news_df = corpus
+    result = _pedantic(benchmark, lambda: load_news_bytes(data, name='corpus.parquet'), rounds=3)
+    assert len(result) == len(news_df)
+
+
+def test_load_xlsx(benchmark, corpus):
+    from news_analysis.ingest import load_news_bytes
+
+    size, _, news_df = corpus
+    if size != SIZES[0]:
+        pytest.skip("xlsx 적재는 가장 작은 크기에서만 측정")
+    with open(corpus_file(CORPUS_SIZES[size], 'xlsx'), 'rb') as f:
+        data = f.read()
+    result = _pedantic(benchmark, lambda: load_news_bytes(data, name='corpus.xlsx'), rounds=3)
+    assert len(result) == len(news_df)
+
+
+def test_search_index_build(benchmark, corpus):
+    from news_analysis.search import SearchIndex
+
+    _pedantic(benchmark, lambda: SearchIndex(corpus[2]), rounds=3)
+
+
+def test_search_query(benchmark, corpus):
+    from news_analysis.search import SearchIndex
+
+    index = SearchIndex(corpus[2])
+    rows = _pedantic(benchmark, lambda: index.search(QUERY), rounds=20)
+    assert len(rows) > 0
+
+
+def test_location_frequency_cold(benchmark, corpus, gazetteer):
+    from news_analysis.locations import LocationMatcher, OrgResolutionTable, get_org_location_frequency
+
+    matcher = LocationMatcher(gazetteer.names)
+    series = corpus[2]['관련기관']
+    # 라운드마다 빈 변환표에서 시작 (처음 보는 기관명을 모두 변환)
+    _pedantic(
+        benchmark,
+        lambda table: get_org_location_frequency(series, gazetteer, table=table),
+        setup=lambda: ((OrgResolutionTable(matcher),), {}),
+        rounds=3,
+    )
+
+
+def test_location_frequency_warm(benchmark, corpus, gazetteer):
+    from news_analysis.locations import LocationMatcher, OrgResolutionTable, get_org_location_frequency
+
+    table = OrgResolutionTable(LocationMatcher(gazetteer.names))
+    series = corpus[2]['관련기관']
+    frequency = _pedantic(benchmark, lambda: get_org_location_frequency(series, gazetteer, table=table))
+    assert sum(frequency.values()) > 0
+
+
+def test_keyword_store_build(benchmark, corpus):
+    from news_analysis.keywords import KeywordStore
+
+    _pedantic(benchmark, lambda: KeywordStore.from_frame(corpus[2]), rounds=3)
+
+
+def test_keyword_top_search_rows(benchmark, corpus):
+    from news_analysis.keywords import KeywordStore
+    from news_analysis.search import SearchIndex
+
+    store = KeywordStore.from_frame(corpus[2])
+    rows = SearchIndex(corpus[2]).search(QUERY)
+    top = _pedantic(benchmark, lambda: store.top(20, rows), rounds=10)
+    assert len(top) == 20
+
+
+def test_co_occurrence(benchmark, corpus):
+    from news_analysis.network import co_occurrence_edges, incidence_matrix, org_lists
+
+    incidence = incidence_matrix(org_lists(corpus[2]['관련기관']))
+    rows, _, _ = _pedantic(benchmark, lambda: co_occurrence_edges(incidence, min_weight=2))
+    assert len(rows) > 0
+
+
+def test_force_layout(benchmark, org_graph_100):
+    from news_analysis.layout import force_layout
+
+    pos = _pedantic(benchmark, lambda: force_layout(org_graph_100))
+    assert len(pos) == len(org_graph_100)
+
+
+def test_spring_layout(benchmark, org_graph_100):
+    from news_analysis.layout import spring_layout
+
+    pos = _pedantic(benchmark, lambda: spring_layout(org_graph_100), rounds=3)
+    assert len(pos) == len(org_graph_100)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="pytest-benchmark 결과(JSON)를 기준값으로 저장")
+    parser.add_argument('--save-baseline', required=True, help="--benchmark-json으로 저장한 결과 파일")
+    parser.add_argument('--output', default=BASELINE_PATH)
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE)
+    args = parser.parse_args()
+
+    with open(args.save_baseline, encoding='utf-8') as f:
+        results = json.load(f)
+    baseline = load_baseline(args.output)
+    baseline['tolerance'] = args.tolerance
+    for bench in results['benchmarks']:
+        entry = baseline['benchmarks'].setdefault(bench['name'], {})
+        entry['median'] = bench['stats']['median']
+    baseline['machine'] = {
+        key: results['machine_info'].get(key) for key in ('system', 'processor', 'python_version')
+    }
+    # 결과를 잰 머신에서 저장해야 보정 비율이 맞음
+    baseline['calibration'] = calibrate()
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(baseline, f, ensure_ascii=False, indent=2, sort_keys=True)
+    print(f"기준값 {len(results['benchmarks'])}개 저장: {args.output}")
+
+
+if __name__ == '__main__':
+    main()
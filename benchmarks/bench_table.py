@@ -0,0 +1,70 @@
+"""데이터 탐색 표: 전체 변환 후 자르기(기존) vs 현재 페이지만 변환
+
+기존 방식은 재실행마다 걸러낸 데이터프레임 전체를 복사하고 날짜를 파싱/문자열
+변환하고 컬럼 이름을 바꾼 뒤 현재 페이지를 잘랐다. 새 방식은 적재 시 파싱한
+게시일을 쓰고, 기사 위치 배열에서 현재 페이지 행만 골라 변환한다.
+
+사용법: python benchmarks/bench_table.py --rows 500 500000 --per-page 100
+"""
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.bench_layout import timed
+from benchmarks.synthetic import make_news_frame
+from news_analysis.ingest import normalize_news_df
+from news_analysis.table import DISPLAY_COLUMNS, page_bounds, page_frame
+
+
+def legacy_page(display_df, start, stop):
+    """기존 구현 (전체 복사 + 날짜 변환 + 컬럼명 변경 후 페이지 슬라이스)"""
+    display_df = display_df.copy()
+    display_df['표시용_작성일자'] = pd.to_datetime(
+        display_df['작성/게시일자'].astype(str).str.replace('[^0-9]', '', regex=True),
+        format='%Y%m%d',
+        errors='coerce'
+    ).dt.strftime('%Y.%m.%d')
+    display_columns = ["표시용_작성일자", "기사제목", "관련기관", "키워드", "기사링크"]
+    display_df_renamed = display_df[display_columns].rename(columns={
+        '표시용_작성일자': '작성/게시일자'
+    })
+    return display_df_renamed.iloc[start:stop]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, nargs='+', default=[500, 500000])
+    parser.add_argument('--per-page', type=int, default=100)
+    args = parser.parse_args()
+
+    for n_rows in args.rows:
+        news_df = normalize_news_df(make_news_frame(n_rows, body_words=0))
+        rng = np.random.default_rng(0)
+        views = [
+            ('전체', None),
+            ('검색 결과 20%', np.sort(rng.choice(n_rows, max(1, n_rows // 5), replace=False))),
+        ]
+        print(f"기사 {n_rows:,}건, 페이지당 {args.per_page}건")
+        for name, rows in views:
+            total = n_rows if rows is None else len(rows)
+            # 마지막 페이지 (가장 뒤쪽 구간)
+            _, page, start, stop = page_bounds(total, total, args.per_page)
+            display_df = news_df if rows is None else news_df.iloc[rows]
+
+            expected = legacy_page(display_df, start, stop)
+            actual = page_frame(news_df, rows, start, stop)
+            assert list(actual.columns) == DISPLAY_COLUMNS
+            pd.testing.assert_frame_equal(actual, expected)
+
+            legacy = timed(lambda: legacy_page(news_df if rows is None else news_df.iloc[rows], start, stop))
+            fast = timed(lambda: page_frame(news_df, rows, start, stop))
+            print(f"  {name} (페이지 {page}): 기존 {legacy:.4f}s, 페이지만 변환 {fast:.4f}s ({legacy / fast:.0f}x)")
+
+
+if __name__ == '__main__':
+    main()
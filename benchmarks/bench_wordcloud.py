@@ -0,0 +1,81 @@
+"""워드클라우드 표시 비용 비교 (matplotlib 경유 / PNG 직접 인코딩 / 캐시 적중)
+
+기존 방식은 WordCloud 배치 후 plt.imshow -> st.pyplot(PNG 저장)을 거친다.
+
+사용법: python benchmarks/bench_wordcloud.py --top 20 50 100
+"""
+import argparse
+import io
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import matplotlib
+
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+from wordcloud import WordCloud
+
+from benchmarks.synthetic import make_news_frame
+from news_analysis.keywords import KeywordStore
+from news_analysis.wordcloud_images import DEFAULT_FONT_PATH, WordCloudCache, render_wordcloud_png
+
+
+def legacy_wordcloud_png(top_keywords, top_n):
+    """기존 구현 (st.pyplot과 같이 matplotlib figure를 PNG로 저장)"""
+    wordcloud = WordCloud(
+        width=500,
+        height=200,
+        background_color='white',
+        font_path=DEFAULT_FONT_PATH,
+        max_words=top_n,
+        max_font_size=100,
+        random_state=42
+    )
+    wordcloud.generate_from_frequencies(top_keywords)
+    plt.figure(figsize=(10, 6))
+    plt.imshow(wordcloud, interpolation='bilinear')
+    plt.axis('off')
+    plt.tight_layout(pad=0)
+    buffer = io.BytesIO()
+    plt.gcf().savefig(buffer, format='png')
+    plt.close()
+    return buffer.getvalue()
+
+
+def timed(func, repeat=3):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=5000)
+    parser.add_argument('--top', type=int, nargs='+', default=[20, 50, 100])
+    args = parser.parse_args()
+
+    keywords = make_news_frame(args.rows, body_words=0)['특성추출(가중치순 상위 50개)']
+    # 합성 데이터의 어휘가 작으므로 빈도수가 다른 단어를 추가해 표시 단어 수를 채움
+    frequencies = KeywordStore(keywords).top(100)
+    frequencies.update({f'키워드{i}': 100 - i for i in range(100)})
+
+    cache = WordCloudCache()
+    for top_n in args.top:
+        top_keywords = dict(sorted(frequencies.items(), key=lambda item: -item[1])[:top_n])
+        legacy = timed(lambda: legacy_wordcloud_png(top_keywords, top_n))
+        direct = timed(lambda: render_wordcloud_png(top_keywords, top_n))
+        cache.render(top_keywords, top_n)
+        cached = timed(lambda: cache.render(top_keywords, top_n), repeat=10)
+        print(f"  상위 {top_n:3d}개: matplotlib 경유 {legacy:.3f}s, PNG 직접 {direct:.3f}s, "
+              f"캐시 적중 {cached * 1000:.3f}ms")
+    print(f"  캐시: {cache.stats()}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,38 @@
+"""머신 속도 보정용 기준 작업
+
+저장된 기준값(중앙값)은 측정한 머신의 속도에 따라 달라지므로, 기준값을 저장할 때와
+비교할 때 같은 기준 작업(NumPy 정렬 + 문자열 분리, 분석 코드의 주된 연산과 비슷한
+구성)을 함께 재서 두 실행 시간의 비율로 기준값을 환산한다.
+"""
+import functools
+import statistics
+import time
+
+import numpy as np
+
+
+def _work(values, texts):
+    np.sort(values)
+    for text in texts:
+        text.split(',')
+
+
+@functools.lru_cache(maxsize=None)
+def calibrate(rounds=7):
+    """기준 작업 실행 시간의 중앙값 (초, 프로세스당 한 번 측정)"""
+    values = np.random.default_rng(0).random(1_000_000)
+    texts = ['환경부,수원시청,탄소중립,수소경제'] * 200_000
+    _work(values, texts)  # 워밍업
+    times = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        _work(values, texts)
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+def scaled_limit(baseline_seconds, baseline_calibration, tolerance):
+    """기준값을 이 머신 속도로 환산한 허용 한도 (기준값에 보정 측정이 없으면 None)"""
+    if not baseline_calibration:
+        return None
+    return baseline_seconds * (calibrate() / baseline_calibration) * (1 + tolerance)
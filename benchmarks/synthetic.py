@@ -0,0 +1,205 @@
+"""벤치마크용 빅카인즈 형식 합성 데이터 생성
+
+make_news_frame은 원본 내보내기 컬럼 그대로의 데이터프레임을 만들고, corpus_file은
+10k/100k/1M건 같은 크기별 파일(parquet/xlsx)을 한 번 만들어 캐시 디렉토리에 둔다.
+
+사용법: python benchmarks/synthetic.py --rows 10000 100000 1000000 --format parquet
+"""
+import argparse
+import importlib.util
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 벤치마크 데이터 크기 이름 -> 기사 수
+CORPUS_SIZES = {'10k': 10_000, '100k': 100_000, '1m': 1_000_000}
+
+_WORDS = [
+    '탄소', '중립', '환경', '기후', '에너지', '수소', '전기차', '미세먼지', '재활용', '태양광',
+    '풍력', '정책', '예산', '지역', '개발', '교육', '학교', '산업', '일자리', '주택',
+    '교통', '관광', '농업', '어업', '복지', '의료', '문화', '축제', '안전', '재난',
+]
+_AGENCIES = ['환경부', '산업통상자원부', '국토교통부', '교육부', '행정안전부', '기상청', '연합뉴스', '뉴시스']
+_ORG_SUFFIXES = ['청', '의회', '교육지원청', '보건소']
+
+
+def load_sigungu_names():
+    """번들된 시군구 목록에서 지명 로드"""
+    df = pd.read_csv(os.path.join(ROOT, 'sigungu_coordinates.csv'), encoding='utf-8-sig')
+    return df['sigungu'].dropna().str.strip().tolist()
+
+
+def keyword_vocabulary():
+    """키워드/제목 어휘와 등장 확률 (기본 단어 + 두 단어 합성어, 지프 분포로 앞 단어일수록 자주 등장)"""
+    vocab = list(_WORDS) + [a + b for a in _WORDS for b in _WORDS if a != b]
+    weights = 1.0 / np.arange(1, len(vocab) + 1)
+    return np.array(vocab, dtype=object), weights / weights.sum()
+
+
+def join_rows(parts, counts, sep):
+    """항목 배열을 행별 항목 수(counts)만큼 끊어 sep으로 이은 문자열 목록"""
+    parts = parts.tolist()
+    ends = np.cumsum(counts).tolist()
+    starts = [0] + ends[:-1]
+    return [sep.join(parts[start:end]) for start, end in zip(starts, ends)]
+
+
+def _sample_rows(rng, vocab, weights, n_rows, per_row, sep, block_rows=100_000):
+    """행마다 per_row개(정수 또는 행별 배열)의 단어를 뽑아 이은 문자열 목록 (메모리를 위해 구간별 생성)"""
+    texts = []
+    for start in range(0, n_rows, block_rows):
+        n = min(block_rows, n_rows - start)
+        counts = np.full(n, per_row) if np.isscalar(per_row) else per_row[start:start + n]
+        ids = rng.choice(len(vocab), int(counts.sum()), p=weights)
+        texts.extend(join_rows(vocab[ids], counts, sep))
+    return texts
+
+
+def _sample_unique_rows(rng, vocab, weights, n_rows, per_row, sep, block_rows=10_000):
+    """행마다 서로 다른 단어 per_row개를 확률 순서대로 뽑아 이은 문자열 목록 (가중치순 키워드처럼)"""
+    log_weights = np.log(weights)
+    texts = []
+    for start in range(0, n_rows, block_rows):
+        n = min(block_rows, n_rows - start)
+        # 검벨 최댓값 방법: log(가중치) + 검벨 잡음이 큰 순서가 비복원 가중 추출 순서
+        keys = log_weights - np.log(-np.log(rng.random((n, len(vocab)))))
+        top = np.argpartition(-keys, per_row - 1, axis=1)[:, :per_row]
+        top = np.take_along_axis(top, np.argsort(-np.take_along_axis(keys, top, axis=1), axis=1), axis=1)
+        texts.extend(join_rows(vocab[top.ravel()], np.full(n, per_row), sep))
+    return texts
+
+
+def make_news_frame(n_rows, seed=0, body_words=300):
+    """빅카인즈 내보내기와 같은 컬럼 구성의 데이터프레임 생성 (본문 등 넓은 컬럼 포함)
+
+    - 제목: 4~8단어 한글 제목
+    - 기관: 기사당 1~6개, 60%는 실제 시군구명 + 청/의회/교육지원청/보건소, 나머지는 중앙 기관
+    - 특성추출: 서로 다른 키워드 50개 (쉼표 구분, 자주 나오는 키워드가 앞쪽)
+    - 일자: yyyymmdd 정수 (2015~2024년)
+    """
+    rng = np.random.default_rng(seed)
+    sigungu = np.array(load_sigungu_names(), dtype=object)
+    agencies = np.array(_AGENCIES, dtype=object)
+    suffixes = np.array(_ORG_SUFFIXES, dtype=object)
+    vocab, weights = keyword_vocabulary()
+
+    org_counts = rng.integers(1, 7, n_rows)
+    n_mentions = int(org_counts.sum())
+    local = rng.random(n_mentions) < 0.6
+    mentions = np.where(
+        local,
+        sigungu[rng.integers(len(sigungu), size=n_mentions)] + suffixes[rng.integers(len(suffixes), size=n_mentions)],
+        agencies[rng.integers(len(agencies), size=n_mentions)],
+    )
+
+    years = rng.integers(2015, 2025, n_rows)
+    months = rng.integers(1, 13, n_rows)
+    days = rng.integers(1, 29, n_rows)
+    words = np.array(_WORDS, dtype=object)
+
+    return pd.DataFrame({
+        '뉴스 식별자': np.arange(n_rows),
+        '일자': years * 10000 + months * 100 + days,
+        '언론사': rng.choice(['연합뉴스', '뉴시스', '한겨레', '경향신문'], n_rows),
+        '기고자': '기자',
+        '제목': _sample_rows(rng, vocab, weights, n_rows, rng.integers(4, 9, n_rows), ' '),
+        '통합 분류1': '사회>환경',
+        '기관': join_rows(mentions, org_counts, ','),
+        '특성추출(가중치순 상위 50개)': _sample_unique_rows(rng, vocab, weights, n_rows, 50, ','),
+        '본문': _sample_rows(rng, words, np.full(len(words), 1 / len(words)), n_rows, body_words, ' ')
+        if body_words else '',
+        'URL': [f'https://news.example.com/article/{i}' for i in range(n_rows)],
+    })
+
+
+def write_xlsx(df, path):
+    """xlsx 저장 (가능하면 실제 내보내기처럼 공유 문자열을 쓰는 xlsxwriter 사용)"""
+    if importlib.util.find_spec('xlsxwriter') is None:
+        df.to_excel(path, index=False, engine='openpyxl')
+    else:
+        # URL은 하이퍼링크가 아닌 문자열로 저장 (시트당 하이퍼링크 수 제한)
+        with pd.ExcelWriter(path, engine='xlsxwriter', engine_kwargs={'options': {'strings_to_urls': False}}) as writer:
+            df.to_excel(writer, index=False)
+    return path
+
+
+def make_wire_frame(n_rows, dup_rate=0.3, seed=0, vocab_size=20000):
+    """통신사 전재 기사처럼 제목/키워드가 조금씩 다른 유사 중복 기사가 섞인 데이터프레임
+
+    원본 기사마다 제목 8단어와 키워드 30개를 큰 어휘에서 뽑고, 전체의 dup_rate만큼은
+    앞서 만든 기사를 복사하여 제목 한 단어와 키워드 두 개를 바꾼다.
+    """
+    rng = np.random.default_rng(seed)
+    vocab = np.array([f'w{i}' for i in range(vocab_size)], dtype=object)
+    titles, keywords, sources = [], [], []
+    for i in range(n_rows):
+        if i and rng.random() < dup_rate:
+            source = sources[rng.integers(len(sources))] if sources else 0
+            title = list(titles[source])
+            keyword = list(keywords[source])
+            title[rng.integers(len(title))] = vocab[rng.integers(vocab_size)]
+            for j in rng.choice(len(keyword), 2, replace=False):
+                keyword[j] = vocab[rng.integers(vocab_size)]
+        else:
+            source = i
+            title = list(rng.choice(vocab, 8, replace=False))
+            keyword = list(rng.choice(vocab, 30, replace=False))
+        titles.append(title)
+        keywords.append(keyword)
+        sources.append(source)
+
+    years = rng.integers(2015, 2025, n_rows)
+    return pd.DataFrame({
+        '일자': years * 10000 + rng.integers(1, 13, n_rows) * 100 + rng.integers(1, 29, n_rows),
+        '제목': [' '.join(title) for title in titles],
+        '기관': rng.choice(_AGENCIES, n_rows),
+        '특성추출(가중치순 상위 50개)': [','.join(keyword) for keyword in keywords],
+        'URL': [f'https://news.example.com/wire/{i}' for i in range(n_rows)],
+        '원본': sources,
+    })
+
+
+def corpus_file(n_rows, fmt='parquet', seed=0, cache_dir=None):
+    """기사 n_rows건의 합성 내보내기 파일 경로 (없으면 생성, 본문은 비움)"""
+    if cache_dir is None:
+        from news_analysis.snapshot import default_cache_dir
+        cache_dir = default_cache_dir('synthetic')
+    os.makedirs(cache_dir, exist_ok=True)
+    path = os.path.join(cache_dir, f'bigkinds-{n_rows}-{seed}.{fmt}')
+    if not os.path.exists(path):
+        df = make_news_frame(n_rows, seed=seed, body_words=0)
+        tmp_path = f'{path}.{os.getpid()}.tmp.{fmt}'
+        if fmt == 'xlsx':
+            write_xlsx(df, tmp_path)
+        elif fmt == 'csv':
+            df.to_csv(tmp_path, index=False, encoding='utf-8-sig')
+        else:
+            df.to_parquet(tmp_path, index=False)
+        os.replace(tmp_path, path)
+    return path
+
+
+def main():
+    sys.path.insert(0, ROOT)
+    parser = argparse.ArgumentParser(description="빅카인즈 형식 합성 데이터 파일 생성")
+    parser.add_argument('--rows', type=int, nargs='+', default=list(CORPUS_SIZES.values()))
+    parser.add_argument('--format', nargs='+', choices=['parquet', 'xlsx', 'csv'], default=['parquet'])
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--out', default=None, help="저장 디렉토리 (기본: 캐시 디렉토리의 synthetic)")
+    args = parser.parse_args()
+
+    for n_rows in args.rows:
+        for fmt in args.format:
+            start = time.perf_counter()
+            path = corpus_file(n_rows, fmt, seed=args.seed, cache_dir=args.out)
+            size = os.path.getsize(path) / 1024 ** 2
+            print(f"기사 {n_rows:,}건 {fmt}: {path} ({size:.1f}MB, {time.perf_counter() - start:.1f}s)")
+
+
+if __name__ == '__main__':
+    main()
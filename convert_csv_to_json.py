@@ -1,6 +1,8 @@
 import pandas as pd
 import json
 
+from news_analysis.gazetteer import Gazetteer
+
 # CSV 파일 읽기
 df = pd.read_csv('sigungu_coordinates.csv', encoding='utf-8-sig')
 
@@ -17,4 +19,7 @@ for _, row in df.iterrows():
 with open('sigungu_coordinates.json', 'w', encoding='utf-8') as f:
     json.dump(coords_dict, f, ensure_ascii=False, indent=2)
 
+# 대시보드가 오프라인으로 바로 읽는 NumPy 배열 파일로 저장 (시군구명, 위도, 경도)
+Gazetteer.from_frame(df).save_npz('sigungu_coordinates.npz')
+
 print("변환이 완료되었습니다.")
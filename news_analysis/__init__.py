@@ -0,0 +1,55 @@
+"""뉴스 데이터 분석 대시보드에서 사용하는 데이터 처리 모듈 모음 (Streamlit 비의존)
+
+대시보드 없이 스크립트나 노트북에서 바로 쓸 수 있도록 주요 함수와 클래스를
+패키지 최상위에서 가져올 수 있다. 대시보드 시작 시간을 늘리지 않도록 각 모듈은
+해당 이름을 처음 사용할 때 불러온다.
+
+    from news_analysis import load_news_file, compute_aggregates
+    aggregates = compute_aggregates(load_news_file('NewsResult.xlsx'))
+"""
+import importlib
+
+# 공개 이름 -> 모듈
+_EXPORTS = {
+    'load_news_file': 'ingest',
+    'load_news_bytes': 'ingest',
+    'normalize_news_df': 'ingest',
+    'Dataset': 'ingest',
+    'KeywordStore': 'keywords',
+    'LocationMatcher': 'locations',
+    'OrgResolutionTable': 'locations',
+    'get_org_location_frequency': 'locations',
+    'org_location_lists': 'locations',
+    'build_incidence': 'network',
+    'build_org_graph': 'network',
+    'co_occurrence_edges': 'network',
+    'org_lists': 'network',
+    'create_heatmap': 'heatmap',
+    'render_map_html': 'heatmap',
+    'Gazetteer': 'gazetteer',
+    'load_gazetteer': 'gazetteer',
+    'AnalysisCube': 'cube',
+    'SearchIndex': 'search',
+    'DateIndex': 'dates',
+    'Corpus': 'corpus',
+    'NearDuplicates': 'dedup',
+    'compute_aggregates': 'aggregates',
+    'load_aggregates': 'aggregates',
+    'save_aggregates': 'aggregates',
+    'run_batch': 'batch',
+    'SectionProfiler': 'diagnostics',
+}
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f'{__name__}.{_EXPORTS[name]}'), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
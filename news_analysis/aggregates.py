@@ -0,0 +1,151 @@
+"""대시보드 분석 결과(집계표)의 계산과 저장
+
+Streamlit 없이 정규화된 뉴스 데이터프레임에서 대시보드의 네 가지 분석 결과를
+집계표(데이터프레임)로 계산하고 JSON 또는 Parquet으로 저장한다.
+
+    year_counts   연도별 기사 수      (연도, 기사 수)
+    keywords      키워드 상위 N개     (키워드, 빈도수)
+    locations     지명 빈도수         (지명, 빈도수)
+    edges         기관 동시출현 엣지  (기관1, 기관2, 동시출현 수)
+
+JSON은 메타 정보와 모든 집계표를 파일 하나에 담으며 대시보드에서 바로 열 수 있다.
+Parquet은 집계표마다 파일 하나와 메타 정보(meta.json)를 디렉토리에 저장한다.
+"""
+import json
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+from news_analysis.cube import AnalysisCube
+
+# 저장 형식이 바뀌면 올림
+AGGREGATES_VERSION = 1
+
+# 집계표 이름 -> 컬럼
+AGGREGATE_TABLES = {
+    'year_counts': ['연도', '기사 수'],
+    'keywords': ['키워드', '빈도수'],
+    'locations': ['지명', '빈도수'],
+    'edges': ['기관1', '기관2', '동시출현 수'],
+}
+
+
+def _frequency_table(name, frequencies):
+    return pd.DataFrame(list(frequencies.items()), columns=AGGREGATE_TABLES[name])
+
+
+def compute_aggregates(news_df, top_n=50, min_weight=2, gazetteer=None, table=None, source=None, workers=1):
+    """정규화된 데이터프레임의 분석 결과 {'meta': {...}, 집계표 이름: 데이터프레임}
+
+    지명 빈도수에는 gazetteer(없으면 저장소의 시군구 좌표) 또는 기관명 -> 지명
+    변환표(table)를 사용한다. 엣지는 동시출현 min_weight회 이상인 기관 쌍이다.
+    workers가 2 이상이면 기사 구간별로 나누어 프로세스 풀에서 처리한다(결과 동일).
+    """
+    from news_analysis.locations import LocationMatcher, OrgResolutionTable
+    from news_analysis.network import co_occurrence_edges, incidence_matrix
+    from news_analysis.parallel import chunked_keyword_store, chunked_org_lists, chunked_org_location_lists
+
+    cube = AnalysisCube(news_df)
+    year_counts = cube.year_counts()
+    aggregates = {
+        'year_counts': pd.DataFrame({'연도': year_counts.index.astype(str), '기사 수': year_counts.to_numpy()}),
+        'keywords': _frequency_table('keywords', {}),
+        'locations': _frequency_table('locations', {}),
+        'edges': pd.DataFrame(columns=AGGREGATE_TABLES['edges']),
+    }
+
+    if '키워드' in news_df.columns:
+        aggregates['keywords'] = _frequency_table('keywords', chunked_keyword_store(news_df['키워드'], workers).top(top_n))
+
+    if '관련기관' in news_df.columns:
+        if table is None:
+            if gazetteer is None:
+                from news_analysis.gazetteer import load_gazetteer
+                gazetteer = load_gazetteer()
+            table = OrgResolutionTable(LocationMatcher(list(gazetteer.names)))
+        aggregates['locations'] = _frequency_table(
+            'locations', chunked_org_location_lists(news_df['관련기관'], table, workers).frequency()
+        )
+
+        lists = chunked_org_lists(news_df['관련기관'], workers)
+        rows, cols, weights = co_occurrence_edges(incidence_matrix(lists), min_weight, workers)
+        # 동시출현 수 내림차순, 같으면 (기관1, 기관2) 번호 순
+        order = np.lexsort((cols, rows, -weights))
+        names = np.array(lists.vocab, dtype=object)
+        aggregates['edges'] = pd.DataFrame({
+            '기관1': names[rows[order]] if len(order) else [],
+            '기관2': names[cols[order]] if len(order) else [],
+            '동시출현 수': weights[order].astype(np.int64),
+        })
+
+    aggregates['meta'] = {
+        'version': AGGREGATES_VERSION,
+        'source': source,
+        'rows': len(news_df),
+        'top_n': top_n,
+        'min_weight': min_weight,
+        'created': time.strftime('%Y-%m-%d %H:%M:%S'),
+    }
+    return aggregates
+
+
+def aggregates_to_json(aggregates):
+    """집계 결과를 JSON 문자열로 변환 (집계표는 columns/data 형식)"""
+    tables = {
+        name: {
+            'columns': list(aggregates[name].columns),
+            'data': aggregates[name].astype(object).values.tolist(),
+        }
+        for name in AGGREGATE_TABLES
+    }
+    return json.dumps({'meta': aggregates['meta'], 'tables': tables}, ensure_ascii=False)
+
+
+def aggregates_from_json(text):
+    """aggregates_to_json 결과(문자열 또는 바이트)를 집계 결과로 복원"""
+    payload = json.loads(text)
+    if payload.get('meta', {}).get('version') != AGGREGATES_VERSION:
+        raise ValueError("지원하지 않는 집계 결과 형식입니다.")
+    aggregates = {'meta': payload['meta']}
+    for name, columns in AGGREGATE_TABLES.items():
+        table = payload['tables'].get(name, {'columns': columns, 'data': []})
+        aggregates[name] = pd.DataFrame(table['data'], columns=table['columns'])
+    return aggregates
+
+
+def save_aggregates(aggregates, path, formats=('json',)):
+    """집계 결과 저장 (json: path + '.json', parquet: path 디렉토리) 후 저장한 경로 목록 반환"""
+    saved = []
+    if 'json' in formats:
+        json_path = f'{path}.json'
+        with open(json_path, 'w', encoding='utf-8') as f:
+            f.write(aggregates_to_json(aggregates))
+        saved.append(json_path)
+    if 'parquet' in formats:
+        os.makedirs(path, exist_ok=True)
+        for name in AGGREGATE_TABLES:
+            aggregates[name].to_parquet(os.path.join(path, f'{name}.parquet'), index=False)
+        with open(os.path.join(path, 'meta.json'), 'w', encoding='utf-8') as f:
+            json.dump(aggregates['meta'], f, ensure_ascii=False)
+        saved.append(path)
+    return saved
+
+
+def load_aggregates(source):
+    """저장된 집계 결과 로드 (JSON 파일 경로/파일 객체/바이트 또는 Parquet 디렉토리)"""
+    if isinstance(source, (str, os.PathLike)) and os.path.isdir(source):
+        with open(os.path.join(source, 'meta.json'), encoding='utf-8') as f:
+            aggregates = {'meta': json.load(f)}
+        for name in AGGREGATE_TABLES:
+            aggregates[name] = pd.read_parquet(os.path.join(source, f'{name}.parquet'))
+        return aggregates
+
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, 'rb') as f:
+            return aggregates_from_json(f.read())
+    if isinstance(source, (bytes, bytearray)):
+        return aggregates_from_json(bytes(source))
+    data = source.getvalue() if hasattr(source, 'getvalue') else source.read()
+    return aggregates_from_json(data)
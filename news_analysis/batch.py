@@ -0,0 +1,154 @@
+"""빅카인즈 내보내기 파일 일괄 분석 (명령줄)
+
+입력 디렉토리의 xlsx/csv/parquet 파일마다 연도별 기사 수, 키워드 상위 N개,
+지명 빈도수, 기관 동시출현 엣지를 계산하여 출력 디렉토리에 저장한다. 파일은
+프로세스 풀에서 병렬로 처리하며, 각 작업 프로세스는 가제티어와 기관명 -> 지명
+변환표를 한 번만 만들어 여러 파일에 재사용한다. 결과는 입력 디렉토리 기준 상대
+경로로 저장하며, 출력 이름이 겹치는 입력(a.xlsx와 a.csv 등)이 있으면 처리하지 않는다.
+출력 디렉토리의 index.json에
+파일별 결과 경로와 처리 시간을 남긴다. JSON 결과는 대시보드의
+'사전 계산 결과 열기'에서 바로 열 수 있다.
+
+사용법: python -m news_analysis.batch INPUT_DIR OUTPUT_DIR --workers 4 --format json parquet
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+SUPPORTED_EXTENSIONS = ('.xlsx', '.csv', '.parquet')
+
+# 작업 프로세스별 기관명 -> 지명 변환표 (처음 처리하는 파일에서 생성)
+_worker_table = None
+
+
+def list_inputs(input_dir):
+    """입력 디렉토리의 지원 형식 파일 경로 (이름 순)"""
+    return sorted(
+        os.path.join(input_dir, name) for name in os.listdir(input_dir)
+        if name.lower().endswith(SUPPORTED_EXTENSIONS) and not name.startswith('~$')
+    )
+
+
+def output_names(paths, input_root=None):
+    """입력 파일별 출력 이름 (입력 루트 기준 상대 경로에서 확장자를 뺀 것)
+
+    input_root를 주지 않으면 입력 파일들의 공통 상위 디렉토리를 기준으로 한다.
+    서로 다른 입력이 같은 이름이 되면(a.xlsx와 a.csv 등) 결과를 덮어쓰지 않도록 ValueError를 낸다.
+    """
+    if not paths:
+        return []
+    if input_root is None:
+        input_root = os.path.commonpath([os.path.dirname(os.path.abspath(path)) for path in paths])
+    names = [
+        os.path.splitext(os.path.relpath(os.path.abspath(path), os.path.abspath(input_root)))[0]
+        for path in paths
+    ]
+
+    seen = {}
+    for path, name in zip(paths, names):
+        if name in seen:
+            raise ValueError(f"출력 이름이 겹칩니다 ({name}): {seen[name]}, {path}")
+        seen[name] = path
+    return names
+
+
+def _resolution_table():
+    global _worker_table
+    if _worker_table is None:
+        from news_analysis.gazetteer import load_gazetteer
+        from news_analysis.locations import LocationMatcher, OrgResolutionTable
+        _worker_table = OrgResolutionTable(LocationMatcher(load_gazetteer().names))
+    return _worker_table
+
+
+def process_file(path, output_dir, top_n=50, min_weight=2, formats=('json',), output_name=None):
+    """파일 하나를 분석하여 output_dir/output_name(기본: 확장자를 뺀 파일 이름)에 저장하고 index.json 항목을 반환"""
+    from news_analysis.aggregates import compute_aggregates, save_aggregates
+    from news_analysis.ingest import load_news_file
+
+    start = time.perf_counter()
+    name = os.path.basename(path)
+    if output_name is None:
+        output_name = os.path.splitext(name)[0]
+    output_path = os.path.join(output_dir, output_name)
+    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+
+    news_df = load_news_file(path)
+    aggregates = compute_aggregates(
+        news_df, top_n=top_n, min_weight=min_weight, table=_resolution_table(), source=name
+    )
+    saved = save_aggregates(aggregates, output_path, formats)
+    return {
+        'source': os.path.join(os.path.dirname(output_name), name),
+        'rows': len(news_df),
+        'outputs': [os.path.relpath(p, output_dir) for p in saved],
+        'seconds': round(time.perf_counter() - start, 3),
+    }
+
+
+def run_batch(paths, output_dir, workers=None, top_n=50, min_weight=2, formats=('json',), input_root=None):
+    """파일 목록을 병렬로 처리하여 항목 목록(입력 순서)을 반환 (workers=1이면 현재 프로세스에서 처리)
+
+    결과는 input_root(기본: 입력 파일들의 공통 상위 디렉토리) 기준 상대 경로로 저장한다.
+    """
+    names = output_names(paths, input_root)
+    os.makedirs(output_dir, exist_ok=True)
+    args = (output_dir, top_n, min_weight, tuple(formats))
+    if workers == 1 or len(paths) <= 1:
+        results = [_safe_process(path, *args, name) for path, name in zip(paths, names)]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(_safe_process, path, *args, name) for path, name in zip(paths, names)]
+            results = [future.result() for future in futures]
+
+    with open(os.path.join(output_dir, 'index.json'), 'w', encoding='utf-8') as f:
+        json.dump({'files': results}, f, ensure_ascii=False, indent=2)
+    return results
+
+
+def _safe_process(path, *args):
+    # 파일 하나의 오류로 전체 작업이 멈추지 않도록 오류를 항목에 기록
+    try:
+        return process_file(path, *args)
+    except Exception as e:
+        return {'source': os.path.basename(path), 'error': f'{type(e).__name__}: {e}'}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="빅카인즈 내보내기 파일 일괄 분석")
+    parser.add_argument('input_dir', help="xlsx/csv/parquet 파일이 있는 디렉토리")
+    parser.add_argument('output_dir', help="결과를 저장할 디렉토리")
+    parser.add_argument('--workers', type=int, default=None, help="작업 프로세스 수 (기본: CPU 수)")
+    parser.add_argument('--top', type=int, default=50, help="저장할 키워드 수")
+    parser.add_argument('--min-weight', type=int, default=2, help="엣지로 저장할 최소 동시출현 수")
+    parser.add_argument('--format', nargs='+', choices=['json', 'parquet'], default=['json'])
+    args = parser.parse_args(argv)
+
+    paths = list_inputs(args.input_dir)
+    if not paths:
+        print(f"처리할 파일이 없습니다: {args.input_dir}", file=sys.stderr)
+        return 1
+
+    start = time.perf_counter()
+    try:
+        results = run_batch(paths, args.output_dir, workers=args.workers, top_n=args.top,
+                            min_weight=args.min_weight, formats=args.format, input_root=args.input_dir)
+    except ValueError as e:
+        print(e, file=sys.stderr)
+        return 1
+    failed = 0
+    for result in results:
+        if 'error' in result:
+            failed += 1
+            print(f"  실패 {result['source']}: {result['error']}", file=sys.stderr)
+        else:
+            print(f"  {result['source']}: 기사 {result['rows']:,}건, {result['seconds']:.2f}s")
+    print(f"파일 {len(results)}개 처리 ({time.perf_counter() - start:.2f}s), 실패 {failed}개")
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,162 @@
+"""여러 업로드 파일을 합친 누적 기사 코퍼스
+
+월 단위로 겹치게 내려받은 빅카인즈 파일을 차례로 추가하면 이미 있는 기사는
+건너뛰고 새 기사만 뒤에 이어 붙인다. 기사는 '기사링크'의 해시로 구분하고,
+링크가 없으면 기사제목 + 작성/게시일자의 해시를 쓴다.
+
+새 기사는 Dataset.extend로 덧붙이므로 검색 색인, 게시일 색인, 분석 큐브 같은
+파생 구조도 새 기사 분량만 갱신된다. root를 주면 파일마다 새로 추가된 기사를
+스냅샷으로 저장하고 추가 순서를 manifest.json에 남겨 다음 실행 때 불러온다.
+"""
+import json
+import logging
+import os
+
+import numpy as np
+import pandas as pd
+
+from news_analysis.ingest import Dataset, content_hash
+from news_analysis.snapshot import SnapshotStore
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_NAME = 'manifest.json'
+
+
+def article_keys(news_df):
+    """기사별 중복 판별 해시 (uint64, 기사링크가 없으면 기사제목 + 작성/게시일자 기준)"""
+    def text(column):
+        if column not in news_df.columns:
+            return pd.Series('', index=news_df.index)
+        return news_df[column].fillna('').astype(str).str.strip()
+
+    link = text('기사링크')
+    keys = 'url:' + link
+    missing = (link == '').to_numpy()
+    if missing.any():
+        keys[missing] = 'title:' + text('기사제목')[missing] + '\0' + text('작성/게시일자')[missing]
+    return pd.util.hash_array(keys.to_numpy(dtype=object))
+
+
+class Corpus:
+    """파일 단위로 기사를 누적하는 데이터셋 (기사 해시로 중복 제외)
+
+    sources에는 추가한 파일의 내용 해시, 이름, 기사 수, 새로 추가된 기사 수를
+    추가 순서대로 보관한다. dataset은 기사가 하나도 없으면 None이다.
+    """
+
+    def __init__(self, root=None):
+        self.root = root
+        self.store = None
+        self.sources = []
+        self.dataset = None
+        self._keys = np.empty(0, dtype=np.uint64)  # 정렬된 기사 해시
+        if root is not None:
+            self.store = SnapshotStore(os.path.join(root, 'parts'), max_bytes=float('inf'))
+            self._load()
+
+    def __len__(self):
+        return 0 if self.dataset is None else len(self.dataset.news_df)
+
+    def __contains__(self, source_key):
+        return any(source['key'] == source_key for source in self.sources)
+
+    @property
+    def key(self):
+        """기사를 추가한 파일 순서에 따른 데이터셋 키"""
+        parts = [source['key'] for source in self.sources if source['added']]
+        return content_hash('|'.join(parts).encode('utf-8'))
+
+    def add(self, source_key, news_df, name=None):
+        """파일(내용 해시 source_key)의 기사 중 처음 보는 기사만 추가하고 추가한 수를 반환"""
+        if source_key in self:
+            return 0
+
+        keys = article_keys(news_df)
+        # 파일 안의 중복은 처음 나온 기사만, 코퍼스에 이미 있는 기사는 제외
+        new = np.zeros(len(keys), dtype=bool)
+        new[np.unique(keys, return_index=True)[1]] = True
+        if len(self._keys):
+            at = np.minimum(np.searchsorted(self._keys, keys), len(self._keys) - 1)
+            new &= self._keys[at] != keys
+        new_rows = news_df[new].reset_index(drop=True)
+
+        added = np.sort(keys[new])
+        self._keys = np.insert(self._keys, np.searchsorted(self._keys, added), added)
+        self.sources.append({'key': source_key, 'name': name, 'rows': len(news_df), 'added': len(new_rows)})
+
+        if len(new_rows):
+            if self.dataset is None:
+                self.dataset = Dataset(self.key, new_rows)
+            else:
+                self.dataset.extend(new_rows, self.key)
+            if self.store is not None:
+                self._store_part(source_key, new_rows, name)
+        self._save_manifest()
+        return len(new_rows)
+
+    def _store_part(self, source_key, new_rows, name=None):
+        """새로 추가된 기사를 스냅샷으로 저장 (실패하면 경고만 남기고 메모리에는 유지)"""
+        try:
+            saved = self.store.save(source_key, new_rows)
+        except OSError as e:
+            saved = False
+            reason = str(e)
+        else:
+            reason = "Arrow로 변환할 수 없는 컬럼이 있습니다"
+        if not saved:
+            # 다음 실행 때 이 파일의 기사만 빠지고 나머지 코퍼스는 그대로 불러옴
+            logger.warning("코퍼스 파일을 디스크에 저장하지 못했습니다 (%s): %s", name or source_key, reason)
+        return saved
+
+    def clear(self):
+        """모든 기사와 저장된 파일 삭제"""
+        self.sources = []
+        self.dataset = None
+        self._keys = np.empty(0, dtype=np.uint64)
+        if self.store is not None:
+            self.store.clear()
+            self._save_manifest()
+
+    def _manifest_path(self):
+        return os.path.join(self.root, MANIFEST_NAME)
+
+    def _save_manifest(self):
+        if self.root is None:
+            return
+        path = self._manifest_path()
+        tmp_path = f'{path}.{os.getpid()}.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'sources': self.sources}, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+    def _load(self):
+        """manifest.json 순서대로 저장된 기사를 불러옴 (읽을 수 없는 파일은 코퍼스에서 제외)"""
+        try:
+            with open(self._manifest_path(), encoding='utf-8') as f:
+                sources = json.load(f)['sources']
+        except (OSError, ValueError, KeyError):
+            return
+
+        parts = []
+        kept = []
+        for source in sources:
+            if source['added']:
+                try:
+                    part = self.store.load(source['key'])
+                except (OSError, ValueError):
+                    part = None
+                if part is None:
+                    # 저장하지 못했거나 저장 형식이 바뀐 파일: 해당 파일의 기사만 빠짐
+                    logger.warning("코퍼스 파일을 불러오지 못해 제외합니다: %s", source['name'] or source['key'])
+                    continue
+                parts.append(part)
+            kept.append(source)
+
+        self.sources = kept
+        if len(kept) < len(sources):
+            self._save_manifest()
+        if parts:
+            news_df = pd.concat(parts, ignore_index=True)
+            self.dataset = Dataset(self.key, news_df)
+            self._keys = np.sort(article_keys(news_df))
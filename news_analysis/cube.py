@@ -0,0 +1,170 @@
+"""연도별 사전 집계(분석 큐브)
+
+데이터셋당 한 번 키워드/기관/지명 항목을 기사별 번호 목록(CodedLists)으로
+만들고, 각 항목의 연도 × 항목 희소 빈도 행렬을 함께 만들어 둔다.
+
+- 전체 데이터나 연도만 고른 경우: 해당 연도 행을 더해 빈도수를 구한다.
+- 검색 등으로 기사를 걸러낸 경우: 걸러낸 기사의 번호 구간만 모아 센다.
+
+결과 순서는 기존 방식과 같도록 항목이 처음 나온 위치도 연도별로 함께 보관한다.
+기사가 뒤에 추가되면(extend) 새 기사 분량만 번호 목록과 큐브에 더한다.
+"""
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+from news_analysis.tokens import first_occurrences, ordered_frequency, top_frequency
+
+
+def _reshape(matrix, shape, row_map=None):
+    """희소 행렬을 더 큰 shape로 옮김 (row_map을 주면 행 번호를 바꿔서)"""
+    coo = matrix.tocoo()
+    rows = coo.row if row_map is None else row_map[coo.row]
+    return sparse.csr_matrix((coo.data, (rows, coo.col)), shape=shape)
+
+
+class YearCube:
+    """한 항목의 연도 × 항목 희소 행렬 (빈도수, 처음 나온 위치 + 1)"""
+
+    def __init__(self, lists, year_ids, n_years):
+        self.n_positions = 0
+        self.counts = sparse.csr_matrix((n_years, 0), dtype=np.int64)
+        self.first = sparse.csr_matrix((n_years, 0), dtype=np.int64)
+        self.extend(lists.ids, year_ids[lists.id_rows()], len(lists.vocab))
+
+    def extend(self, ids, item_years, n_items):
+        """번호 목록 뒤에 덧붙인 항목 번호(ids)와 각 항목의 연도 번호를 반영"""
+        keep = item_years >= 0
+        positions = np.flatnonzero(keep) + self.n_positions
+        item_years, ids = item_years[keep].astype(np.int64), ids[keep].astype(np.int64)
+        self.n_positions += len(keep)
+        shape = (self.counts.shape[0], n_items)
+
+        counts = sparse.csr_matrix((np.ones(len(ids), dtype=np.int64), (item_years, ids)), shape=shape)
+        self.counts = _reshape(self.counts, shape) + counts
+
+        # (연도, 항목)별 처음 나온 위치 (0은 희소 행렬에서 빈 값이므로 1을 더해 보관)
+        first = first_occurrences(item_years * max(n_items, 1) + ids)
+        rows, cols, values = item_years[first], ids[first], positions[first] + 1
+        previous = _reshape(self.first, shape)
+        if previous.nnz and len(rows):
+            # 이미 나온 (연도, 항목)은 앞선 위치를 유지
+            new = np.asarray(previous[rows, cols]).ravel() == 0
+            rows, cols, values = rows[new], cols[new], values[new]
+        self.first = previous + sparse.csr_matrix((values, (rows, cols)), shape=shape)
+
+    def remap_years(self, year_map, n_years):
+        """연도 번호가 바뀐 경우(새 연도 추가) 행을 옮김 (year_map: 이전 번호 -> 새 번호)"""
+        shape = (n_years, self.counts.shape[1])
+        self.counts = _reshape(self.counts, shape, year_map)
+        self.first = _reshape(self.first, shape, year_map)
+
+    def counts_and_first_seen(self, year_ids=None):
+        """연도 번호 목록(None이면 전체)의 (항목별 빈도수, 항목별 처음 나온 위치)"""
+        counts = self.counts if year_ids is None else self.counts[year_ids]
+        first = (self.first if year_ids is None else self.first[year_ids]).tocoo()
+        first_seen = np.full(counts.shape[1], self.n_positions, dtype=np.int64)
+        np.minimum.at(first_seen, first.col, first.data - 1)
+        return np.asarray(counts.sum(axis=0)).ravel(), first_seen
+
+
+class AnalysisCube:
+    """데이터셋의 연도 번호와 항목별 번호 목록/연도 큐브
+
+    항목은 dimension(name, builder)로 처음 요청될 때 builder(news_df)가 만든
+    CodedLists로 한 번만 생성한다. 빈도수 조회에서 rows(기사 위치)를 주면 해당
+    기사만, years(연도 목록)를 주면 해당 연도만 집계한다.
+    """
+
+    def __init__(self, news_df, year_column='연도'):
+        self.news_df = news_df
+        self.year_column = year_column
+        self.years = []
+        self.year_ids = np.empty(0, dtype=np.int64)
+        self._dimensions = {}
+        self._extend_years(news_df)
+
+    def _extend_years(self, new_rows):
+        """추가된 기사의 연도 번호를 붙이고 반환 (새 연도가 생기면 연도 순서에 맞게 번호를 다시 매김)"""
+        if self.year_column in new_rows.columns:
+            codes, years = pd.factorize(new_rows[self.year_column], sort=True)
+        else:
+            codes, years = np.full(len(new_rows), -1), []
+
+        merged = sorted(set(self.years).union(years))
+        if merged != self.years:
+            index = {year: i for i, year in enumerate(merged)}
+            year_map = np.array([index[year] for year in self.years], dtype=np.int64)
+            if len(year_map):
+                self.year_ids = np.where(self.year_ids >= 0, year_map[self.year_ids], -1)
+                for _, cube, _ in self._dimensions.values():
+                    cube.remap_years(year_map, len(merged))
+            self.years = merged
+
+        index = {year: i for i, year in enumerate(self.years)}
+        new_ids = np.array([index[year] for year in years] + [-1], dtype=np.int64)
+        # 연도가 없는 기사(-1)는 new_ids의 마지막 값 -1을 가리킴
+        new_year_ids = new_ids[np.asarray(codes, dtype=np.int64)]
+        self.year_ids = np.concatenate([self.year_ids, new_year_ids])
+        return new_year_ids
+
+    def extend(self, news_df, new_rows):
+        """news_df 뒤에 추가된 기사(new_rows)를 연도 번호와 만들어 둔 항목에 반영"""
+        self.news_df = news_df
+        new_year_ids = self._extend_years(new_rows)
+        for lists, cube, builder in self._dimensions.values():
+            part = builder(new_rows)
+            item_years = new_year_ids[part.id_rows()]
+            cube.extend(lists.extend(part), item_years, len(lists.vocab))
+
+    def dimension(self, name, builder=None):
+        """이름에 해당하는 항목 번호 목록 (없으면 builder(news_df)로 만들고 연도 큐브 생성)"""
+        if name not in self._dimensions:
+            if builder is None:
+                raise KeyError(name)
+            lists = builder(self.news_df)
+            self._dimensions[name] = (lists, YearCube(lists, self.year_ids, len(self.years)), builder)
+        return self._dimensions[name][0]
+
+    def has_dimension(self, name):
+        """항목이 이미 만들어졌는지 여부"""
+        return name in self._dimensions
+
+    def year_rows(self, years):
+        """연도 목록에 해당하는 기사 위치 (정렬됨)"""
+        return np.flatnonzero(np.isin(self.year_ids, self._year_ids(years)))
+
+    def _year_ids(self, years):
+        index = {year: i for i, year in enumerate(self.years)}
+        return np.array(sorted(index[year] for year in years if year in index), dtype=np.int64)
+
+    def year_counts(self, rows=None):
+        """연도별 기사 수 시리즈 (기사가 있는 연도만, 연도 순)"""
+        year_ids = self.year_ids if rows is None else self.year_ids[rows]
+        counts = np.bincount(year_ids[year_ids >= 0], minlength=len(self.years))
+        found = np.flatnonzero(counts)
+        return pd.Series(counts[found], index=pd.Index([self.years[i] for i in found], name='연도'), name='기사 수')
+
+    def _counts_and_first_seen(self, name, rows, years):
+        lists, cube, _ = self._dimensions[name]
+        if rows is None:
+            return cube.counts_and_first_seen(None if years is None else self._year_ids(years))
+        # 기사를 걸러낸 경우: 해당 기사의 번호 구간만 집계
+        rows = np.asarray(rows, dtype=np.int64)
+        if years is not None:
+            rows = rows[np.isin(self.year_ids[rows], self._year_ids(years))]
+        return lists.counts_and_first_seen(rows)
+
+    def counts(self, name, rows=None, years=None):
+        """항목 번호별 빈도수 배열"""
+        return self._counts_and_first_seen(name, rows, years)[0]
+
+    def frequency(self, name, rows=None, years=None):
+        """{항목: 빈도수} (처음 나온 순서대로)"""
+        lists = self.dimension(name)
+        return ordered_frequency(lists.vocab, *self._counts_and_first_seen(name, rows, years))
+
+    def top(self, name, n, rows=None, years=None):
+        """빈도수 상위 n개 {항목: 빈도수} (Counter.most_common과 같은 순서)"""
+        lists = self.dimension(name)
+        return top_frequency(lists.vocab, *self._counts_and_first_seen(name, rows, years), n)
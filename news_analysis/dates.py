@@ -0,0 +1,113 @@
+"""게시일 정렬 색인
+
+적재 시 파싱한 게시일을 1970-01-01 기준 일수(int32)로 바꾸고, 날짜 순으로
+정렬한 기사 위치(order)와 정렬된 일수 배열을 함께 보관한다.
+
+- 기간 필터: 정렬된 일수에서 np.searchsorted로 시작/끝 위치를 찾아 구간을 자른다.
+- 추이 집계: 일수를 연/월/주/일 시작일로 내림한 뒤 np.bincount로 센다.
+- 기사 추가: 새 기사만 정렬한 뒤 기존 정렬 배열에 끼워 넣는다.
+"""
+import numpy as np
+import pandas as pd
+
+from news_analysis.ingest import DATE_COLUMN, parse_dates
+
+# 날짜가 없는(NaT) 기사의 일수 값
+MISSING_DAY = np.iinfo(np.int32).min
+
+# 추이 집계 단위: 이름 -> 표시 이름
+GRANULARITIES = {
+    'year': '연도',
+    'month': '월',
+    'week': '주',
+    'day': '일',
+}
+
+
+def to_day(value):
+    """날짜(date, Timestamp, 문자열 등)를 1970-01-01 기준 일수로 변환"""
+    return int(np.datetime64(pd.Timestamp(value).date(), 'D').astype(np.int64))
+
+
+def bin_days(days, granularity='year'):
+    """일수 배열을 해당 단위의 시작일(일수)로 내림 (주는 월요일 시작)"""
+    if granularity == 'day':
+        return days
+    if granularity == 'week':
+        # 1970-01-01은 목요일이므로 3을 더해 월요일 기준으로 맞춤
+        return days - (days + 3) % 7
+    unit = {'year': 'Y', 'month': 'M'}[granularity]
+    return days.astype('datetime64[D]').astype(f'datetime64[{unit}]').astype('datetime64[D]').astype(np.int64)
+
+
+class DateIndex:
+    """기사별 게시일 일수와 날짜 순 기사 위치 (날짜 없는 기사는 order에서 제외)"""
+
+    def __init__(self, dates):
+        values = np.asarray(pd.to_datetime(dates)).astype('datetime64[D]')
+        valid = ~np.isnat(values)
+        self.days = np.full(len(values), MISSING_DAY, dtype=np.int32)
+        self.days[valid] = values[valid].astype(np.int64)
+
+        rows = np.flatnonzero(valid)
+        self.order = rows[np.argsort(self.days[rows], kind='stable')]
+        self.sorted_days = self.days[self.order]
+
+    @classmethod
+    def from_frame(cls, news_df):
+        """정규화된 데이터프레임의 게시일 컬럼으로 생성 (없으면 '작성/게시일자'를 파싱)"""
+        if DATE_COLUMN in news_df.columns:
+            return cls(news_df[DATE_COLUMN])
+        return cls(parse_dates(news_df['작성/게시일자']))
+
+    def extend(self, news_df, new_rows):
+        """news_df 뒤에 추가된 기사(new_rows)의 게시일을 반영"""
+        new = DateIndex.from_frame(new_rows)
+        # 같은 날짜는 기존 기사 뒤에 오도록 side='right' 위치에 삽입 (안정 정렬과 같은 순서)
+        at = np.searchsorted(self.sorted_days, new.sorted_days, side='right')
+        self.order = np.insert(self.order, at, new.order + len(self.days))
+        self.sorted_days = np.insert(self.sorted_days, at, new.sorted_days)
+        self.days = np.concatenate([self.days, new.days])
+
+    def __len__(self):
+        return len(self.days)
+
+    def bounds(self):
+        """(가장 이른 날짜, 가장 늦은 날짜) (날짜가 하나도 없으면 None)"""
+        if len(self.sorted_days) == 0:
+            return None
+        first, last = self.sorted_days[[0, -1]].astype('datetime64[D]')
+        return first.item(), last.item()
+
+    def range_rows(self, start, end, rows=None):
+        """게시일이 start 이상 end 이하인 기사 위치 (정렬됨, rows를 주면 그 안에서만)"""
+        start_day, end_day = to_day(start), to_day(end)
+        if rows is not None:
+            # 이미 걸러낸 기사는 해당 기사의 일수만 비교 (rows 순서 유지)
+            rows = np.asarray(rows, dtype=np.int64)
+            days = self.days[rows]
+            return rows[(days >= start_day) & (days <= end_day)]
+
+        lo = np.searchsorted(self.sorted_days, start_day, side='left')
+        hi = np.searchsorted(self.sorted_days, end_day, side='right')
+        selected = self.order[lo:hi]
+        if len(selected) * 16 > len(self.days):
+            # 넓은 기간은 정렬하는 것보다 불리언 배열에 표시한 뒤 모으는 편이 빠름
+            mask = np.zeros(len(self.days), dtype=bool)
+            mask[selected] = True
+            return np.flatnonzero(mask)
+        return np.sort(selected)
+
+    def trend(self, granularity='year', rows=None):
+        """단위 기간별 기사 수 시리즈 (기사가 있는 기간만, 기간 시작일 순)"""
+        days = self.sorted_days if rows is None else self.days[rows]
+        days = days[days != MISSING_DAY].astype(np.int64)
+        periods = bin_days(days, granularity)
+        if len(periods) == 0:
+            return pd.Series([], index=pd.DatetimeIndex([], name='기간'), name='기사 수', dtype=np.int64)
+
+        first = periods.min()
+        counts = np.bincount(periods - first)
+        found = np.flatnonzero(counts)
+        index = pd.DatetimeIndex((found + first).astype('datetime64[D]'), name='기간')
+        return pd.Series(counts[found], index=index, name='기사 수')
@@ -0,0 +1,132 @@
+"""유사 중복 기사(통신사 전재 기사 등) 묶기
+
+같은 연합뉴스/뉴시스 기사가 여러 언론사에 제목만 조금 바뀌어 실리면 연도별 기사
+수, 키워드 빈도, 기관 동시출현이 모두 부풀려진다. 기사제목 단어와 키워드의 집합을
+기사의 특징으로 보고 MinHash 서명으로 자카드 유사도를 추정한다.
+
+- MinHash: 토큰 번호에 num_perm개의 해시 함수 (a·x + b) mod p를 적용하고 기사별
+  최솟값을 np.minimum.reduceat으로 구한다.
+- LSH: 서명을 bands개의 구간으로 나누어 구간 값이 같은 기사끼리만 후보로 본다.
+  후보는 구간 묶음의 첫 기사와 서명 일치율(자카드 추정치)이 threshold 이상일 때
+  연결하고, 연결 요소를 하나의 묶음으로 본다.
+
+모든 기사 쌍을 비교하지 않으므로 기사 수에 거의 비례하는 시간에 처리된다.
+"""
+import numpy as np
+from scipy import sparse
+from scipy.sparse.csgraph import connected_components
+
+from news_analysis.tokens import CodedLists, factorize_stripped, first_occurrences, split_list_column
+
+# 해시 함수의 소수 (2^31 - 1, a·x가 uint64 범위를 넘지 않음)
+_PRIME = np.uint64((1 << 31) - 1)
+_EMPTY_SIGNATURE = np.uint32(0xFFFFFFFF)
+
+
+def shingle_lists(news_df, title_column='기사제목', keyword_column='키워드'):
+    """기사별 토큰 집합 (기사제목의 공백 단위 단어 + 쉼표 구분 키워드, 기사 안의 중복 제외)"""
+    pieces = []
+    if title_column in news_df.columns:
+        pieces.append(split_list_column(news_df[title_column], sep=' '))
+    if keyword_column in news_df.columns:
+        pieces.append(split_list_column(news_df[keyword_column]))
+    if not pieces:
+        return CodedLists([], np.zeros(len(news_df) + 1, dtype=np.int64), [])
+
+    rows = np.concatenate([rows for rows, _ in pieces])
+    parts = np.concatenate([parts for _, parts in pieces])
+    codes, vocab = factorize_stripped(parts)
+    keep = codes >= 0
+    rows, codes = rows[keep], codes[keep]
+
+    n_tokens = max(len(vocab), 1)
+    keys = np.unique(rows * n_tokens + codes)
+    return CodedLists.from_pairs(keys // n_tokens, keys % n_tokens, vocab, len(news_df))
+
+
+def minhash_signatures(lists, num_perm=64, seed=1):
+    """기사별 MinHash 서명 (기사 수 × num_perm, uint32; 토큰이 없는 기사는 모두 최댓값)"""
+    rng = np.random.default_rng(seed)
+    a = rng.integers(1, int(_PRIME), num_perm, dtype=np.uint64)
+    b = rng.integers(0, int(_PRIME), num_perm, dtype=np.uint64)
+
+    signatures = np.full((len(lists), num_perm), _EMPTY_SIGNATURE, dtype=np.uint32)
+    lengths = np.diff(lists.offsets)
+    nonempty = np.flatnonzero(lengths)
+    if len(nonempty) == 0:
+        return signatures
+
+    # 토큰이 없는 기사는 길이가 0이므로, 토큰이 있는 기사의 시작 위치만으로 구간을 나눔
+    starts = lists.offsets[nonempty]
+    token_ids = np.arange(len(lists.vocab), dtype=np.uint64)
+    for i in range(num_perm):
+        token_hashes = ((a[i] * token_ids + b[i]) % _PRIME).astype(np.uint32)
+        signatures[nonempty, i] = np.minimum.reduceat(token_hashes[lists.ids], starts)
+    return signatures
+
+
+def lsh_edges(signatures, bands=16, threshold=0.8, rows=None):
+    """LSH 구간이 같은 기사 쌍 중 서명 일치율이 threshold 이상인 (기사, 기사) 배열 2개"""
+    if rows is None:
+        rows = np.arange(len(signatures))
+    width = signatures.shape[1] // bands
+    sources, targets = [], []
+    for band in range(bands):
+        block = signatures[rows, band * width:(band + 1) * width].astype(np.uint64)
+        keys = block[:, 0].copy()
+        for j in range(1, width):
+            keys = keys * np.uint64(1000003) + block[:, j]
+
+        order = np.argsort(keys, kind='stable')
+        sorted_keys = keys[order]
+        starts = np.ones(len(order), dtype=bool)
+        starts[1:] = sorted_keys[1:] != sorted_keys[:-1]
+        # 같은 구간 값 묶음의 첫 기사(안정 정렬이므로 가장 앞 기사)를 대표로 연결
+        first = order[np.maximum.accumulate(np.where(starts, np.arange(len(order)), 0))]
+        member = ~starts
+        a, b = rows[first[member]], rows[order[member]]
+        if len(a):
+            agreement = (signatures[a] == signatures[b]).mean(axis=1)
+            similar = agreement >= threshold
+            sources.append(a[similar])
+            targets.append(b[similar])
+
+    if not sources:
+        empty = np.empty(0, dtype=np.int64)
+        return empty, empty
+    return np.concatenate(sources), np.concatenate(targets)
+
+
+class NearDuplicates:
+    """유사 중복 기사 묶음 (labels: 기사별 묶음 번호, keep_rows: 묶음마다 가장 앞 기사)"""
+
+    def __init__(self, news_df, num_perm=64, bands=16, threshold=0.8, seed=1):
+        self.threshold = threshold
+        lists = shingle_lists(news_df)
+        self.signatures = minhash_signatures(lists, num_perm=num_perm, seed=seed)
+
+        n = len(news_df)
+        candidates = np.flatnonzero(np.diff(lists.offsets))
+        sources, targets = lsh_edges(self.signatures, bands=bands, threshold=threshold, rows=candidates)
+        graph = sparse.csr_matrix((np.ones(len(sources), dtype=np.int8), (sources, targets)), shape=(n, n))
+        self.n_clusters, self.labels = connected_components(graph, directed=False)
+        self.keep_rows = first_occurrences(self.labels)
+
+    def __len__(self):
+        return len(self.labels)
+
+    @property
+    def n_duplicates(self):
+        """묶음의 대표가 아닌(제외되는) 기사 수"""
+        return len(self.labels) - len(self.keep_rows)
+
+    def collapse(self, rows=None):
+        """기사 위치(None이면 전체) 중 묶음마다 가장 앞 기사만 남긴 위치 (정렬됨)"""
+        if rows is None:
+            return self.keep_rows
+        rows = np.asarray(rows, dtype=np.int64)
+        return np.sort(rows[first_occurrences(self.labels[rows])])
+
+    def cluster_sizes(self):
+        """묶음별 기사 수 (묶음 번호 순)"""
+        return np.bincount(self.labels, minlength=self.n_clusters)
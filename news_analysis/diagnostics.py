@@ -0,0 +1,193 @@
+"""대시보드 재실행별 섹션 시간/메모리 기록 (진단 모드)
+
+재실행마다 섹션(파일 적재, 검색, 지명 히트맵, 워드클라우드, 네트워크 등)의
+경과 시간(perf_counter)과 최대 메모리 할당량(tracemalloc)을 기록하고, 실행이
+끝나면 등록한 캐시의 stats()로 적중/계산 횟수를 남긴다. 최근 max_runs번의
+기록을 보관하며 JSON으로 내보내 다른 실행과 비교할 수 있다.
+
+tracemalloc은 할당마다 추적 비용이 들므로 기록 중인 실행이 있는 동안에만 추적한다.
+추적은 프로세스 전체에 적용되므로 여러 세션의 기록 중인 실행을 세어, 마지막 실행이
+끝나거나 해당 세션이 사라지면 중지한다. 다른 세션이 동시에 기록 중이면 최대값을
+초기화하지 않으므로, 그 동안의 최대 메모리에는 다른 세션의 할당도 포함될 수 있다.
+섹션은 중첩할 수 있으며, 바깥 섹션의 최대 메모리에는 안쪽 섹션의 최대값도 포함된다.
+"""
+import json
+import threading
+import time
+import tracemalloc
+import weakref
+from collections import deque
+from contextlib import contextmanager
+
+# 메모리 추적 중인 실행이 있는 프로파일러 (세션이 사라지면 자동으로 빠짐)
+_tracing_lock = threading.RLock()
+_tracing_profilers = weakref.WeakSet()
+_started_tracing = False
+
+
+def _hold_tracing(profiler):
+    """프로파일러의 실행 동안 메모리 추적 유지 (추적 중이 아니면 시작)"""
+    global _started_tracing
+    with _tracing_lock:
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            _started_tracing = True
+        _tracing_profilers.add(profiler)
+
+
+def _release_tracing(profiler=None):
+    """프로파일러의 추적을 해제하고, 기록 중인 실행이 남지 않으면 이 모듈이 시작한 추적을 중지"""
+    global _started_tracing
+    with _tracing_lock:
+        if profiler is not None:
+            _tracing_profilers.discard(profiler)
+        if not _tracing_profilers and _started_tracing:
+            if tracemalloc.is_tracing():
+                tracemalloc.stop()
+            _started_tracing = False
+
+
+def tracing_shared():
+    """다른 프로파일러도 메모리를 추적 중인지 여부 (최대값을 초기화하면 서로의 기록이 틀어짐)"""
+    with _tracing_lock:
+        return len(_tracing_profilers) > 1
+
+
+def cache_counts(stats):
+    """캐시 이름 -> stats()를 {이름: {'hits', 'misses', 'entries'}}로 정리 (SectionCache는 섹션별로 펼침)"""
+    counts = {}
+    for name, cache_stats in stats.items():
+        if cache_stats and all(isinstance(value, dict) for value in cache_stats.values()):
+            for section, section_stats in cache_stats.items():
+                counts[f'{name}:{section}'] = _count_fields(section_stats)
+        else:
+            counts[name] = _count_fields(cache_stats)
+    return counts
+
+
+def _count_fields(stats):
+    return {key: stats.get(key, 0) for key in ('hits', 'misses', 'entries')}
+
+
+class SectionProfiler:
+    """재실행별 섹션 기록 (runs: 최근 max_runs번의 실행 기록, 실행 순서대로)"""
+
+    def __init__(self, max_runs=50, trace_memory=True):
+        self.runs = deque(maxlen=max_runs)
+        self.trace_memory = trace_memory
+        self.current = None
+        self._caches = {}
+        self._stack = []
+        self._last_counts = {}
+        self._run_count = 0
+        # 세션이 끝나 이 객체가 사라지면 추적 해제
+        weakref.finalize(self, _release_tracing)
+
+    def start_run(self, label=None):
+        """새 재실행 기록 시작 (이전 실행이 끝나지 않았으면 그대로 마무리)"""
+        if self.current is not None:
+            self.end_run()
+        if self.trace_memory:
+            _hold_tracing(self)
+        self._run_count += 1
+        self.current = {
+            'run': self._run_count,
+            'label': label,
+            'started': time.strftime('%Y-%m-%d %H:%M:%S'),
+            'sections': [],
+            'caches': {},
+        }
+        self._start = time.perf_counter()
+        return self.current
+
+    def track_cache(self, name, cache):
+        """실행이 끝날 때 stats()를 기록할 캐시 등록 (처음 등록하면 지금까지의 횟수를 기준으로 삼음)"""
+        if self._caches.get(name) is not cache:
+            self._last_counts.update(cache_counts({name: cache.stats()}))
+        self._caches[name] = cache
+
+    @contextmanager
+    def section(self, name):
+        """with 블록의 경과 시간과 최대 메모리 할당량(시작 시점 대비)을 현재 실행에 기록"""
+        if self.current is None:
+            yield
+            return
+        tracing = tracemalloc.is_tracing()
+        if tracing:
+            current, peak = tracemalloc.get_traced_memory()
+            if self._stack:
+                # 바깥 섹션의 지금까지 최댓값을 보존한 뒤 최댓값 초기화
+                self._stack[-1]['peak'] = max(self._stack[-1]['peak'], peak)
+            if not tracing_shared():
+                tracemalloc.reset_peak()
+        else:
+            current = 0
+        entry = {'start_memory': current, 'peak': current}
+        self._stack.append(entry)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            self._stack.pop()
+            if tracing:
+                entry['peak'] = max(entry['peak'], tracemalloc.get_traced_memory()[1])
+                if self._stack:
+                    self._stack[-1]['peak'] = max(self._stack[-1]['peak'], entry['peak'])
+            self.current['sections'].append({
+                'section': name,
+                'depth': len(self._stack),
+                'seconds': round(elapsed, 6),
+                'peak_mb': round((entry['peak'] - entry['start_memory']) / 1024 ** 2, 3) if tracing else None,
+            })
+
+    def end_run(self):
+        """현재 실행을 마무리하고 캐시별 누적/이번 실행 적중·계산 횟수를 기록"""
+        run = self.current
+        if run is None:
+            return None
+        run['seconds'] = round(time.perf_counter() - self._start, 6)
+        counts = cache_counts({name: cache.stats() for name, cache in self._caches.items()})
+        for name, count in counts.items():
+            previous = self._last_counts.get(name, {})
+            count['run_hits'] = count['hits'] - previous.get('hits', 0)
+            count['run_misses'] = count['misses'] - previous.get('misses', 0)
+        run['caches'] = counts
+        self._last_counts = counts
+        self.runs.append(run)
+        self.current = None
+        self._stack = []
+        _release_tracing(self)
+        return run
+
+    def stop(self):
+        """진단 모드를 끌 때 메모리 추적 해제 (기록 중인 다른 실행이 없으면 중지)"""
+        self.current = None
+        self._stack = []
+        _release_tracing(self)
+
+    def section_rows(self, run=None):
+        """실행(기본: 마지막 실행)의 섹션 기록 목록"""
+        run = run or (self.runs[-1] if self.runs else None)
+        return [] if run is None else list(run['sections'])
+
+    def cache_rows(self, run=None):
+        """실행(기본: 마지막 실행)의 캐시별 적중/계산 횟수 목록"""
+        run = run or (self.runs[-1] if self.runs else None)
+        return [] if run is None else [dict(count, cache=name) for name, count in run['caches'].items()]
+
+    def history_rows(self):
+        """실행별 섹션 경과 시간 목록 [{'run', 'section', 'seconds', 'peak_mb'}, ...]"""
+        return [
+            {'run': run['run'], 'section': section['section'], 'seconds': section['seconds'],
+             'peak_mb': section['peak_mb']}
+            for run in self.runs for section in run['sections']
+        ]
+
+    def to_json(self):
+        """보관 중인 실행 기록 JSON 문자열"""
+        return json.dumps({'runs': list(self.runs)}, ensure_ascii=False, indent=2)
+
+    def clear(self):
+        """실행 기록 삭제 (캐시 횟수는 계속 이번 실행 기준으로 계산)"""
+        self.runs.clear()
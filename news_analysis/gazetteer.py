@@ -0,0 +1,135 @@
+"""시군구 좌표(가제티어) 로드
+
+저장소에 포함된 시군구 좌표를 네트워크 없이 읽어 시군구명 → 번호 딕셔너리와
+위도/경도 NumPy 배열로 보관한다. 배열 파일(sigungu_coordinates.npz)은
+convert_csv_to_json.py로 미리 만들어 두며, 없으면 JSON, CSV 순으로 읽는다.
+GitHub의 최신 CSV는 명시적으로 요청할 때만 사용한다.
+"""
+import hashlib
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+GAZETTEER_NPZ = os.path.join(ROOT, 'sigungu_coordinates.npz')
+GAZETTEER_JSON = os.path.join(ROOT, 'sigungu_coordinates.json')
+GAZETTEER_CSV = os.path.join(ROOT, 'sigungu_coordinates.csv')
+
+REMOTE_CSV_URL = "https://raw.githubusercontent.com/GEOeduHJ/news_analyzer_py/refs/heads/main/sigungu_coordinates.csv"
+
+REQUIRED_COLUMNS = ['sido', 'sigungu', 'lat', 'lon']
+
+
+class Gazetteer:
+    """시군구명 목록과 위도/경도 배열
+
+    시군구명 순서는 원본에서 처음 등장한 순서이며(지명 추출의 우선순위),
+    같은 이름이 여러 번 나오면 마지막 좌표를 사용한다.
+    """
+
+    def __init__(self, names, lat, lon):
+        self.names = [str(name) for name in names]
+        self.lat = np.asarray(lat, dtype=np.float64)
+        self.lon = np.asarray(lon, dtype=np.float64)
+        self.index = {name: i for i, name in enumerate(self.names)}
+
+    def __len__(self):
+        return len(self.names)
+
+    def __iter__(self):
+        return iter(self.names)
+
+    def __contains__(self, name):
+        return name in self.index
+
+    @classmethod
+    def from_frame(cls, df):
+        """sido/sigungu/lat/lon 컬럼이 있는 데이터프레임에서 생성 (잘못된 좌표는 제외)"""
+        if not all(col in df.columns for col in REQUIRED_COLUMNS):
+            raise ValueError("CSV 파일 형식이 올바르지 않습니다. 'sido', 'sigungu', 'lat', 'lon' 컬럼이 필요합니다.")
+        df = pd.DataFrame({
+            'sigungu': df['sigungu'],
+            'lat': pd.to_numeric(df['lat'], errors='coerce'),
+            'lon': pd.to_numeric(df['lon'], errors='coerce'),
+        }).dropna()
+        if df.empty:
+            raise ValueError("유효한 좌표 데이터를 찾을 수 없습니다.")
+        last = df.groupby('sigungu', sort=False).last()
+        return cls(last.index, last['lat'].to_numpy(), last['lon'].to_numpy())
+
+    @classmethod
+    def from_csv(cls, path_or_url=GAZETTEER_CSV):
+        """CSV 파일(또는 URL)에서 생성"""
+        return cls.from_frame(pd.read_csv(path_or_url, encoding='utf-8-sig'))
+
+    @classmethod
+    def from_json(cls, path=GAZETTEER_JSON):
+        """convert_csv_to_json.py가 만든 JSON에서 생성"""
+        with open(path, encoding='utf-8') as f:
+            coords = json.load(f)
+        return cls(
+            coords.keys(),
+            [value['lat'] for value in coords.values()],
+            [value['lon'] for value in coords.values()],
+        )
+
+    @classmethod
+    def from_npz(cls, path=GAZETTEER_NPZ):
+        """미리 만들어 둔 배열 파일에서 생성"""
+        with np.load(path, allow_pickle=False) as data:
+            return cls(data['names'].tolist(), data['lat'], data['lon'])
+
+    def save_npz(self, path=GAZETTEER_NPZ):
+        """배열 파일로 저장"""
+        np.savez(path, names=np.array(self.names, dtype=str), lat=self.lat, lon=self.lon)
+
+    def lookup(self, names):
+        """시군구명 목록의 번호 배열 (없는 이름은 -1)"""
+        index = self.index
+        return np.fromiter((index.get(name, -1) for name in names), dtype=np.int64)
+
+    def coordinates(self, names):
+        """시군구명 목록의 (위도, 경도) 배열 (없는 이름은 NaN)"""
+        ids = self.lookup(names)
+        found = ids >= 0
+        lat = np.full(len(ids), np.nan)
+        lon = np.full(len(ids), np.nan)
+        lat[found] = self.lat[ids[found]]
+        lon[found] = self.lon[ids[found]]
+        return lat, lon
+
+    def fingerprint(self):
+        """시군구명과 좌표의 해시 (좌표가 바뀌면 다른 값)"""
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update('\0'.join(self.names).encode('utf-8'))
+        digest.update(self.lat.tobytes())
+        digest.update(self.lon.tobytes())
+        return digest.hexdigest()
+
+    def to_dict(self):
+        """기존 coords_dict 형식 {시군구명: {'lat': .., 'lon': ..}}"""
+        return {
+            name: {'lat': float(lat), 'lon': float(lon)}
+            for name, lat, lon in zip(self.names, self.lat, self.lon)
+        }
+
+
+def load_gazetteer():
+    """저장소에 포함된 시군구 좌표 로드 (배열 파일 -> JSON -> CSV 순)"""
+    loaders = [
+        (GAZETTEER_NPZ, Gazetteer.from_npz),
+        (GAZETTEER_JSON, Gazetteer.from_json),
+        (GAZETTEER_CSV, Gazetteer.from_csv),
+    ]
+    for path, loader in loaders:
+        if os.path.exists(path):
+            return loader(path)
+    raise FileNotFoundError("시군구 좌표 파일(sigungu_coordinates.npz/json/csv)을 찾을 수 없습니다.")
+
+
+def load_remote_gazetteer(url=REMOTE_CSV_URL):
+    """GitHub의 최신 CSV에서 시군구 좌표 로드 (선택적 갱신용)"""
+    return Gazetteer.from_csv(url)
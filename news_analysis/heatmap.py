@@ -0,0 +1,113 @@
+"""지명 빈도수 히트맵
+
+지명별 좌표와 히트맵 가중치를 배열 연산으로 한 번에 계산하고, 만들어진 folium
+지도의 HTML을 (빈도표 해시, 가제티어 해시)를 키로 보관한다. 같은 빈도표를 다시
+표시할 때는 folium 지도 생성과 HTML 변환을 건너뛴다.
+"""
+from collections import OrderedDict
+
+import numpy as np
+
+from news_analysis.tokens import frequency_hash
+
+# 지도 표시 크기 (folium_static 기본 동작과 같이 높이에 10px 여백)
+MAP_WIDTH = 400
+MAP_HEIGHT = 600
+
+
+def heat_points(location_counts, gazetteer):
+    """(지명 목록, 위도, 경도, 빈도수) 배열 (좌표가 없는 지명은 제외, 빈도표 순서 유지)"""
+    names = list(location_counts.keys())
+    counts = np.fromiter(location_counts.values(), dtype=np.float64, count=len(names))
+    lat, lon = gazetteer.coordinates(names)
+    valid = ~(np.isnan(lat) | np.isnan(lon))
+    names = [name for name, ok in zip(names, valid) if ok]
+    return names, lat[valid], lon[valid], counts[valid]
+
+
+def heat_weights(counts):
+    """빈도수를 1.0 ~ 5.0 범위의 히트맵 가중치로 정규화"""
+    min_count = counts.min()
+    # 최소값이 최대값과 같은 경우를 대비해 분모 조정
+    count_range = max(1, counts.max() - min_count)
+    return 1.0 + 4.0 * (counts - min_count) / count_range
+
+
+def create_heatmap(location_counts, gazetteer):
+    """지명 빈도수를 기반으로 folium 히트맵 생성 (유효한 좌표가 없으면 None)"""
+    import folium
+    from folium.plugins import HeatMap
+
+    names, lat, lon, counts = heat_points(location_counts, gazetteer)
+    if not names:
+        return None
+
+    # 지도 생성 (한국 중심)
+    m = folium.Map(location=[36.5, 127.5], zoom_start=7, tiles='cartodbpositron')
+
+    # 히트맵 추가 (radius와 blur 조정)
+    HeatMap(
+        np.column_stack([lat, lon, heat_weights(counts)]).tolist(),
+        radius=20,  # 반경 증가
+        blur=15,     # 블러 효과 증가
+        max_zoom=12,  # 최대 줌 레벨 제한
+        min_opacity=0.5,  # 최소 불투명도 설정
+        gradient={0.4: 'blue', 0.6: 'lime', 0.8: 'orange', 1.0: 'red'}  # 그라데이션 색상 지정
+    ).add_to(m)
+
+    # 상위 10개 지명에 마커 추가 (빈도수 내림차순, 같으면 먼저 나온 지명)
+    radius = counts / counts.max() * 10 + 5
+    for i in np.argsort(-counts, kind='stable')[:10]:
+        folium.CircleMarker(
+            location=[lat[i], lon[i]],
+            radius=radius[i],
+            popup=f"{names[i]}: {int(counts[i])}건",
+            color='blue',
+            fill=True,
+            fill_opacity=0.4
+        ).add_to(m)
+
+    return m
+
+
+def render_map_html(m):
+    """folium 지도를 components.html로 표시할 HTML로 변환 (folium_static과 같은 방식)"""
+    import folium
+
+    return folium.Figure().add_child(m).render()
+
+
+class HeatmapCache:
+    """(빈도표 해시, 가제티어 해시) -> 히트맵 HTML LRU 캐시"""
+
+    def __init__(self, max_entries=16):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def html(self, location_counts, gazetteer):
+        """히트맵 HTML (유효한 좌표가 없으면 None)"""
+        key = (frequency_hash(location_counts), gazetteer.fingerprint())
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return self._entries[key]
+
+        self.misses += 1
+        m = create_heatmap(location_counts, gazetteer)
+        html = None if m is None else render_map_html(m)
+        self._entries[key] = html
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return html
+
+    def clear(self):
+        """캐시 항목과 통계 초기화"""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self):
+        """적중/생성 횟수"""
+        return {'hits': self.hits, 'misses': self.misses, 'entries': len(self._entries)}
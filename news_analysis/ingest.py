@@ -0,0 +1,264 @@
+"""업로드 파일 적재 및 정규화
+
+업로드된 바이트의 해시를 키로 정규화된 데이터프레임을 보관하여
+위젯 조작으로 인한 재실행 시 엑셀 파일을 다시 파싱하지 않도록 한다.
+"""
+import datetime
+import hashlib
+import logging
+import os
+from collections import OrderedDict
+
+import pandas as pd
+import pyarrow as pa
+
+from news_analysis.readers import read_news_table
+
+logger = logging.getLogger(__name__)
+
+# 빅카인즈 컬럼명 -> 대시보드 컬럼명
+COLUMN_MAPPING = {
+    "일자": "작성/게시일자",
+    "제목": "기사제목",
+    "기관": "관련기관",
+    "특성추출(가중치순 상위 50개)": "키워드",
+    "URL": "기사링크"
+}
+
+# 정규화 시 한 번 파싱해 두는 게시일(datetime64) 컬럼
+DATE_COLUMN = '게시일'
+
+
+def read_upload_bytes(uploaded_file):
+    """업로드 파일(UploadedFile, BytesIO, 경로 등)에서 원본 바이트를 읽음"""
+    if isinstance(uploaded_file, (bytes, bytearray, memoryview)):
+        return bytes(uploaded_file)
+    if isinstance(uploaded_file, str) or hasattr(uploaded_file, '__fspath__'):
+        with open(uploaded_file, 'rb') as f:
+            return f.read()
+    if hasattr(uploaded_file, 'getvalue'):
+        return uploaded_file.getvalue()
+
+    # 일반 파일 객체는 현재 위치를 보존하면서 전체를 읽음
+    position = uploaded_file.tell() if hasattr(uploaded_file, 'tell') else None
+    if hasattr(uploaded_file, 'seek'):
+        uploaded_file.seek(0)
+    data = uploaded_file.read()
+    if position is not None:
+        uploaded_file.seek(position)
+    return data
+
+
+def content_hash(data):
+    """바이트 내용의 해시(hex) 반환"""
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def _parse_date_strings(text):
+    """yyyymmdd 형식(구분자 허용) 문자열을 datetime64로 변환"""
+    return pd.to_datetime(
+        text.str.replace('[^0-9]', '', regex=True),  # 숫자만 남기기
+        format='%Y%m%d',
+        errors='coerce'
+    )
+
+
+def parse_dates(date_series):
+    """yyyymmdd 형식(구분자 허용) 일자 컬럼을 datetime64로 변환 (유효하지 않은 날짜는 NaT)
+
+    이미 날짜형인 값(엑셀 날짜 셀을 복원한 경우 등)은 그대로 쓰고, 빈 셀 때문에
+    실수형이 된 숫자(20200101.0)는 정수로 바꾼 뒤 문자열로 변환한다.
+    """
+    if pd.api.types.is_datetime64_any_dtype(date_series):
+        return pd.to_datetime(date_series, errors='coerce')
+    if pd.api.types.is_numeric_dtype(date_series):
+        return _parse_date_strings(date_series.astype('Int64').astype(str))
+
+    # 문자열, 숫자, 날짜가 섞인 object 컬럼은 값 종류별로 변환
+    is_date = date_series.map(lambda value: isinstance(value, datetime.date)).astype(bool)
+    numeric = pd.to_numeric(date_series.where(~is_date), errors='coerce')
+    is_number = numeric.notna()
+    text = date_series.astype(str)
+    text[is_number] = numeric[is_number].astype('int64').astype(str)
+    parsed = _parse_date_strings(text)
+    if is_date.any():
+        parsed[is_date] = pd.to_datetime(date_series[is_date])
+    return parsed
+
+
+def normalize_news_df(news_df):
+    """원본 데이터프레임에 컬럼 매핑, 중복 컬럼 제거, '연도'/'게시일' 컬럼 생성을 적용"""
+    # 기존 컬럼 중 매핑된 컬럼만 선택
+    existing_columns = [col for col in COLUMN_MAPPING.keys() if col in news_df.columns]
+    news_df = news_df[existing_columns]
+
+    # 컬럼 이름 변경
+    news_df = news_df.rename(columns=COLUMN_MAPPING)
+
+    # 중복 컬럼 제거
+    news_df = news_df.loc[:, ~news_df.columns.duplicated()]
+
+    # '일자' 컬럼에서 '연도' 컬럼 생성
+    if '작성/게시일자' not in news_df.columns:
+        raise ValueError("일자 컬럼 없음")
+
+    # yyyymmdd 형식에서 앞의 4자리(연도) 추출
+    news_df['연도'] = news_df['작성/게시일자'].astype(str).str[:4]
+
+    # 표시/기간 필터용 날짜는 적재 시 한 번만 파싱
+    news_df[DATE_COLUMN] = parse_dates(news_df['작성/게시일자'])
+    return news_df
+
+
+def load_news_bytes(data, name=None):
+    """업로드 바이트(xlsx/csv/parquet)에서 매핑된 컬럼만 읽어 정규화된 데이터프레임으로 변환"""
+    news_df = read_news_table(data, COLUMN_MAPPING.keys(), name=name)
+    return normalize_news_df(news_df)
+
+
+def load_news_file(path):
+    """파일 경로(또는 파일 객체)에서 정규화된 데이터프레임 로드 (대시보드의 업로드 처리와 동일)"""
+    if isinstance(path, str) or hasattr(path, '__fspath__'):
+        name = os.fspath(path)
+    else:
+        name = getattr(path, 'name', None)
+    return load_news_bytes(read_upload_bytes(path), name=name)
+
+
+class Dataset:
+    """캐시에 보관되는 데이터셋 항목
+
+    검색 색인처럼 데이터프레임에서 한 번만 만들면 되는 파생 구조를
+    이름별로 함께 보관하여, 데이터셋이 캐시에서 제거될 때 같이 정리되도록 한다.
+    """
+
+    def __init__(self, key, news_df):
+        self.key = key
+        self.news_df = news_df
+        self._derived = {}
+
+    def derived(self, name, builder):
+        """이름에 해당하는 파생 구조를 반환 (없으면 builder(news_df)로 생성)"""
+        if name not in self._derived:
+            self._derived[name] = builder(self.news_df)
+        return self._derived[name]
+
+    def has_derived(self, name):
+        """파생 구조가 이미 만들어졌는지 여부"""
+        return name in self._derived
+
+    def extend(self, new_rows, key):
+        """기사를 뒤에 이어 붙이고 데이터셋 키를 바꿈
+
+        extend(news_df, new_rows) 메서드가 있는 파생 구조는 새 기사 분량만 갱신하고,
+        없는 구조는 삭제하여 다음 사용 시 다시 만들도록 한다.
+        """
+        n_before = len(self.news_df)
+        self.news_df = pd.concat([self.news_df, new_rows], ignore_index=True)
+        self.key = key
+        new_rows = self.news_df.iloc[n_before:]
+        for name, derived in list(self._derived.items()):
+            if hasattr(derived, 'extend'):
+                derived.extend(self.news_df, new_rows)
+            else:
+                del self._derived[name]
+
+
+class IngestCache:
+    """내용 해시 기반의 정규화 데이터셋 LRU 캐시
+
+    snapshot_store가 주어지면 메모리 캐시에 없는 데이터를 파싱하기 전에
+    디스크 스냅샷을 먼저 확인하고, 새로 파싱한 결과는 스냅샷으로 저장한다.
+    반환되는 데이터프레임은 캐시와 공유되므로 호출 측에서 수정하지 않아야 한다.
+    """
+
+    def __init__(self, max_entries=4, snapshot_store=None):
+        self.max_entries = max_entries
+        self.snapshot_store = snapshot_store
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.snapshot_hits = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def get(self, key):
+        """키에 해당하는 데이터셋 반환 (없으면 None)"""
+        dataset = self._entries.get(key)
+        if dataset is None:
+            return None
+        self._entries.move_to_end(key)
+        return dataset
+
+    def put(self, key, news_df):
+        """데이터프레임을 데이터셋으로 저장 후 한도를 넘으면 가장 오래된 항목 제거"""
+        dataset = Dataset(key, news_df)
+        self._entries[key] = dataset
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return dataset
+
+    def load_dataset(self, uploaded_file, loader=load_news_bytes):
+        """업로드 파일을 해시하여 캐시된 데이터셋을 반환하고, 없으면 loader로 파싱"""
+        data = read_upload_bytes(uploaded_file)
+        key = content_hash(data)
+
+        dataset = self.get(key)
+        if dataset is not None:
+            self.hits += 1
+            return dataset
+
+        self.misses += 1
+        if self.snapshot_store is not None:
+            try:
+                news_df = self.snapshot_store.load(key)
+            except (OSError, pa.ArrowInvalid) as e:
+                logger.warning("스냅샷을 읽지 못했습니다 (%s): %s", key, e)
+                news_df = None
+                if isinstance(e, pa.ArrowInvalid):
+                    # 잘리거나 손상된 스냅샷은 지우고 다시 파싱한 결과로 새로 저장
+                    try:
+                        self.snapshot_store.delete(key)
+                    except OSError:
+                        pass
+            if news_df is not None:
+                self.snapshot_hits += 1
+                return self.put(key, news_df)
+
+        news_df = loader(data)
+        dataset = self.put(key, news_df)
+        if self.snapshot_store is not None:
+            try:
+                self.snapshot_store.save(key, news_df)
+            except OSError as e:
+                # 스냅샷은 캐시일 뿐이므로 저장하지 못해도 메모리의 데이터로 계속 진행
+                logger.warning("스냅샷을 저장하지 못했습니다 (%s): %s", key, e)
+        return dataset
+
+    def load(self, uploaded_file, loader=load_news_bytes):
+        """업로드 파일에 해당하는 정규화 데이터프레임 반환"""
+        return self.load_dataset(uploaded_file, loader).news_df
+
+    def clear(self):
+        """캐시 항목과 통계 초기화"""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+        self.snapshot_hits = 0
+
+    def stats(self):
+        """적중/실패 횟수(실패 중 스냅샷 적중 포함)와 현재 항목 수"""
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'snapshot_hits': self.snapshot_hits,
+            'entries': len(self._entries),
+            'max_entries': self.max_entries,
+            'hit_rate': self.hits / total if total else 0.0,
+        }
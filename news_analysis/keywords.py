@@ -0,0 +1,28 @@
+"""정수 코드 키워드 저장소
+
+'키워드' 컬럼을 데이터셋당 한 번 토큰화하여 키워드 어휘와 CSR 형태의 기사별
+키워드 번호 배열(offsets + int32 ids)로 보관한다. 검색 등으로 걸러낸 기사의
+키워드 빈도수는 해당 기사의 번호 구간을 모아 np.bincount로 세고, 상위 N개는
+np.argpartition으로 고른다.
+"""
+from news_analysis.tokens import CodedLists, factorize_stripped, split_list_column
+
+
+class KeywordStore(CodedLists):
+    """키워드 어휘(vocab)와 기사별 키워드 번호 (기사 i의 번호: ids[offsets[i]:offsets[i + 1]])
+
+    키워드는 공백을 제거하고 두 글자 이상인 것만 사용하며, 같은 기사에 여러 번
+    나온 키워드는 나온 횟수만큼 센다(기존 Counter 방식과 동일).
+    """
+
+    def __init__(self, keyword_series, min_length=2):
+        rows, parts = split_list_column(keyword_series)
+        codes, vocab = factorize_stripped(parts, min_length=min_length)
+        # split_list_column은 행 순서대로 펼치므로 rows는 이미 정렬되어 있음
+        lists = CodedLists.from_pairs(rows, codes, vocab, len(keyword_series))
+        super().__init__(lists.vocab, lists.offsets, lists.ids)
+
+    @classmethod
+    def from_frame(cls, news_df, column='키워드'):
+        """뉴스 데이터프레임의 키워드 컬럼으로 생성"""
+        return cls(news_df[column])
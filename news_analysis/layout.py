@@ -0,0 +1,219 @@
+"""기관 네트워크 노드 배치
+
+힘 기반(Fruchterman-Reingold) 배치를 NumPy 배열 연산으로 계산한다. x/y 좌표를
+따로 두고 float32 노드 쌍 행렬로 척력과 인력을 한 번에 구하므로 노드 수백 개도
+빠르게 배치할 수 있다.
+
+LayoutCache는 부분 그래프의 노드/엣지 서명을 키로 배치 결과를 보관한다.
+같은 그래프는 다시 계산하지 않고, 슬라이더로 노드가 추가/삭제된 그래프는
+겹치는 노드가 가장 많은 이전 배치에서 시작하여 짧게 다듬는다(웜 스타트).
+"""
+import hashlib
+from collections import OrderedDict
+
+import networkx as nx
+import numpy as np
+
+# 배치 방식: 이름 -> 설명 (첫 항목이 기본값)
+LAYOUT_METHODS = {
+    'spring': 'networkx spring_layout',
+    'numpy': 'NumPy 힘 기반 배치 (빠름)',
+}
+
+
+def graph_arrays(G, weight='weight'):
+    """그래프를 (노드 목록, 엣지 양끝 번호 배열 2개, 가중치 배열)로 변환"""
+    nodes = list(G.nodes())
+    index = {node: i for i, node in enumerate(nodes)}
+    # 부분 그래프 뷰에서 list()는 길이 계산에 엣지를 한 번 더 순회하므로 컴프리헨션 사용
+    if weight:
+        edges = [edge for edge in G.edges(data=weight, default=1)]
+    else:
+        edges = [(a, b, 1) for a, b in G.edges()]
+    rows = np.fromiter((index[a] for a, _, _ in edges), dtype=np.int64, count=len(edges))
+    cols = np.fromiter((index[b] for _, b, _ in edges), dtype=np.int64, count=len(edges))
+    weights = np.fromiter((w for _, _, w in edges), dtype=np.float64, count=len(edges))
+    return nodes, rows, cols, weights
+
+
+def graph_signature(nodes, rows, cols, weights):
+    """graph_arrays 결과의 노드/엣지(가중치 포함) 구성 해시 (노드·엣지 순서와 무관)"""
+    names = [str(node) for node in nodes]
+    order = sorted(range(len(names)), key=names.__getitem__)
+    rank = np.empty(len(names), dtype=np.int64)
+    rank[order] = np.arange(len(names))
+
+    a, b = rank[rows], rank[cols]
+    lo, hi = np.minimum(a, b), np.maximum(a, b)
+    edge_order = np.lexsort((hi, lo))
+
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update('\0'.join(names[i] for i in order).encode('utf-8'))
+    digest.update(lo[edge_order].tobytes())
+    digest.update(hi[edge_order].tobytes())
+    digest.update(weights[edge_order].tobytes())
+    return digest.hexdigest()
+
+
+def rescale(pos):
+    """좌표를 중심이 0이고 가장 큰 절댓값이 1이 되도록 조정 (spring_layout과 같은 범위)"""
+    pos = pos - pos.mean(axis=0)
+    lim = np.abs(pos).max() if len(pos) else 0
+    if lim > 0:
+        pos /= lim
+    return pos
+
+
+def force_layout(G, pos=None, iterations=50, temperature=0.1, threshold=1e-4, seed=42, weight='weight', arrays=None):
+    """NumPy로 계산한 힘 기반 배치 {노드: (x, y)}
+
+    pos에 일부 노드의 시작 좌표({노드: (x, y)})를 주면 그 위치에서 시작한다.
+    temperature는 한 번에 움직일 수 있는 최대 거리(좌표 범위 대비 비율)이다.
+    arrays에 graph_arrays 결과를 주면 그래프를 다시 순회하지 않는다.
+    """
+    nodes, rows, cols, weights = arrays if arrays is not None else graph_arrays(G, weight)
+    n = len(nodes)
+    if n == 0:
+        return {}
+    if n == 1:
+        return {nodes[0]: np.zeros(2)}
+
+    adjacency = np.zeros((n, n), dtype=np.float32)
+    adjacency[rows, cols] = weights
+    adjacency[cols, rows] = weights
+
+    rng = np.random.default_rng(seed)
+    xy = rng.random((n, 2), dtype=np.float32)
+    if pos:
+        for i, node in enumerate(nodes):
+            if node in pos:
+                xy[i] = pos[node]
+
+    k = np.float32(np.sqrt(1.0 / n))
+    t = float(np.ptp(xy, axis=0).max()) * temperature
+    dt = t / (iterations + 1)
+    x, y = xy[:, 0].copy(), xy[:, 1].copy()
+    for _ in range(iterations):
+        dx = x[:, None] - x[None, :]
+        dy = y[:, None] - y[None, :]
+        distance = np.sqrt(dx * dx + dy * dy)
+        np.maximum(distance, 0.01, out=distance)
+        # 척력 k²/d - 인력 A·d²/k 를 방향 벡터(dx/d, dy/d)에 곱한 값
+        force = k * k / (distance * distance) - adjacency * distance / k
+        disp_x = (dx * force).sum(axis=1)
+        disp_y = (dy * force).sum(axis=1)
+        length = np.maximum(np.sqrt(disp_x * disp_x + disp_y * disp_y), 0.01)
+        step_x = disp_x * (t / length)
+        step_y = disp_y * (t / length)
+        x += step_x
+        y += step_y
+        t -= dt
+        if np.sqrt((step_x * step_x + step_y * step_y).sum()) / n < threshold:
+            break
+
+    xy = rescale(np.column_stack([x, y]).astype(np.float64))
+    return dict(zip(nodes, xy))
+
+
+def spring_layout(G, pos=None, iterations=50, seed=42):
+    """networkx spring_layout (시작 좌표가 주어진 노드는 그 위치에서 시작)"""
+    if pos:
+        pos = {node: p for node, p in pos.items() if node in G}
+    return nx.spring_layout(G, pos=pos or None, iterations=iterations, seed=seed)
+
+
+def warm_start_positions(G, previous):
+    """이전 배치에서 겹치는 노드 좌표를 가져오고, 새 노드는 이웃 좌표의 평균 근처에 둠"""
+    pos = {node: previous[node] for node in G.nodes() if node in previous}
+    rng = np.random.default_rng(0)
+    for node in G.nodes():
+        if node in pos:
+            continue
+        neighbors = [pos[v] for v in G.neighbors(node) if v in pos]
+        if neighbors:
+            center = np.mean(neighbors, axis=0)
+            pos[node] = center + rng.normal(scale=0.05, size=2)
+        else:
+            pos[node] = rng.uniform(-1, 1, size=2)
+    return pos
+
+
+class LayoutCache:
+    """그래프 서명 -> 노드 배치 LRU 캐시 (웜 스타트 지원)
+
+    캐시에 없는 그래프는 노드가 가장 많이 겹치는 캐시 배치가 전체 노드의
+    min_overlap 이상이면 그 좌표에서 warm_iterations번만 다듬고, 아니면
+    처음부터 iterations번 계산한다.
+    """
+
+    def __init__(self, max_entries=32, iterations=50, warm_iterations=15, warm_temperature=0.02, min_overlap=0.5):
+        self.max_entries = max_entries
+        self.iterations = iterations
+        self.warm_iterations = warm_iterations
+        self.warm_temperature = warm_temperature
+        self.min_overlap = min_overlap
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.warm_starts = 0
+        self.misses = 0
+
+    def layout(self, G, method='spring'):
+        """G의 노드 배치 {노드: (x, y)} (캐시 적중 -> 웜 스타트 -> 새로 계산 순)"""
+        arrays = graph_arrays(G)
+        key = (method, graph_signature(*arrays))
+        pos = self._entries.get(key)
+        if pos is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return pos
+
+        previous = self._warm_start_base(G, method)
+        if previous is not None:
+            self.warm_starts += 1
+            init = warm_start_positions(G, previous)
+            if method == 'spring':
+                pos = spring_layout(G, pos=init, iterations=self.warm_iterations)
+            else:
+                pos = force_layout(G, pos=init, iterations=self.warm_iterations,
+                                   temperature=self.warm_temperature, arrays=arrays)
+        else:
+            self.misses += 1
+            if method == 'spring':
+                pos = spring_layout(G, iterations=self.iterations)
+            else:
+                pos = force_layout(G, iterations=self.iterations, arrays=arrays)
+
+        self._entries[key] = pos
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return pos
+
+    def _warm_start_base(self, G, method):
+        """같은 방식의 캐시 배치 중 G와 노드가 가장 많이 겹치는 것 (부족하면 None)"""
+        nodes = list(G.nodes())
+        best, best_overlap = None, 0
+        for (cached_method, _), pos in reversed(self._entries.items()):
+            if cached_method != method:
+                continue
+            overlap = sum(1 for node in nodes if node in pos)
+            if overlap > best_overlap:
+                best, best_overlap = pos, overlap
+        if best is None or best_overlap < self.min_overlap * len(nodes):
+            return None
+        return best
+
+    def clear(self):
+        """캐시 항목과 통계 초기화"""
+        self._entries.clear()
+        self.hits = 0
+        self.warm_starts = 0
+        self.misses = 0
+
+    def stats(self):
+        """적중/웜 스타트/새로 계산 횟수"""
+        return {
+            'hits': self.hits,
+            'warm_starts': self.warm_starts,
+            'misses': self.misses,
+            'entries': len(self._entries),
+        }
@@ -0,0 +1,253 @@
+"""관련기관 문자열에서 시군구 지명 추출
+
+시군구 목록(가제티어)으로 Aho-Corasick 오토마톤을 한 번 만들어 두고,
+기관명마다 한 번의 순회로 모든 지명 후보를 찾는다. 여러 지명이 나오면
+기존 방식과 같이 가제티어 순서상 가장 앞선 지명을 선택한다.
+
+같은 기관명(OO시청, OO군청 등)은 기사와 데이터셋을 가리지 않고 반복되므로,
+고유 기관명별 변환 결과를 디스크의 변환표(OrgResolutionTable)에 누적해 두고
+빈도수는 기관 번호별 개수를 변환표와 결합하여 계산한다.
+"""
+import hashlib
+import itertools
+import os
+import re
+from collections import deque
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.ipc as ipc
+
+from news_analysis.snapshot import default_cache_dir
+from news_analysis.tokens import CodedLists, split_list_column
+
+# 제외할 일반적인 구 이름 목록
+EXCLUDED_DISTRICTS = {'북구', '남구', '동구', '서구', '중구'}
+
+# 괄호 안의 내용 제거용 (예: '서울시청(서울특별시)' -> '서울시청')
+_PAREN_RE = re.compile(r'\([^)]*\)')
+
+
+def location_patterns(location_names):
+    """검색할 (시군구명, 기본 지명) 목록을 가제티어 순서대로 생성
+
+    제외할 구 이름이 포함된 시군구는 빼고, 시/군/구 글자를 지운 이름을 기본 지명으로 쓴다.
+    """
+    return [
+        (loc, loc.replace('시', '').replace('군', '').replace('구', ''))
+        for loc in location_names
+        if not any(excluded in loc for excluded in EXCLUDED_DISTRICTS)
+    ]
+
+
+class AhoCorasick:
+    """여러 패턴을 한 번의 순회로 찾는 Aho-Corasick 오토마톤
+
+    각 상태에는 그 상태에서 끝나는 패턴(실패 링크로 이어지는 패턴 포함) 중
+    가장 작은 우선순위를 미리 계산해 둔다.
+    """
+
+    def __init__(self, patterns):
+        """patterns: (문자열, 우선순위) 목록 (우선순위가 작을수록 먼저 선택)"""
+        self._goto = [{}]
+        self._best = [None]
+
+        for text, priority in patterns:
+            if not text:
+                continue
+            state = 0
+            for ch in text:
+                nxt = self._goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[state][ch] = nxt
+                    self._goto.append({})
+                    self._best.append(None)
+                state = nxt
+            if self._best[state] is None or priority < self._best[state]:
+                self._best[state] = priority
+
+        # 너비 우선으로 실패 링크를 계산하고 출력 우선순위를 전파
+        self._fail = [0] * len(self._goto)
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fail = self._fail[state]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                target = self._goto[fail].get(ch, 0)
+                self._fail[nxt] = target if target != nxt else 0
+                inherited = self._best[self._fail[nxt]]
+                if inherited is not None and (self._best[nxt] is None or inherited < self._best[nxt]):
+                    self._best[nxt] = inherited
+
+    def best_match(self, text):
+        """text에 나타나는 패턴 중 가장 작은 우선순위 (없으면 None)"""
+        goto, fail, best = self._goto, self._fail, self._best
+        state = 0
+        found = None
+        for ch in text:
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            priority = best[state]
+            if priority is not None and (found is None or priority < found):
+                found = priority
+                if found == 0:
+                    break
+        return found
+
+
+class LocationMatcher:
+    """기관명 -> 시군구명 변환기 (가제티어당 한 번 생성)"""
+
+    def __init__(self, location_names):
+        self.location_names = list(location_names)
+        patterns = location_patterns(self.location_names)
+        self.locations = [loc for loc, _ in patterns]
+        self._automaton = AhoCorasick(
+            (base_name, order) for order, (_, base_name) in enumerate(patterns)
+        )
+
+    def match(self, org):
+        """정제된 기관명에서 찾은 시군구명 (없으면 None)"""
+        order = self._automaton.best_match(org)
+        return None if order is None else self.locations[order]
+
+
+def clean_org_name(org):
+    """기관명에서 괄호 안의 내용을 지우고 앞뒤 공백 제거"""
+    if '(' in org:
+        org = _PAREN_RE.sub('', org)
+    return org.strip()
+
+
+def gazetteer_fingerprint(location_names):
+    """시군구 목록과 제외 규칙의 해시 (변환표 파일 구분용)"""
+    digest = hashlib.blake2b(digest_size=8)
+    for name in location_names:
+        digest.update(name.encode('utf-8') + b'\0')
+    digest.update(','.join(sorted(EXCLUDED_DISTRICTS)).encode('utf-8'))
+    return digest.hexdigest()
+
+
+class OrgResolutionTable:
+    """정제된 기관명 -> 시군구명 변환표
+
+    처음 보는 기관명만 오토마톤으로 변환하여 표에 추가하고, path가 있으면
+    디스크에 저장해 다른 데이터셋과 세션에서도 재사용한다. 지명이 없는 기관명도
+    None으로 저장하여 다시 검사하지 않는다.
+    """
+
+    def __init__(self, matcher, path=None):
+        self.matcher = matcher
+        self.path = path
+        self._table = {}
+        self._dirty = False
+        if path is not None:
+            self._read()
+
+    @classmethod
+    def for_gazetteer(cls, location_names, root=None):
+        """가제티어별 기본 위치의 변환표를 열기"""
+        location_names = list(location_names)
+        root = root or default_cache_dir('resolution')
+        os.makedirs(root, exist_ok=True)
+        path = os.path.join(root, f'org_locations-{gazetteer_fingerprint(location_names)}.arrow')
+        return cls(LocationMatcher(location_names), path)
+
+    def __len__(self):
+        return len(self._table)
+
+    def resolve(self, org_names):
+        """정제된 기관명 목록의 시군구명 목록 (지명이 없으면 None)"""
+        table = self._table
+        locations = []
+        for org in org_names:
+            if org in table:
+                location = table[org]
+            else:
+                location = self.matcher.match(org)
+                table[org] = location
+                self._dirty = True
+            locations.append(location)
+        return locations
+
+    def entries(self, start=0):
+        """start번째 이후에 추가된 {기관명: 시군구명} (추가된 순서)"""
+        return dict(itertools.islice(self._table.items(), start, None))
+
+    def update(self, entries):
+        """다른 프로세스에서 변환한 {기관명: 시군구명} 중 처음 보는 기관명만 추가"""
+        for org, location in entries.items():
+            if org not in self._table:
+                self._table[org] = location
+                self._dirty = True
+
+    def save(self):
+        """새 기관명이 추가되었으면 디스크에 저장 (저장했으면 True)"""
+        if self.path is None or not self._dirty:
+            return False
+        table = pa.table({
+            'org': pa.array(list(self._table.keys()), pa.string()),
+            'location': pa.array(list(self._table.values()), pa.string()).dictionary_encode(),
+        })
+        tmp_path = f'{self.path}.{os.getpid()}.tmp'
+        with pa.OSFile(tmp_path, 'wb') as sink:
+            with ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+        os.replace(tmp_path, self.path)
+        self._dirty = False
+        return True
+
+    def _read(self):
+        """디스크의 변환표 로드 (없거나 손상되었으면 빈 표로 시작)"""
+        try:
+            with pa.memory_map(self.path, 'r') as source:
+                table = ipc.open_file(source).read_all()
+        except (FileNotFoundError, pa.ArrowInvalid):
+            return
+        self._table = dict(zip(
+            table.column('org').to_pylist(),
+            table.column('location').to_pylist(),
+        ))
+
+
+def org_location_lists(org_series, table):
+    """관련기관 시리즈에서 기사별 지명 번호 목록 생성 (어휘: table.matcher.locations)
+
+    기관 언급을 고유 기관명 번호로 바꾼 뒤 고유 기관명만 변환표로 지명을 찾는다.
+    지명이 없는 언급은 빼고, 같은 기사의 같은 지명은 언급 횟수만큼 남긴다.
+    """
+    locations = table.matcher.locations
+    orgs = org_series.where([isinstance(value, str) for value in org_series])
+    rows, mentions = split_list_column(orgs)
+
+    # 기관 언급 -> 고유 기관명 번호
+    codes, uniques = pd.factorize(mentions, sort=False)
+    names = [clean_org_name(org) for org in uniques]
+
+    # 고유 기관명별 지명 번호 (-1: 지명 없음 또는 빈 기관명)
+    location_index = {location: i for i, location in enumerate(locations)}
+    org_locations = np.array([
+        -1 if location is None else location_index[location]
+        for location in table.resolve(names)
+    ], dtype=np.int64)
+    org_locations[[not org.strip() for org in uniques]] = -1
+
+    mention_locations = org_locations[codes] if len(codes) else codes.astype(np.int64)
+    return CodedLists.from_pairs(rows, mention_locations, locations, len(org_series))
+
+
+def get_org_location_frequency(org_series, gazetteer, matcher=None, table=None):
+    """관련기관 시리즈에서 지명 빈도수를 계산
+
+    gazetteer는 시군구명을 순서대로 내놓는 객체(Gazetteer 또는 좌표 딕셔너리)이다.
+    결과 순서는 지명이 처음 등장한 순서를 따른다.
+    """
+    if table is None:
+        table = OrgResolutionTable(matcher or LocationMatcher(list(gazetteer)))
+    return org_location_lists(org_series, table).frequency()
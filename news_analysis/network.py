@@ -0,0 +1,77 @@
+"""기관 동시출현 네트워크
+
+기사별 기관 번호 목록(CodedLists)을 기사 × 기관 출현 여부 SciPy CSR 희소
+행렬 A로 만들고, 기관 쌍의 동시출현 횟수를 AᵀA로 한 번에 계산한다. 임계값(기본 2회 이상)은 희소 결과에 바로
+적용하여 살아남은 엣지만 networkx 그래프로 넘긴다.
+"""
+import networkx as nx
+import numpy as np
+from scipy import sparse
+
+from news_analysis.tokens import CodedLists, factorize_stripped, first_occurrences, split_list_column
+
+
+def org_lists(org_series):
+    """관련기관 시리즈에서 기사별 기관 번호 목록 생성
+
+    기관명은 공백을 제거하고 두 글자 이상인 것만 사용하며, 같은 기사에
+    여러 번 나온 기관은 한 번으로 센다. 행 번호는 시리즈의 위치를 따른다.
+    """
+    rows, parts = split_list_column(org_series)
+    org_ids, names = factorize_stripped(parts, min_length=2)
+    keep = org_ids >= 0
+    rows, org_ids = rows[keep], org_ids[keep]
+
+    # 기사 안의 중복 기관 제거 (기사 안에서 처음 나온 순서 유지, 기사를 뒤에 추가해도 같은 순서)
+    n_names = max(len(names), 1)
+    first = first_occurrences(rows * n_names + org_ids)
+    return CodedLists.from_pairs(rows[first], org_ids[first], names, len(org_series))
+
+
+def incidence_matrix(lists, rows=None):
+    """기관 번호 목록을 기사 × 기관 이진 CSR 행렬로 변환 (rows가 있으면 해당 기사만)"""
+    incidence = sparse.csr_matrix(
+        (np.ones(len(lists.ids), dtype=np.int32), lists.ids, lists.offsets),
+        shape=(len(lists), len(lists.vocab)),
+    )
+    return incidence if rows is None else incidence[np.asarray(rows, dtype=np.int64)]
+
+
+def build_incidence(org_series):
+    """관련기관 시리즈에서 (기사 × 기관 이진 CSR 행렬, 기관명 목록) 생성"""
+    lists = org_lists(org_series)
+    return incidence_matrix(lists), lists.vocab
+
+
+def co_occurrence_edges(incidence, min_weight=2, workers=1):
+    """이진 출현 행렬에서 동시출현 min_weight회 이상인 기관 쌍 (i, j, 가중치) 배열 ((i, j) 순)
+
+    workers가 2 이상이면 기사 구간별 부분 행렬을 프로세스 풀에서 계산하여 더한다.
+    """
+    if workers is not None and workers > 1:
+        from news_analysis.parallel import chunked_co_occurrence
+        counts = chunked_co_occurrence(incidence, workers)
+    else:
+        counts = sparse.triu(incidence.T @ incidence, k=1).tocsr()
+    counts.sort_indices()
+    counts = counts.tocoo()
+    keep = counts.data >= min_weight
+    return counts.row[keep], counts.col[keep], counts.data[keep]
+
+
+def org_graph(incidence, names, min_weight=2, workers=1):
+    """기사 × 기관 출현 행렬에서 동시출현 네트워크 그래프 생성"""
+    # 엣지 순서는 (기관 i, 기관 j) 기준으로 고정되어 결과를 재현할 수 있음
+    rows, cols, weights = co_occurrence_edges(incidence, min_weight, workers)
+    G = nx.Graph()
+    G.add_weighted_edges_from(
+        (names[i], names[j], w)
+        for i, j, w in zip(rows.tolist(), cols.tolist(), weights.tolist())
+    )
+    return G
+
+
+def build_org_graph(org_series, min_weight=2):
+    """관련기관 시리즈에서 동시출현 네트워크 그래프 생성"""
+    incidence, names = build_incidence(org_series)
+    return org_graph(incidence, names, min_weight)
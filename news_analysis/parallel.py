@@ -0,0 +1,158 @@
+"""기사 구간별 분할 처리(맵-리듀스)
+
+아주 큰 코퍼스에서는 관련기관/키워드 목록 분리, 기관명 -> 지명 변환, 동시출현
+행렬 계산을 기사 범위를 나눈 구간마다 따로 처리한 뒤 합친다.
+
+- 맵: 구간마다 기사별 번호 목록(CodedLists) 또는 부분 동시출현 행렬을 만든다.
+  workers가 2 이상이면 프로세스 풀에서 처리한다.
+- 리듀스: 번호 목록은 구간 순서대로 CodedLists.extend로 이어 붙이고(어휘는 처음
+  나온 순서 유지), 동시출현 행렬은 더한다.
+
+구간 순서대로 합치므로 결과(어휘 순서, 번호, 빈도수)는 전체를 한 번에 처리한
+결과와 같다. workers=1이어도 구간별로 처리하므로 최대 메모리 사용량이 줄어든다.
+"""
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from scipy import sparse
+
+# 구간당 기사 수
+DEFAULT_CHUNK_ROWS = 100_000
+
+# 작업 프로세스 수 -> 프로세스 풀 (재실행마다 프로세스를 새로 띄우지 않도록 재사용)
+_executors = {}
+
+# 작업 프로세스별 (가제티어 지명 목록, 변환표 경로) -> 기관명 -> 지명 변환표
+_worker_tables = {}
+
+
+def cpu_count():
+    """사용 가능한 CPU 수"""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+def chunk_bounds(n_rows, chunk_rows=DEFAULT_CHUNK_ROWS):
+    """기사 범위를 chunk_rows개씩 나눈 (시작, 끝) 목록 (기사가 없으면 빈 목록)"""
+    chunk_rows = max(int(chunk_rows), 1)
+    return [(start, min(start + chunk_rows, n_rows)) for start in range(0, n_rows, chunk_rows)]
+
+
+def get_executor(workers):
+    """작업 프로세스 workers개의 프로세스 풀 (spawn 방식, Streamlit 스레드에서도 안전)"""
+    executor = _executors.get(workers)
+    if executor is None:
+        executor = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn'))
+        _executors[workers] = executor
+    return executor
+
+
+def shutdown_executors():
+    """만들어 둔 프로세스 풀 종료"""
+    for executor in _executors.values():
+        executor.shutdown(cancel_futures=True)
+    _executors.clear()
+
+
+def map_chunks(func, tasks, workers=1):
+    """tasks의 각 인자 튜플에 func를 적용한 결과 목록 (입력 순서, workers가 1이거나 작업이 하나면 현재 프로세스)"""
+    tasks = list(tasks)
+    if workers is None or workers <= 1 or len(tasks) <= 1:
+        return [func(*args) for args in tasks]
+    return list(get_executor(workers).map(func, *zip(*tasks)))
+
+
+def concat_lists(parts):
+    """구간별 번호 목록을 순서대로 이어 붙인 번호 목록 (첫 구간의 클래스 유지)"""
+    merged = parts[0]
+    for part in parts[1:]:
+        merged.extend(part)
+    return merged
+
+
+def _series_chunks(series, chunk_rows):
+    bounds = chunk_bounds(len(series), chunk_rows) or [(0, 0)]
+    return [series.iloc[start:stop] for start, stop in bounds]
+
+
+def _org_lists_chunk(org_series):
+    from news_analysis.network import org_lists
+    return org_lists(org_series)
+
+
+def _keyword_chunk(keyword_series):
+    from news_analysis.keywords import KeywordStore
+    return KeywordStore(keyword_series)
+
+
+def _location_chunk(org_series, location_names, path=None, known=None):
+    """작업 프로세스에서 지명 번호 목록과 이번 구간에서 변환한 {기관명: 지명}을 반환
+
+    path가 있으면 저장된 변환표를 읽어 시작하고, known으로 받은 {기관명: 지명}도 다시 변환하지 않는다.
+    """
+    from news_analysis.locations import LocationMatcher, OrgResolutionTable, org_location_lists
+    table = _worker_tables.get((location_names, path))
+    if table is None:
+        table = OrgResolutionTable(LocationMatcher(list(location_names)), path)
+        _worker_tables[(location_names, path)] = table
+    if known:
+        table.update(known)
+    before = len(table)
+    lists = org_location_lists(org_series, table)
+    return lists, table.entries(start=before)
+
+
+def _co_occurrence_chunk(incidence):
+    return sparse.triu(incidence.T @ incidence, k=1).tocsr()
+
+
+def chunked_org_lists(org_series, workers=1, chunk_rows=DEFAULT_CHUNK_ROWS):
+    """network.org_lists의 구간별 처리 버전 (결과 동일)"""
+    return concat_lists(map_chunks(_org_lists_chunk, [(s,) for s in _series_chunks(org_series, chunk_rows)], workers))
+
+
+def chunked_keyword_store(keyword_series, workers=1, chunk_rows=DEFAULT_CHUNK_ROWS):
+    """KeywordStore의 구간별 처리 버전 (결과 동일)"""
+    return concat_lists(map_chunks(_keyword_chunk, [(s,) for s in _series_chunks(keyword_series, chunk_rows)], workers))
+
+
+def chunked_org_location_lists(org_series, table, workers=1, chunk_rows=DEFAULT_CHUNK_ROWS):
+    """locations.org_location_lists의 구간별 처리 버전 (결과 동일)
+
+    작업 프로세스에서 변환한 기관명은 table에 추가하므로 table.save()로 저장할 수 있다.
+    """
+    from news_analysis.locations import org_location_lists
+
+    chunks = _series_chunks(org_series, chunk_rows)
+    if workers is None or workers <= 1 or len(chunks) <= 1:
+        return concat_lists([org_location_lists(chunk, table) for chunk in chunks])
+
+    # 작업 프로세스가 이미 변환한 기관명을 다시 변환하지 않도록, 저장된 변환표는 경로를,
+    # 디스크에 없는 변환표는 내용을 넘김
+    path = table.path
+    if path is not None:
+        try:
+            table.save()
+        except OSError:
+            path = None
+    known = None if path is not None else table.entries()
+    location_names = tuple(table.matcher.location_names)
+    results = map_chunks(_location_chunk, [(chunk, location_names, path, known) for chunk in chunks], workers)
+    for _, entries in results:
+        table.update(entries)
+    return concat_lists([lists for lists, _ in results])
+
+
+def chunked_co_occurrence(incidence, workers=1, chunk_rows=DEFAULT_CHUNK_ROWS):
+    """기사 구간별 부분 동시출현 행렬 triu(AᵀA)의 합 (CSR, 정수 합이므로 결과 동일)"""
+    bounds = chunk_bounds(incidence.shape[0], chunk_rows)
+    if not bounds:
+        return _co_occurrence_chunk(incidence)
+    parts = map_chunks(_co_occurrence_chunk, [(incidence[start:stop],) for start, stop in bounds], workers)
+    total = parts[0]
+    for part in parts[1:]:
+        total = total + part
+    return total
@@ -0,0 +1,320 @@
+"""빅카인즈 내보내기 파일 리더
+
+본문, 기고자 등 분석에 쓰지 않는 넓은 텍스트 컬럼은 읽지 않고
+매핑된 컬럼만 불러온다. xlsx는 시트 XML을 스트리밍으로 직접 파싱하며,
+csv/parquet는 pyarrow의 멀티스레드 파서를 사용한다.
+"""
+import codecs
+import csv
+import html
+import io
+import posixpath
+import re
+import zipfile
+import xml.etree.ElementTree as ET
+
+import pandas as pd
+
+_NS = '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}'
+_REL_NS = '{http://schemas.openxmlformats.org/officeDocument/2006/relationships}'
+_PKG_REL_NS = '{http://schemas.openxmlformats.org/package/2006/relationships}'
+
+# 시트/공유 문자열 XML 스캔용 패턴 (접두사 없는 기본 네임스페이스 기준)
+_REF_RE = re.compile(rb'\br=["\']([A-Z]+)([0-9]+)["\']')
+_TYPE_RE = re.compile(rb'\bt=["\'](\w+)["\']')
+_VALUE_RE = re.compile(rb'<v>(.*?)</v>', re.S)
+_TEXT_RE = re.compile(rb'<t(?:\s[^>]*)?>(.*?)</t>', re.S)
+_PHONETIC_RE = re.compile(rb'<rPh\b.*?</rPh>', re.S)
+
+# 엑셀 날짜 일련번호 기준일 (일자 컬럼이 날짜 서식인 경우 사용)
+_EXCEL_EPOCH = pd.Timestamp('1899-12-30')
+
+
+def detect_format(data, name=None):
+    """파일 이름 또는 내용의 시그니처로 형식(xlsx/csv/parquet) 판별"""
+    if name:
+        ext = posixpath.splitext(str(name).lower())[1].lstrip('.')
+        if ext in ('xlsx', 'csv', 'parquet'):
+            return ext
+    if data[:4] == b'PAR1':
+        return 'parquet'
+    if data[:4] == b'PK\x03\x04':
+        return 'xlsx'
+    return 'csv'
+
+
+def read_news_table(data, columns, fmt=None, name=None):
+    """원본 바이트에서 지정한 컬럼만 읽어 데이터프레임으로 반환
+
+    파일에 없는 컬럼은 건너뛰며, 결과 컬럼 순서는 파일의 순서를 따른다.
+    """
+    columns = list(columns)
+    fmt = fmt or detect_format(data, name)
+
+    if fmt == 'xlsx':
+        return read_xlsx_columns(data, columns)
+    if fmt == 'csv':
+        return read_csv_columns(data, columns)
+    if fmt == 'parquet':
+        return read_parquet_columns(data, columns)
+    raise ValueError(f"지원하지 않는 파일 형식입니다: {fmt}")
+
+
+def detect_csv_encoding(data, sample_bytes=1 << 20):
+    """CSV 인코딩 판별 (앞부분이 UTF-8로 읽히지 않으면 한글 윈도우 인코딩 cp949로 간주)
+
+    cp949는 EUC-KR의 확장이므로 EUC-KR로 저장한 파일도 함께 읽을 수 있다.
+    """
+    if data[:3] == b'\xef\xbb\xbf':
+        return 'utf-8-sig'
+    decoder = codecs.getincrementaldecoder('utf-8')()
+    try:
+        # 표본 끝에서 잘린 멀티바이트 문자는 오류로 보지 않음 (final=False)
+        decoder.decode(data[:sample_bytes], final=len(data) <= sample_bytes)
+    except UnicodeDecodeError:
+        return 'cp949'
+    return 'utf-8'
+
+
+def csv_header(data, encoding='utf-8', sample_bytes=1 << 16):
+    """CSV 첫 행의 컬럼 이름 목록 (BOM은 제거된 상태로 받음)"""
+    text = data[:sample_bytes].decode('utf-8' if encoding == 'utf-8-sig' else encoding, errors='ignore')
+    return next(csv.reader(io.StringIO(text)), [])
+
+
+def read_csv_columns(data, columns):
+    """CSV에서 지정한 컬럼만 읽음 (pyarrow 멀티스레드 파서 우선)"""
+    wanted = set(columns)
+    encoding = detect_csv_encoding(data)
+    try:
+        import pyarrow.csv as pacsv
+    except ImportError:
+        return pd.read_csv(io.BytesIO(data), usecols=lambda c: c in wanted,
+                           encoding=encoding)
+
+    if encoding == 'utf-8-sig':
+        data = data[3:]
+    # 헤더에 존재하는 컬럼만 요청해야 pyarrow가 오류를 내지 않음
+    header = csv_header(data, encoding)
+    present = [c for c in columns if c in header]
+    if not present:
+        return pd.DataFrame()
+    table = pacsv.read_csv(
+        io.BytesIO(data),
+        # cp949 파일은 pyarrow가 읽으면서 UTF-8로 변환
+        read_options=pacsv.ReadOptions(use_threads=True, encoding='cp949' if encoding == 'cp949' else 'utf8'),
+        convert_options=pacsv.ConvertOptions(include_columns=present),
+    )
+    # 결과 컬럼 순서는 파일의 순서를 따름
+    return table.select([c for c in header if c in wanted and c in table.column_names]).to_pandas()
+
+
+def read_parquet_columns(data, columns):
+    """Parquet에서 지정한 컬럼만 읽음"""
+    import pyarrow.parquet as pq
+
+    parquet_file = pq.ParquetFile(io.BytesIO(data))
+    present = [c for c in parquet_file.schema_arrow.names if c in set(columns)]
+    return parquet_file.read(columns=present, use_threads=True).to_pandas()
+
+
+def read_xlsx_columns(data, columns):
+    """xlsx 첫 번째 시트에서 지정한 컬럼만 읽음
+
+    openpyxl은 모든 셀을 객체로 만들기 때문에 넓은 본문 컬럼이 있는 파일에서
+    느리다. 시트 XML을 바이트 단위로 스캔하여 필요한 컬럼의 셀만 값으로
+    변환하고, 공유 문자열도 실제로 참조되는 항목만 복원한다.
+    스캔할 수 없는 형식(접두사가 붙은 태그, 셀 참조가 없는 셀 등)은
+    openpyxl 경로로 대체한다.
+    """
+    with zipfile.ZipFile(io.BytesIO(data)) as archive:
+        sheet = archive.read(_first_sheet_path(archive))
+        names = set(archive.namelist())
+        sst = archive.read('xl/sharedStrings.xml') if 'xl/sharedStrings.xml' in names else b''
+
+    # 1) 헤더 행에서 필요한 컬럼 위치 결정
+    start = sheet.find(b'<sheetData')
+    header_end = sheet.find(b'</row>', start)
+    header_cells = _scan_cells(sheet, start, header_end) if start >= 0 else None
+    if header_cells is None:
+        wanted = set(columns)
+        return pd.read_excel(io.BytesIO(data), engine='openpyxl',
+                             usecols=lambda c: c in wanted)
+    if not header_cells:
+        return pd.DataFrame()
+
+    header_row = header_cells[0][1]
+    header_strings = _read_shared_strings(
+        sst, {int(v) for _, _, t, v in header_cells if t == b's'}
+    )
+    wanted = {}
+    for col, _, t, v in header_cells:
+        name = _cell_value(t, v, header_strings)
+        if name in columns and name not in wanted.values():
+            wanted[col] = name
+    if not wanted:
+        return pd.DataFrame()
+
+    # 2) 필요한 컬럼의 원시 값만 행 번호별로 수집
+    cells = _scan_cells(sheet, header_end, len(sheet), wanted)
+    if cells is None:
+        wanted = set(columns)
+        return pd.read_excel(io.BytesIO(data), engine='openpyxl',
+                             usecols=lambda c: c in wanted)
+    n_rows = max((row for _, row, _, _ in cells), default=header_row) - header_row
+    raw = {col: [None] * n_rows for col in wanted}
+    needed_sst = set()
+    for col, row, t, v in cells:
+        raw[col][row - header_row - 1] = (t, v)
+        if t == b's':
+            needed_sst.add(int(v))
+
+    # 3) 참조된 공유 문자열만 복원
+    strings = _read_shared_strings(sst, needed_sst)
+
+    order = sorted(wanted, key=_column_index)
+    news_df = pd.DataFrame({
+        wanted[col]: [
+            None if cell is None else _cell_value(cell[0], cell[1], strings)
+            for cell in raw[col]
+        ]
+        for col in order
+    }, columns=[wanted[col] for col in order])
+    if '일자' in news_df.columns:
+        news_df['일자'] = _restore_serial_dates(news_df['일자'])
+    return news_df
+
+
+def _first_sheet_path(archive):
+    """workbook.xml과 관계 파일에서 첫 번째 시트의 경로를 찾음"""
+    try:
+        with archive.open('xl/workbook.xml') as f:
+            workbook = ET.parse(f).getroot()
+        with archive.open('xl/_rels/workbook.xml.rels') as f:
+            rels = ET.parse(f).getroot()
+        sheet = workbook.find(f'{_NS}sheets/{_NS}sheet')
+        rel_id = sheet.get(f'{_REL_NS}id')
+        for rel in rels.iter(f'{_PKG_REL_NS}Relationship'):
+            if rel.get('Id') == rel_id:
+                target = rel.get('Target')
+                if target.startswith('/'):
+                    return target.lstrip('/')
+                return posixpath.normpath(posixpath.join('xl', target))
+    except (KeyError, AttributeError):
+        pass
+    return 'xl/worksheets/sheet1.xml'
+
+
+def _column_index(col):
+    """컬럼 문자(예: b'AB')를 0부터 시작하는 컬럼 번호로 변환"""
+    index = 0
+    for ch in col:
+        index = index * 26 + ch - 64
+    return index - 1
+
+
+def _scan_cells(sheet, start, stop, wanted=None):
+    """시트 XML의 [start, stop) 구간에서 (컬럼 문자, 행 번호, 타입, 원시 값) 목록을 추출
+
+    셀 경계는 bytes.find로 건너뛰므로 wanted에 없는 컬럼(본문 등)의 내용은
+    복사하거나 해석하지 않는다. 스캔할 수 없는 형식이면 None을 반환한다.
+    """
+    cells = []
+    pos = start
+    while True:
+        begin = sheet.find(b'<c ', pos, stop)
+        if begin < 0:
+            return cells
+        tag_end = sheet.find(b'>', begin, stop)
+        attrs = sheet[begin + 3:tag_end]
+        if attrs.endswith(b'/'):
+            pos = tag_end + 1
+            continue
+        end = sheet.find(b'</c>', tag_end, stop)
+        if tag_end < 0 or end < 0:
+            return None
+        pos = end + 4
+
+        ref = _REF_RE.search(attrs)
+        if ref is None:
+            return None
+        col = ref.group(1)
+        if wanted is not None and col not in wanted:
+            continue
+
+        body = sheet[tag_end + 1:end]
+        type_match = _TYPE_RE.search(attrs)
+        cell_type = type_match.group(1) if type_match else b'n'
+        if cell_type == b'inlineStr':
+            value = b''.join(_TEXT_RE.findall(_PHONETIC_RE.sub(b'', body)))
+        else:
+            value_match = _VALUE_RE.search(body)
+            if value_match is None:
+                continue
+            value = value_match.group(1)
+        cells.append((col, int(ref.group(2)), cell_type, value))
+
+
+def _read_shared_strings(sst, needed):
+    """공유 문자열 중 needed에 포함된 번호만 복원하여 딕셔너리로 반환
+
+    <si> 경계는 bytes.find로 건너뛰고 필요한 항목만 텍스트를 해석한다.
+    """
+    strings = {}
+    if not sst or not needed:
+        return strings
+    last = max(needed)
+    pos = 0
+    for index in range(last + 1):
+        begin = sst.find(b'<si', pos)
+        if begin < 0:
+            break
+        tag_end = sst.find(b'>', begin)
+        if sst[tag_end - 1:tag_end] == b'/':
+            pos = tag_end + 1
+            if index in needed:
+                strings[index] = ''
+            continue
+        end = sst.find(b'</si>', tag_end)
+        pos = end + 5
+        if index in needed:
+            # 서식이 적용된 문자열은 각 조각의 텍스트를 이어붙임 (윗주 제외)
+            body = _PHONETIC_RE.sub(b'', sst[tag_end + 1:end])
+            strings[index] = _decode(b''.join(_TEXT_RE.findall(body)))
+    return strings
+
+
+def _decode(value):
+    """XML 텍스트 바이트를 문자열로 변환 (엔티티 복원 포함)"""
+    text = value.decode('utf-8')
+    return html.unescape(text) if '&' in text else text
+
+
+def _cell_value(cell_type, value, strings):
+    """셀 타입에 따라 원시 값을 파이썬 값으로 변환"""
+    if cell_type == b's':
+        return strings.get(int(value))
+    if cell_type in (b'inlineStr', b'str', b'e', b'd'):
+        return _decode(value)
+    if cell_type == b'b':
+        return value == b'1'
+    try:
+        if b'.' in value or b'E' in value or b'e' in value:
+            return float(value)
+        return int(value)
+    except ValueError:
+        return _decode(value)
+
+
+def _restore_serial_dates(series):
+    """날짜 서식으로 저장된 일자(엑셀 일련번호)를 날짜로 복원
+
+    빅카인즈 일자는 yyyymmdd 숫자이므로 일련번호 범위(10만 미만)의 숫자만 변환한다.
+    """
+    numeric = pd.to_numeric(series, errors='coerce')
+    serial = numeric.notna() & (numeric > 0) & (numeric < 100000)
+    if not serial.any():
+        return series
+    series = series.astype(object)
+    series[serial] = _EXCEL_EPOCH + pd.to_timedelta(numeric[serial], unit='D')
+    return series
@@ -0,0 +1,377 @@
+"""기사 검색용 역색인
+
+기사제목/관련기관/키워드를 토큰(제목은 공백, 기관·키워드는 쉼표 단위)으로 나누어
+토큰 → 기사 목록을 만들고, 토큰 어휘에는 문자 바이그램 역색인을 둔다.
+검색어는 바이그램 포스팅 목록의 교집합으로 후보 토큰을 좁힌 뒤 부분 문자열을
+확인하므로, 행마다 모든 셀을 문자열로 바꿔 비교하지 않아도 된다.
+
+검색 문법
+    탄소 중립          공백으로 구분한 검색어는 모두 포함 (AND)
+    탄소 OR 수소       OR 또는 | 로 구분한 묶음 중 하나라도 포함
+    "탄소 중립"        따옴표로 묶으면 공백을 포함한 문구 그대로 검색
+    기관:환경부        특정 필드에서만 검색 (제목/기관/키워드)
+"""
+import shlex
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+# 검색 대상 필드: 컬럼명 -> 토큰 구분 방식 (None이면 공백)
+SEARCH_FIELDS = {
+    '기사제목': None,
+    '관련기관': ',',
+    '키워드': ',',
+}
+
+# 필드 지정 검색에서 사용할 수 있는 별칭
+FIELD_ALIASES = {
+    '제목': '기사제목',
+    '기사제목': '기사제목',
+    '기관': '관련기관',
+    '관련기관': '관련기관',
+    '키워드': '키워드',
+}
+
+_EMPTY = np.empty(0, dtype=np.int64)
+
+
+def _bigrams(text):
+    """문자열의 문자 바이그램 집합 (한 글자면 그 글자 자체)"""
+    if len(text) < 2:
+        return {text}
+    return {text[i:i + 2] for i in range(len(text) - 1)}
+
+
+def _split_tokens(texts, sep):
+    """소문자 텍스트 시리즈를 (행 위치, 토큰 번호, 토큰 어휘)로 분리 (빈 토큰 제외)"""
+    # 행별 토큰 분리 후 (행 번호, 토큰) 쌍으로 펼침
+    parts = texts.str.split(sep) if sep else texts.str.split()
+    parts = parts.reset_index(drop=True).explode().dropna()
+
+    # 공백 제거는 고유 토큰에만 적용한 뒤 번호를 다시 매핑
+    raw_codes, raw_vocab = pd.factorize(parts, sort=False)
+    stripped_codes, vocab = pd.factorize(pd.Index(raw_vocab).str.strip(), sort=False)
+    codes = stripped_codes[raw_codes]
+    rows = parts.index.to_numpy(dtype=np.int64)
+    vocab = list(vocab)
+    if '' in vocab:
+        keep = codes != vocab.index('')
+        codes, rows = codes[keep], rows[keep]
+    return rows, codes, vocab
+
+
+class _FieldIndex:
+    """한 필드의 토큰 어휘, 토큰별 기사 목록, 어휘 바이그램 색인"""
+
+    def __init__(self, series, sep):
+        self.sep = sep
+        texts = series.fillna('').astype(str).str.lower()
+        self.texts = texts.to_numpy(dtype=object)
+        rows, codes, self.vocab = _split_tokens(texts, sep)
+
+        # 토큰 번호별 기사 목록 (CSR 형태, 같은 기사의 중복 토큰은 한 번만)
+        n_rows = max(len(self.texts), 1)
+        keys = np.unique(codes.astype(np.int64) * n_rows + rows)
+        self.posting_rows = keys % n_rows
+        self.posting_offsets = np.searchsorted(keys // n_rows, np.arange(len(self.vocab) + 1))
+
+        self.grams = {}
+        self._add_grams(0)
+
+    def _add_grams(self, start):
+        """start번 이후 토큰의 어휘 바이그램(한 글자 검색용 단일 문자 포함) -> 토큰 번호 목록 추가"""
+        grams = {}
+        for token_id in range(start, len(self.vocab)):
+            for gram in _bigrams(self.vocab[token_id]) | set(self.vocab[token_id]):
+                grams.setdefault(gram, []).append(token_id)
+        for gram, ids in grams.items():
+            ids = np.array(ids, dtype=np.int64)
+            previous = self.grams.get(gram)
+            self.grams[gram] = ids if previous is None else np.concatenate([previous, ids])
+
+    def extend(self, series):
+        """뒤에 추가된 기사의 필드 값을 색인에 반영 (기존 기사 목록 사이에 새 기사를 끼워 넣음)"""
+        n_before = len(self.texts)
+        texts = series.fillna('').astype(str).str.lower()
+        self.texts = np.concatenate([self.texts, texts.to_numpy(dtype=object)])
+        rows, codes, vocab = _split_tokens(texts, self.sep)
+
+        # 새 토큰 어휘를 기존 어휘 번호로 변환하고, 처음 보는 토큰은 어휘 뒤에 추가
+        n_tokens = len(self.vocab)
+        index = {token: i for i, token in enumerate(self.vocab)}
+        token_map = np.empty(len(vocab), dtype=np.int64)
+        for i, token in enumerate(vocab):
+            if token not in index:
+                index[token] = len(self.vocab)
+                self.vocab.append(token)
+            token_map[i] = index[token]
+
+        # 새 (토큰, 기사) 쌍 (토큰 순, 같은 토큰 안에서는 기사 순)
+        n_rows = max(len(self.texts), 1)
+        keys = np.unique(token_map[codes] * n_rows + rows + n_before)
+        new_tokens, new_rows = keys // n_rows, keys % n_rows
+
+        # 토큰별 구간 = 기존 기사 목록 + 새 기사 목록 (새 기사 번호가 모두 더 크므로 정렬 유지)
+        old_offsets = self.posting_offsets
+        old_counts = np.zeros(len(self.vocab), dtype=np.int64)
+        old_counts[:n_tokens] = np.diff(old_offsets)
+        offsets = np.zeros(len(self.vocab) + 1, dtype=np.int64)
+        np.cumsum(old_counts + np.bincount(new_tokens, minlength=len(self.vocab)), out=offsets[1:])
+
+        posting_rows = np.empty(offsets[-1], dtype=np.int64)
+        old_tokens = np.repeat(np.arange(n_tokens), old_counts[:n_tokens])
+        posting_rows[offsets[old_tokens] + np.arange(len(old_tokens)) - old_offsets[old_tokens]] = self.posting_rows
+        new_starts = np.searchsorted(new_tokens, np.arange(len(self.vocab)))
+        posting_rows[offsets[new_tokens] + old_counts[new_tokens] + np.arange(len(new_tokens)) - new_starts[new_tokens]] = new_rows
+        self.posting_rows = posting_rows
+        self.posting_offsets = offsets
+
+        self._add_grams(n_tokens)
+
+    def _candidate_tokens(self, term):
+        """term을 포함할 수 있는 토큰 번호 (바이그램 포스팅 교집합)"""
+        keys = [term] if len(term) == 1 else sorted(_bigrams(term), key=lambda g: len(self.grams.get(g, _EMPTY)))
+        candidates = None
+        for gram in keys:
+            ids = self.grams.get(gram)
+            if ids is None:
+                return _EMPTY
+            candidates = ids if candidates is None else np.intersect1d(candidates, ids, assume_unique=True)
+            if len(candidates) == 0:
+                return _EMPTY
+        return candidates
+
+    def _token_rows(self, term):
+        """term을 부분 문자열로 포함하는 토큰이 있는 기사 번호"""
+        token_ids = [i for i in self._candidate_tokens(term) if term in self.vocab[i]]
+        if not token_ids:
+            return _EMPTY
+        offsets = self.posting_offsets
+        chunks = [self.posting_rows[offsets[i]:offsets[i + 1]] for i in token_ids]
+        return np.unique(np.concatenate(chunks)) if len(chunks) > 1 else chunks[0]
+
+    def search(self, term):
+        """term을 부분 문자열로 포함하는 기사 번호 (정렬됨)"""
+        parts = term.split(self.sep) if self.sep else term.split()
+        if len(parts) == 1 and parts[0] == term:
+            return self._token_rows(term)
+
+        # 구분자를 포함하는 검색어: 각 조각이 모두 있는 기사에서 원문을 확인
+        texts = self.texts
+        rows = None
+        for part in (p.strip() for p in parts):
+            if not part:
+                continue
+            part_rows = self._token_rows(part)
+            rows = part_rows if rows is None else np.intersect1d(rows, part_rows, assume_unique=True)
+            if len(rows) == 0:
+                return _EMPTY
+        if rows is None:
+            rows = np.arange(len(texts))
+        return rows[np.fromiter((term in texts[r] for r in rows), dtype=bool, count=len(rows))]
+
+
+class SearchIndex:
+    """기사제목/관련기관/키워드 역색인"""
+
+    def __init__(self, news_df, fields=None):
+        fields = SEARCH_FIELDS if fields is None else fields
+        self.n_rows = len(news_df)
+        self.fields = {
+            name: _FieldIndex(news_df[name], sep)
+            for name, sep in fields.items()
+            if name in news_df.columns
+        }
+
+    def extend(self, news_df, new_rows):
+        """news_df 뒤에 추가된 기사(new_rows)를 각 필드 색인에 반영"""
+        self.n_rows = len(news_df)
+        for name, index in self.fields.items():
+            if name in new_rows.columns:
+                index.extend(new_rows[name])
+            else:
+                index.extend(pd.Series([''] * len(new_rows), dtype=object))
+
+    def term_rows(self, term, field=None):
+        """단일 검색어가 포함된 기사 번호 (field가 없으면 모든 필드의 합집합)"""
+        term = term.lower()
+        if field is not None:
+            index = self.fields.get(field)
+            return index.search(term) if index is not None else _EMPTY
+        results = [index.search(term) for index in self.fields.values()]
+        results = [r for r in results if len(r)]
+        if not results:
+            return _EMPTY
+        return np.unique(np.concatenate(results)) if len(results) > 1 else results[0]
+
+    def search(self, query):
+        """검색 문법에 따라 일치하는 기사 번호(위치 기준, 정렬됨)를 반환"""
+        groups = parse_query(query)
+        if not groups:
+            return np.arange(self.n_rows)
+
+        matched = []
+        for group in groups:
+            rows = None
+            for field, term in group:
+                term_rows = self.term_rows(term, field)
+                rows = term_rows if rows is None else np.intersect1d(rows, term_rows, assume_unique=True)
+                if len(rows) == 0:
+                    break
+            if rows is not None and len(rows):
+                matched.append(rows)
+
+        if not matched:
+            return _EMPTY
+        return np.unique(np.concatenate(matched)) if len(matched) > 1 else matched[0]
+
+
+    def filter_rows(self, rows, group):
+        """후보 기사 번호 중 AND 묶음(group)의 검색어를 모두 포함하는 기사만 남김
+
+        색인을 거치지 않고 후보 기사의 필드 원문을 직접 확인한다.
+        """
+        for field, term in group:
+            term = term.lower()
+            if field is not None:
+                targets = [self.fields[field].texts] if field in self.fields else []
+            else:
+                targets = [index.texts for index in self.fields.values()]
+            keep = np.fromiter(
+                (any(term in texts[r] for texts in targets) for r in rows),
+                dtype=bool, count=len(rows)
+            )
+            rows = rows[keep]
+            if len(rows) == 0:
+                break
+        return rows
+
+
+class SearchCache:
+    """검색어 -> 기사 번호 LRU 캐시
+
+    입력 중인 검색어는 보통 이전 검색어를 확장한 것(예: '탄소' -> '탄소중립')이므로,
+    새 검색어의 결과가 캐시된 검색어 결과의 부분집합임이 보장되면 전체 색인 대신
+    캐시된 후보 기사만 다시 확인한다. 후보를 원문으로 확인하는 비용은 후보 수에
+    비례하므로, 후보가 refine_limit건 이하일 때만 재확인하고 그보다 많으면
+    색인 검색이 더 빠르다.
+    """
+
+    def __init__(self, index, max_entries=64, refine_limit=500):
+        self.index = index
+        self.max_entries = max_entries
+        self.refine_limit = refine_limit
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.refinements = 0
+        self.misses = 0
+
+    def search(self, query):
+        """검색 결과 기사 번호 반환 (캐시 적중 -> 후보 재확인 -> 색인 검색 순)"""
+        key = ' '.join(query.split())
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+        groups = _lower_groups(parse_query(query))
+        base = self._refinement_base(groups)
+        if base is not None:
+            self.refinements += 1
+            rows = self.index.filter_rows(base, groups[0])
+        else:
+            self.misses += 1
+            rows = self.index.search(query)
+
+        self._entries[key] = (groups, rows)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return rows
+
+    def _refinement_base(self, groups):
+        """새 검색어 결과를 포함하는 캐시 결과 중 가장 작은 것 (없으면 None)
+
+        OR가 없는 검색어끼리만 비교하며, 캐시된 검색어의 모든 조건이 새 검색어의
+        어떤 조건에 포함되어야 한다. (예: '탄소' ⊂ '탄소중립', '환경부' ⊂ '기관:환경부 탄소')
+        """
+        if len(groups) != 1:
+            return None
+        best = None
+        for cached_groups, rows in self._entries.values():
+            if len(cached_groups) != 1 or len(rows) > self.refine_limit:
+                continue
+            if best is not None and len(rows) >= len(best):
+                continue
+            if all(_narrows(groups[0], condition) for condition in cached_groups[0]):
+                best = rows
+        return best
+
+    def clear(self):
+        """캐시 항목과 통계 초기화"""
+        self._entries.clear()
+        self.hits = 0
+        self.refinements = 0
+        self.misses = 0
+
+    def stats(self):
+        """적중/후보 재확인/색인 검색 횟수"""
+        return {
+            'hits': self.hits,
+            'refinements': self.refinements,
+            'misses': self.misses,
+            'entries': len(self._entries),
+        }
+
+
+def _lower_groups(groups):
+    """검색 조건의 검색어를 소문자로 변환"""
+    return [[(field, term.lower()) for field, term in group] for group in groups]
+
+
+def _narrows(group, condition):
+    """group의 어떤 조건이 condition보다 좁은지(결과가 부분집합인지) 여부"""
+    field, term = condition
+    return any(
+        term in new_term and (field is None or field == new_field)
+        for new_field, new_term in group
+    )
+
+
+def parse_query(query):
+    """검색어를 OR 묶음의 목록으로 변환: [[(필드 또는 None, 검색어), ...], ...]"""
+    try:
+        tokens = shlex.split(query, posix=True)
+    except ValueError:
+        # 따옴표가 닫히지 않은 경우 따옴표를 무시
+        tokens = query.replace('"', ' ').split()
+
+    groups = [[]]
+    for token in tokens:
+        if token == 'OR':
+            groups.append([])
+            continue
+        for i, piece in enumerate(token.split('|')):
+            if i > 0:
+                groups.append([])
+            if not piece.strip():
+                continue
+            field = None
+            if ':' in piece:
+                prefix, rest = piece.split(':', 1)
+                if prefix in FIELD_ALIASES and rest.strip():
+                    field, piece = FIELD_ALIASES[prefix], rest
+            groups[-1].append((field, piece.strip()))
+    return [group for group in groups if group]
+
+
+def apply_search(news_df, search_text):
+    """기존 방식의 검색 (행마다 모든 셀을 문자열로 바꿔 비교) - 벤치마크 비교용"""
+    return news_df[
+        news_df.apply(
+            lambda row: any(search_text.lower() in str(cell).lower()
+                            for cell in row if pd.notna(cell)),
+            axis=1
+        )
+    ]
@@ -0,0 +1,59 @@
+"""대시보드 분석 섹션별 결과 캐시
+
+Streamlit은 위젯 하나만 바뀌어도 스크립트 전체를 다시 실행하므로, 섹션마다
+실제 입력(데이터셋, 걸러낸 기사 목록, 그 섹션의 위젯 값)만으로 키를 만들어
+결과를 보관한다. 다른 섹션의 위젯이 바뀐 경우에는 보관한 결과를 그대로 쓴다.
+"""
+import hashlib
+import time
+from collections import OrderedDict
+
+
+def rows_signature(rows):
+    """걸러낸 기사 위치 배열의 해시 (None이면 전체 기사)"""
+    if rows is None:
+        return 'all'
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(rows.astype('int64', copy=False).tobytes())
+    return digest.hexdigest()
+
+
+class SectionCache:
+    """섹션 이름별 (입력 키 -> 결과) LRU 캐시"""
+
+    def __init__(self, max_entries=8):
+        self.max_entries = max_entries
+        self._sections = {}
+        self._stats = {}
+
+    def get(self, section, key, compute):
+        """(결과, 캐시 사용 여부, 계산 시간(초)) 반환 (캐시에 없으면 compute()로 계산)"""
+        entries = self._sections.setdefault(section, OrderedDict())
+        stats = self._stats.setdefault(section, {'hits': 0, 'misses': 0})
+        if key in entries:
+            entries.move_to_end(key)
+            stats['hits'] += 1
+            return entries[key], True, 0.0
+
+        start = time.perf_counter()
+        value = compute()
+        elapsed = time.perf_counter() - start
+        stats['misses'] += 1
+        entries[key] = value
+        while len(entries) > self.max_entries:
+            entries.popitem(last=False)
+        return value, False, elapsed
+
+    def clear(self, section=None):
+        """섹션(없으면 전체)의 캐시 항목 삭제"""
+        if section is None:
+            self._sections.clear()
+        else:
+            self._sections.pop(section, None)
+
+    def stats(self):
+        """섹션별 적중/계산 횟수와 보관 항목 수"""
+        return {
+            section: dict(stats, entries=len(self._sections.get(section, ())))
+            for section, stats in self._stats.items()
+        }
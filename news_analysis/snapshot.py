@@ -0,0 +1,163 @@
+"""정규화된 뉴스 데이터의 로컬 스냅샷 저장소
+
+process_data 결과를 업로드 내용 해시를 키로 Arrow IPC 파일에 저장하여
+같은 데이터를 다시 열 때 엑셀 파싱 없이 메모리 매핑으로 불러온다.
+반복값이 많은 '관련기관'과 '연도'는 사전(dictionary) 인코딩으로 저장한다.
+저장소 전체 크기가 한도를 넘으면 가장 오래 사용하지 않은 스냅샷부터 삭제한다.
+"""
+import logging
+import os
+import time
+
+import pyarrow as pa
+import pyarrow.ipc as ipc
+
+logger = logging.getLogger(__name__)
+
+# 정규화 방식이 바뀌면 올려서 기존 스냅샷을 무효화
+SNAPSHOT_VERSION = 3
+
+# 사전 인코딩으로 저장할 컬럼
+DICTIONARY_COLUMNS = ('관련기관', '연도')
+
+_SUFFIX = f'.v{SNAPSHOT_VERSION}.arrow'
+
+
+def default_cache_dir(name='snapshots'):
+    """로컬 캐시 기본 저장 위치 (NEWS_ANALYZER_CACHE_DIR 환경변수로 변경 가능)"""
+    base = os.environ.get('NEWS_ANALYZER_CACHE_DIR')
+    if not base:
+        base = os.path.join(os.path.expanduser('~'), '.cache', 'news_analyzer')
+    return os.path.join(base, name)
+
+
+class SnapshotStore:
+    """내용 해시를 키로 하는 Arrow IPC 스냅샷 디렉토리 (크기 한도 + LRU 삭제)"""
+
+    def __init__(self, root=None, max_bytes=1024 ** 3):
+        self.root = root or default_cache_dir()
+        self.max_bytes = max_bytes
+        os.makedirs(self.root, exist_ok=True)
+
+    def path_for(self, key):
+        """키에 해당하는 스냅샷 파일 경로"""
+        return os.path.join(self.root, key + _SUFFIX)
+
+    def __contains__(self, key):
+        return os.path.exists(self.path_for(key))
+
+    def save(self, key, news_df):
+        """데이터프레임을 스냅샷으로 저장하고 크기 한도에 맞춰 정리
+
+        Arrow로 변환할 수 없는 컬럼(혼합 타입 등)이 있으면 저장하지 않고 False를 반환한다.
+        """
+        try:
+            table = pa.Table.from_pandas(news_df, preserve_index=False)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            return False
+
+        for name in DICTIONARY_COLUMNS:
+            if name in table.column_names:
+                index = table.column_names.index(name)
+                column = table.column(index)
+                if not pa.types.is_dictionary(column.type):
+                    table = table.set_column(index, name, column.dictionary_encode())
+
+        path = self.path_for(key)
+        tmp_path = f'{path}.{os.getpid()}.tmp'
+        try:
+            with pa.OSFile(tmp_path, 'wb') as sink:
+                with ipc.new_file(sink, table.schema) as writer:
+                    writer.write_table(table)
+            os.replace(tmp_path, path)
+        except OSError:
+            # 디스크가 가득 찬 경우 등 쓰다 만 임시 파일은 남기지 않음
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+
+        self.evict(keep=key)
+        return True
+
+    def load(self, key, categorical=False):
+        """스냅샷을 메모리 매핑으로 읽어 데이터프레임으로 반환 (없으면 None)
+
+        categorical=False이면 사전 인코딩 컬럼을 원래의 문자열(object) 컬럼으로 복원한다.
+        """
+        path = self.path_for(key)
+        try:
+            source = pa.memory_map(path, 'r')
+        except FileNotFoundError:
+            return None
+
+        with source:
+            table = ipc.open_file(source).read_all()
+        # 접근 시각 갱신 (LRU 기준, 읽기 전용 저장소에서는 건너뜀)
+        try:
+            os.utime(path, None)
+        except OSError as e:
+            logger.warning("스냅샷 접근 시각을 갱신하지 못했습니다 (%s): %s", path, e)
+
+        news_df = table.to_pandas()
+        if not categorical:
+            for name in DICTIONARY_COLUMNS:
+                if name in news_df.columns and hasattr(news_df[name], 'cat'):
+                    news_df[name] = news_df[name].astype(object)
+        return news_df
+
+    def delete(self, key):
+        """스냅샷 삭제 (삭제했으면 True)"""
+        try:
+            os.remove(self.path_for(key))
+            return True
+        except FileNotFoundError:
+            return False
+
+    def clear(self):
+        """모든 스냅샷 삭제"""
+        for entry in self.list():
+            self.delete(entry['key'])
+
+    def list(self):
+        """저장된 스냅샷 목록 (최근 사용 순)"""
+        entries = []
+        for name in os.listdir(self.root):
+            if not name.endswith(_SUFFIX):
+                continue
+            path = os.path.join(self.root, name)
+            try:
+                stat = os.stat(path)
+                with pa.memory_map(path, 'r') as source:
+                    reader = ipc.open_file(source)
+                    rows = sum(reader.get_batch(i).num_rows for i in range(reader.num_record_batches))
+            except (OSError, pa.ArrowInvalid):
+                continue
+            entries.append({
+                'key': name[:-len(_SUFFIX)],
+                'rows': rows,
+                'size': stat.st_size,
+                'last_used': time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(stat.st_mtime)),
+                '_mtime': stat.st_mtime,
+            })
+        entries.sort(key=lambda e: e['_mtime'], reverse=True)
+        for entry in entries:
+            del entry['_mtime']
+        return entries
+
+    def total_bytes(self):
+        """저장소 전체 크기"""
+        return sum(entry['size'] for entry in self.list())
+
+    def evict(self, keep=None):
+        """전체 크기가 한도 이하가 될 때까지 오래 사용하지 않은 스냅샷부터 삭제"""
+        entries = self.list()
+        total = sum(entry['size'] for entry in entries)
+        for entry in reversed(entries):
+            if total <= self.max_bytes:
+                break
+            if entry['key'] == keep:
+                continue
+            if self.delete(entry['key']):
+                total -= entry['size']
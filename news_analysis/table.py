@@ -0,0 +1,44 @@
+"""데이터 탐색 표의 페이지 단위 변환
+
+검색 결과는 기사 위치 배열로만 들고 있다가, 현재 페이지에 해당하는 행만
+골라 날짜 문자열 변환과 컬럼 이름 변경을 적용한다. 페이지 하나를 만드는
+비용은 전체 기사 수와 관계없이 페이지 크기에만 비례한다.
+"""
+import numpy as np
+import pandas as pd
+
+from news_analysis.ingest import DATE_COLUMN, parse_dates
+
+# 표에 표시할 컬럼 (게시일은 '작성/게시일자' 이름으로 yyyy.mm.dd 형식 표시)
+DISPLAY_COLUMNS = ['작성/게시일자', '기사제목', '관련기관', '키워드', '기사링크']
+
+
+def row_count(news_df, rows=None):
+    """걸러낸 기사 수 (rows가 None이면 전체)"""
+    return len(news_df) if rows is None else len(rows)
+
+
+def page_bounds(total, page, per_page):
+    """(페이지 수, 현재 페이지, 시작 위치, 끝 위치) (현재 페이지는 범위 안으로 조정)"""
+    total_pages = max(1, (total - 1) // per_page + 1)
+    page = min(max(1, page), total_pages)
+    start = (page - 1) * per_page
+    return total_pages, page, start, min(page * per_page, total)
+
+
+def page_frame(news_df, rows, start, stop, columns=DISPLAY_COLUMNS):
+    """걸러낸 기사(rows, None이면 전체) 중 [start, stop) 구간의 표시용 데이터프레임"""
+    if rows is None:
+        page = news_df.iloc[start:stop]
+    else:
+        page = news_df.iloc[np.asarray(rows[start:stop], dtype=np.int64)]
+
+    frame = {}
+    for column in columns:
+        if column == '작성/게시일자' and column in page.columns:
+            # 적재 시 파싱한 게시일이 없으면(이전 형식 데이터) 현재 페이지만 파싱
+            dates = page[DATE_COLUMN] if DATE_COLUMN in page.columns else parse_dates(page[column])
+            frame[column] = dates.dt.strftime('%Y.%m.%d')
+        elif column in page.columns:
+            frame[column] = page[column]
+    return pd.DataFrame(frame, index=page.index)
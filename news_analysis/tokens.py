@@ -0,0 +1,160 @@
+"""쉼표 구분 목록 컬럼(관련기관, 키워드) 분리와 빈도 집계 도구"""
+import hashlib
+
+import numpy as np
+import pandas as pd
+
+
+def split_list_column(series, sep=','):
+    """목록 컬럼을 (행 위치 배열, 항목 문자열 배열)로 펼침
+
+    결측값은 건너뛰고, 항목의 공백 제거나 빈 항목 제거는 하지 않는다.
+    행마다 split하는 대신 전체를 한 번에 이어붙여 분리한다.
+    """
+    values = series.reset_index(drop=True).dropna().astype(str)
+    if values.empty:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=object)
+
+    texts = values.tolist()
+    parts = sep.join(texts).split(sep)
+    counts = np.fromiter((text.count(sep) for text in texts), dtype=np.int64, count=len(texts)) + 1
+    rows = np.repeat(values.index.to_numpy(dtype=np.int64), counts)
+    return rows, np.array(parts, dtype=object)
+
+
+def factorize_stripped(parts, min_length=1):
+    """항목 배열의 공백을 제거하여 번호를 매김
+
+    공백 제거는 고유 문자열에만 적용한다. min_length보다 짧은 항목은 번호 -1.
+    반환값: (항목별 번호 배열, 고유 항목 목록)
+    """
+    raw_codes, raw_values = pd.factorize(parts, sort=False)
+    stripped = pd.Index(raw_values, dtype=object).str.strip()
+    valid = np.asarray(stripped.str.len() >= min_length)
+
+    codes, uniques = pd.factorize(stripped[valid], sort=False)
+    mapping = np.full(len(stripped), -1, dtype=np.int64)
+    mapping[valid] = codes
+    return mapping[raw_codes] if len(raw_codes) else raw_codes.astype(np.int64), list(uniques)
+
+
+def first_occurrences(keys):
+    """정수 키 배열에서 각 고유 키가 처음 나온 위치 (처음 나온 순서대로)"""
+    codes, _ = pd.factorize(keys, sort=False)
+    if len(codes) == 0:
+        return np.empty(0, dtype=np.int64)
+    # factorize 번호는 처음 나온 순서대로 매겨지므로 누적 최댓값이 커지는 위치가 첫 등장
+    running_max = np.maximum.accumulate(codes)
+    is_first = np.empty(len(codes), dtype=bool)
+    is_first[0] = True
+    is_first[1:] = codes[1:] > running_max[:-1]
+    return np.flatnonzero(is_first)
+
+
+def frequency_hash(frequencies):
+    """빈도표 {항목: 빈도수}의 해시 (순서 포함)"""
+    digest = hashlib.blake2b(digest_size=16)
+    for item, count in frequencies.items():
+        digest.update(f'{item}\0{count}\0'.encode('utf-8'))
+    return digest.hexdigest()
+
+
+def ordered_frequency(vocab, counts, first_seen):
+    """빈도수가 있는 항목의 {항목: 빈도수} (처음 나온 순서대로)"""
+    found = np.flatnonzero(counts)
+    found = found[np.argsort(first_seen[found], kind='stable')]
+    return {vocab[i]: int(counts[i]) for i in found}
+
+
+def top_frequency(vocab, counts, first_seen, n):
+    """빈도수 상위 n개 {항목: 빈도수} (Counter.most_common과 같은 순서)
+
+    빈도수 내림차순이며, 같으면 먼저 나온 항목이 앞선다.
+    """
+    n = min(n, int(np.count_nonzero(counts)))
+    if n <= 0:
+        return {}
+    # n번째로 큰 빈도수 이상인 후보만 남긴 뒤 정렬 (경계의 동률 포함)
+    kth = counts[np.argpartition(counts, len(counts) - n)[len(counts) - n]]
+    candidates = np.flatnonzero(counts >= kth)
+    order = np.lexsort((first_seen[candidates], -counts[candidates]))[:n]
+    return {vocab[i]: int(counts[i]) for i in candidates[order]}
+
+
+class CodedLists:
+    """기사별 항목 번호 목록과 항목 어휘
+
+    기사 i의 항목 번호는 ids[offsets[i]:offsets[i + 1]]이며(CSR 형태), 기사 순서와
+    기사 안의 항목 순서를 유지한다. 걸러낸 기사의 빈도수는 해당 구간을 모아
+    np.bincount로 센다.
+    """
+
+    def __init__(self, vocab, offsets, ids):
+        self.vocab = list(vocab)
+        self.offsets = np.asarray(offsets, dtype=np.int64)
+        self.ids = np.asarray(ids, dtype=np.int32)
+
+    @classmethod
+    def from_pairs(cls, rows, codes, vocab, n_rows):
+        """(행 위치, 항목 번호) 쌍에서 생성 (rows는 정렬되어 있어야 하며 번호 -1은 제외)"""
+        keep = codes >= 0
+        rows, codes = rows[keep], codes[keep]
+        offsets = np.searchsorted(rows, np.arange(n_rows + 1))
+        return cls(vocab, offsets, codes)
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def extend(self, other):
+        """other(뒤에 이어지는 기사들의 목록)를 덧붙이고, 덧붙인 항목의 합친 어휘 기준 번호 반환"""
+        index = {item: i for i, item in enumerate(self.vocab)}
+        id_map = np.empty(len(other.vocab), dtype=np.int32)
+        for i, item in enumerate(other.vocab):
+            if item not in index:
+                index[item] = len(self.vocab)
+                self.vocab.append(item)
+            id_map[i] = index[item]
+
+        ids = id_map[other.ids]
+        self.offsets = np.concatenate([self.offsets, other.offsets[1:] + self.offsets[-1]])
+        self.ids = np.concatenate([self.ids, ids])
+        return ids
+
+    def id_rows(self):
+        """항목 번호별 기사 위치 (ids와 같은 길이)"""
+        return np.repeat(np.arange(len(self), dtype=np.int64), np.diff(self.offsets))
+
+    def row_ids(self, rows=None):
+        """기사 위치 목록에 해당하는 항목 번호를 기사 순서대로 이어붙인 배열"""
+        if rows is None:
+            return self.ids
+        rows = np.asarray(rows, dtype=np.int64)
+        starts = self.offsets[rows]
+        lengths = self.offsets[rows + 1] - starts
+        total = int(lengths.sum())
+        if total == 0:
+            return self.ids[:0]
+        # 구간별 시작 위치를 반복한 뒤, 구간 안에서의 순번을 더해 전체 위치를 구함
+        ends = np.cumsum(lengths)
+        index = np.repeat(starts - (ends - lengths), lengths) + np.arange(total)
+        return self.ids[index]
+
+    def counts(self, rows=None):
+        """항목 번호별 빈도수 배열 (rows가 None이면 전체 기사)"""
+        return np.bincount(self.row_ids(rows), minlength=len(self.vocab))
+
+    def counts_and_first_seen(self, rows=None):
+        """(항목별 빈도수, 항목별 처음 나온 위치) 배열 (나오지 않은 항목의 위치는 전체 길이)"""
+        ids = self.row_ids(rows)
+        counts = np.bincount(ids, minlength=len(self.vocab))
+        first_seen = np.full(len(self.vocab), len(ids), dtype=np.int64)
+        np.minimum.at(first_seen, ids, np.arange(len(ids)))
+        return counts, first_seen
+
+    def frequency(self, rows=None):
+        """{항목: 빈도수} (처음 나온 순서대로)"""
+        return ordered_frequency(self.vocab, *self.counts_and_first_seen(rows))
+
+    def top(self, n, rows=None):
+        """빈도수 상위 n개 {항목: 빈도수} (Counter.most_common과 같은 순서)"""
+        return top_frequency(self.vocab, *self.counts_and_first_seen(rows), n)
@@ -0,0 +1,98 @@
+"""워드클라우드 PNG 캐시
+
+워드클라우드 배치는 빈도표, 표시 단어 수, 이미지 크기, 폰트가 같으면 항상 같은
+결과(random_state 고정)이므로 렌더링한 PNG 바이트를 이 값들의 해시로 보관한다.
+matplotlib을 거치지 않고 WordCloud 이미지를 바로 PNG로 인코딩하며, 보관한
+이미지의 총 크기가 한도를 넘으면 가장 오래 사용하지 않은 이미지부터 삭제한다.
+"""
+import io
+import os
+from collections import OrderedDict
+
+from news_analysis.tokens import frequency_hash
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 프로젝트 폴더의 CookieRun 폰트
+DEFAULT_FONT_PATH = os.path.join(ROOT, 'CookieRun Regular.ttf')
+
+
+def font_key(font_path):
+    """폰트 경로와 파일 크기/수정 시각 (같은 경로의 폰트가 바뀌면 다른 키)"""
+    try:
+        stat = os.stat(font_path)
+        return (font_path, stat.st_size, stat.st_mtime_ns)
+    except (OSError, TypeError):
+        return (font_path, None, None)
+
+
+def render_wordcloud_png(frequencies, top_n, width=500, height=200, font_path=DEFAULT_FONT_PATH):
+    """빈도표로 워드클라우드를 그려 PNG 바이트로 반환"""
+    from wordcloud import WordCloud
+
+    wordcloud = WordCloud(
+        width=width,
+        height=height,
+        background_color='white',
+        font_path=font_path,
+        max_words=top_n,
+        max_font_size=100,
+        random_state=42
+    )
+    wordcloud.generate_from_frequencies(frequencies)
+    buffer = io.BytesIO()
+    wordcloud.to_image().save(buffer, format='PNG', optimize=False)
+    return buffer.getvalue()
+
+
+class WordCloudCache:
+    """(빈도표 해시, top_n, 크기, 폰트) -> PNG 바이트 LRU 캐시 (총 바이트 수 한도)"""
+
+    def __init__(self, max_bytes=32 * 1024 ** 2):
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, frequencies, top_n, width=500, height=200, font_path=DEFAULT_FONT_PATH):
+        """워드클라우드 PNG 바이트 (캐시에 없으면 렌더링 후 보관)"""
+        key = (frequency_hash(frequencies), top_n, width, height, font_key(font_path))
+        png = self._entries.get(key)
+        if png is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return png
+
+        self.misses += 1
+        png = render_wordcloud_png(frequencies, top_n, width, height, font_path)
+        self._entries[key] = png
+        self.total_bytes += len(png)
+        self._evict(keep=key)
+        return png
+
+    def _evict(self, keep=None):
+        """총 크기가 한도 이하가 될 때까지 오래 사용하지 않은 이미지부터 삭제"""
+        for key in list(self._entries):
+            if self.total_bytes <= self.max_bytes:
+                break
+            if key == keep:
+                continue
+            self.total_bytes -= len(self._entries.pop(key))
+
+    def clear(self):
+        """캐시 항목과 통계 초기화"""
+        self._entries.clear()
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self):
+        """적중/렌더링 횟수와 보관 중인 이미지 크기"""
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'entries': len(self._entries),
+            'bytes': self.total_bytes,
+            'max_bytes': self.max_bytes,
+        }
@@ -1,22 +1,16 @@
+import os
+from contextlib import nullcontext
+
 import streamlit as st
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
-from wordcloud import WordCloud
-from collections import Counter
-from collections import Counter, defaultdict
-import networkx as nx
-import re
-import folium
-from folium.plugins import HeatMap
-from streamlit_folium import folium_static
-import matplotlib.pyplot as plt
-import os
-import json
-import platform
-from PIL import Image
-import io
-import base64
+
+# 첫 화면(파일 업로드)에 필요한 모듈만 불러오고, 분석용 라이브러리(plotly, networkx,
+# scipy, folium, wordcloud)는 해당 분석 섹션이 처음 실행될 때 불러옴
+from news_analysis.corpus import Corpus
+from news_analysis.ingest import IngestCache
+from news_analysis.sections import SectionCache, rows_signature
+from news_analysis.snapshot import SnapshotStore, default_cache_dir
+from news_analysis.table import page_bounds, page_frame, row_count
 
 # 페이지 설정
 st.set_page_config(
@@ -33,7 +27,13 @@ st.title("📰 뉴스 데이터 분석 대시보드")
 col1, col2 = st.columns([3, 1])
 
 with col1:
-    uploaded_file = st.file_uploader("뉴스 데이터 파일을 업로드하세요 (xlsx)", type=["xlsx"])
+    uploaded_files = st.file_uploader(
+        "뉴스 데이터 파일을 업로드하세요 (xlsx, csv, parquet, 여러 파일 선택 가능)",
+        type=["xlsx", "csv", "parquet"],
+        accept_multiple_files=True,
+        # 코퍼스를 비우면 키를 바꿔 업로드 목록도 비움 (다음 재실행에서 다시 추가되지 않도록)
+        key=f"uploaded_files_{st.session_state.get('uploader_generation', 0)}"
+    )
 
 with col2:
     st.markdown("<div style='height: 29px; display: flex; align-items: center;'>\n    <span style='margin-right: 10px;'>또는</span>\n    </div>", unsafe_allow_html=True)
@@ -59,113 +59,365 @@ def load_example_data():
 if st.button("📋 예시 데이터 사용하기", use_container_width=True):
     example_data = load_example_data()
     if example_data:
-        uploaded_file = example_data
+        uploaded_files = [example_data]
         st.success("예시 데이터가 성공적으로 로드되었습니다!")
         st.balloons()
 
 # 세션 상태에 파일 저장
-if 'uploaded_file' not in st.session_state:
-    st.session_state.uploaded_file = None
+if 'uploaded_files' not in st.session_state:
+    st.session_state.uploaded_files = []
 
-if uploaded_file is not None:
-    st.session_state.uploaded_file = uploaded_file
+if uploaded_files:
+    st.session_state.uploaded_files = uploaded_files
 else:
-    uploaded_file = st.session_state.uploaded_file
+    uploaded_files = st.session_state.uploaded_files
+
+# 단일 사용자 로컬 실행 여부: 켜면 누적 코퍼스를 디스크에 저장해 모든 세션이 공유하고
+# 사이드바에서 저장된 스냅샷을 조회/삭제할 수 있음 (배포된 앱에서는 켜지 않음)
+LOCAL_MODE = os.environ.get('NEWS_ANALYZER_LOCAL') == '1'
+
+# 업로드 데이터 캐시 (재실행 간 유지)
+@st.cache_resource
+def get_snapshot_store():
+    """정규화 데이터 스냅샷 저장소 (디스크에 쓸 수 없는 환경이면 None)"""
+    try:
+        return SnapshotStore(max_bytes=1024 ** 3)
+    except OSError:
+        return None
+
+@st.cache_resource
+def get_ingest_cache():
+    """업로드 내용 해시 기반 데이터 캐시"""
+    return IngestCache(max_entries=4, snapshot_store=get_snapshot_store())
+
+@st.cache_resource
+def get_local_corpus():
+    """디스크에 누적 저장되는 기사 코퍼스 (디스크에 쓸 수 없는 환경이면 메모리에만 유지)"""
+    try:
+        return Corpus(default_cache_dir('corpus'))
+    except OSError:
+        return Corpus()
+
+def get_corpus():
+    """누적 코퍼스 (로컬 모드에서만 디스크에 저장해 공유하고, 그 외에는 세션별로 메모리에 유지)"""
+    if LOCAL_MODE:
+        return get_local_corpus()
+    return st.session_state.setdefault('accumulated_corpus', Corpus())
+
+@st.cache_resource
+def get_section_cache():
+    """분석 섹션별 결과 캐시 (데이터셋, 검색 결과, 섹션 위젯 값이 같으면 재사용)"""
+    return SectionCache(max_entries=8)
+
+def profile(name):
+    """진단 모드이면 with 블록의 시간/메모리를 기록하고, 아니면 아무것도 하지 않음"""
+    return profiler.section(name) if profiler is not None else nullcontext()
+
+def track_cache(name, cache):
+    """진단 모드이면 캐시 적중/계산 횟수를 기록할 캐시로 등록"""
+    if profiler is not None:
+        profiler.track_cache(name, cache)
+    return cache
+
+def run_section(section, key, compute, label=None):
+    """섹션 결과를 캐시에서 가져오거나 계산하고, 다시 계산했는지 표시"""
+    with profile(section):
+        value, cached, elapsed = get_section_cache().get(section, key, compute)
+    prefix = f"{label}: " if label else ""
+    if cached:
+        st.caption(f"{prefix}⚡ 캐시된 결과 사용")
+    else:
+        st.caption(f"{prefix}🔄 다시 계산함 ({elapsed:.2f}초)")
+    return value
+
+# 누적 코퍼스 (여러 파일을 합쳐 분석, 기사링크 기준 중복 제외)
+use_corpus = st.sidebar.checkbox(
+    "업로드 파일을 누적 코퍼스에 추가",
+    value=False,
+    help="업로드한 파일을 이전에 추가한 파일과 합쳐 분석합니다. "
+         "기사링크(없으면 기사제목과 일자)가 같은 기사는 한 번만 포함합니다. "
+         + ("로컬 모드이므로 코퍼스는 디스크에 저장되어 이 앱의 모든 세션이 공유합니다."
+            if LOCAL_MODE else "코퍼스는 이 브라우저 세션에만 유지됩니다.")
+)
+if use_corpus:
+    corpus = get_corpus()
+    with st.sidebar.expander("📚 누적 코퍼스", expanded=True):
+        if corpus.sources:
+            st.dataframe(
+                pd.DataFrame(corpus.sources).drop(columns='key').rename(
+                    columns={'name': '파일', 'rows': '기사 수', 'added': '추가된 기사 수'}
+                ),
+                hide_index=True,
+                use_container_width=True
+            )
+            st.caption(f"파일 {len(corpus.sources)}개, 기사 {len(corpus):,}건")
+            if st.button("코퍼스 비우기", key="clear_corpus"):
+                corpus.clear()
+                # 업로드 목록에 남은 파일이 다음 재실행에서 다시 추가되지 않도록 비움
+                st.session_state.uploaded_files = []
+                st.session_state['uploader_generation'] = st.session_state.get('uploader_generation', 0) + 1
+                st.rerun()
+        else:
+            st.caption("추가된 파일이 없습니다.")
+
+# 저장된 스냅샷 관리 (모든 세션이 같은 저장소를 쓰므로 로컬 모드에서만 표시)
+snapshot_store = get_snapshot_store()
+if LOCAL_MODE and snapshot_store is not None:
+    with st.sidebar.expander("💾 저장된 데이터 스냅샷"):
+        snapshots = snapshot_store.list()
+        if snapshots:
+            st.dataframe(
+                pd.DataFrame(snapshots).assign(size=lambda df: (df['size'] / 1024 ** 2).round(1)).rename(
+                    columns={'key': '키', 'rows': '기사 수', 'size': '크기(MB)', 'last_used': '최근 사용'}
+                ),
+                hide_index=True,
+                use_container_width=True
+            )
+            selected_key = st.selectbox("삭제할 스냅샷", [s['key'] for s in snapshots])
+            col_delete, col_clear = st.columns(2)
+            with col_delete:
+                if st.button("삭제", key="delete_snapshot"):
+                    snapshot_store.delete(selected_key)
+                    st.rerun()
+            with col_clear:
+                if st.button("전체 삭제", key="clear_snapshots"):
+                    snapshot_store.clear()
+                    st.rerun()
+        else:
+            st.caption("저장된 스냅샷이 없습니다.")
+
+# 큰 코퍼스의 항목 분리/지명 변환/동시출현 계산을 기사 구간별로 나누어 처리할 작업 프로세스 수
+analysis_workers = st.sidebar.number_input(
+    "분석 작업 프로세스 수",
+    min_value=1,
+    max_value=max(os.cpu_count() or 1, 1),
+    value=1,
+    help="2 이상이면 기사를 구간별로 나누어 여러 프로세스에서 처리한 뒤 합칩니다. 결과는 같습니다."
+)
+
+# 진단 모드: 재실행마다 섹션별 경과 시간/최대 메모리와 캐시 적중 횟수를 기록
+diagnostics_enabled = st.sidebar.checkbox(
+    "🩺 진단 모드 (섹션별 시간/메모리)",
+    value=False,
+    help="재실행마다 섹션별 경과 시간과 최대 메모리 할당량(tracemalloc), 캐시 적중/계산 횟수를 기록합니다. "
+         "메모리 추적은 앱 프로세스 전체에 적용되어 기록하는 동안 모든 세션이 조금 느려지며, "
+         "다른 세션이 동시에 실행 중이면 최대 메모리에 그 세션의 할당도 포함됩니다."
+)
+# 진단 기록의 섹션 이름 -> 표시 이름
+DIAGNOSTIC_LABELS = {
+    'ingest': '파일 적재', 'indexes': '색인 생성', 'search': '검색', 'date_filter': '기간 필터',
+    'dedup': '유사 중복 묶기', 'table': '데이터 표', 'heatmap': '지명 히트맵',
+    'location_matching': '지명 변환/집계', 'heatmap_render': '히트맵 생성', 'trend': '기간별 기사 수',
+    'wordcloud': '워드클라우드', 'network_graph': '네트워크 그래프', 'network': '네트워크 배치',
+}
+profiler = None
+if diagnostics_enabled:
+    from news_analysis.diagnostics import SectionProfiler
+    
+    profiler = st.session_state.setdefault('profiler', SectionProfiler(max_runs=50))
+    profiler.start_run()
+    profiler.track_cache('섹션', get_section_cache())
+    profiler.track_cache('업로드', get_ingest_cache())
+    diagnostics_panel = st.sidebar.expander("🩺 진단", expanded=True)
+elif 'profiler' in st.session_state:
+    # 진단 모드를 끄면 메모리 추적 해제 (다른 세션이 기록 중이 아니면 중지, 기록은 다시 켤 때까지 보관)
+    st.session_state['profiler'].stop()
+
+# 일괄 분석(python -m news_analysis.batch)으로 저장한 JSON 결과 열기
+with st.sidebar.expander("📦 사전 계산 결과 열기"):
+    precomputed_file = st.file_uploader(
+        "일괄 분석 결과 파일 (json)", type=["json"], key="precomputed_file",
+        help="python -m news_analysis.batch 로 저장한 결과 파일을 열면 원본 파일 없이 분석 결과를 표시합니다."
+    )
+
+def show_precomputed(aggregates):
+    """저장된 집계 결과(연도별 기사 수, 키워드, 지명 빈도수, 기관 동시출현)를 표시"""
+    meta = aggregates['meta']
+    st.markdown("---")
+    st.header(f"📦 사전 계산 결과: {meta.get('source') or '파일'}")
+    st.caption(f"기사 {meta['rows']:,}건 · 키워드 상위 {meta['top_n']}개 · "
+               f"동시출현 {meta['min_weight']}회 이상 · 생성 {meta['created']}")
+
+    import plotly.express as px
+
+    st.header("🗺️ 지명 빈도수")
+    locations = aggregates['locations']
+    if len(locations) and locations['빈도수'].sum() > 0:
+        import streamlit.components.v1 as components
+        from news_analysis.gazetteer import load_gazetteer
+        from news_analysis.heatmap import MAP_HEIGHT, MAP_WIDTH, create_heatmap, render_map_html
+
+        try:
+            location_counts = dict(zip(locations['지명'], locations['빈도수'].astype(int)))
+            components.html(render_map_html(create_heatmap(location_counts, load_gazetteer())),
+                            width=MAP_WIDTH, height=MAP_HEIGHT + 10)
+        except (OSError, ValueError) as e:
+            st.warning(f"히트맵을 만들 수 없습니다: {e}")
+        st.dataframe(locations.sort_values('빈도수', ascending=False).head(20),
+                     hide_index=True, use_container_width=True)
+    else:
+        st.warning("관련기관에서 인식된 지명이 없습니다.")
+
+    st.header("📅 연도별 기사 수")
+    st.plotly_chart(px.bar(aggregates['year_counts'], x='연도', y='기사 수', title="연도별 기사 수 분석"),
+                    use_container_width=True)
+
+    st.header("☁️ 키워드 빈도수")
+    keywords = aggregates['keywords']
+    if len(keywords):
+        st.plotly_chart(px.bar(keywords, x='키워드', y='빈도수', title='키워드 빈도수'), use_container_width=True)
+    else:
+        st.warning("저장된 키워드가 없습니다.")
+
+    st.header("🕸️ 기관 동시출현")
+    edges = aggregates['edges']
+    st.caption(f"동시출현 {meta['min_weight']}회 이상 기관 쌍 {len(edges):,}개")
+    st.dataframe(edges.head(200), hide_index=True, use_container_width=True)
+
+if precomputed_file is not None:
+    from news_analysis.aggregates import load_aggregates
+
+    try:
+        precomputed = load_aggregates(precomputed_file)
+    except (ValueError, KeyError) as e:
+        st.error(f"사전 계산 결과 파일을 읽을 수 없습니다: {e}")
+    else:
+        show_precomputed(precomputed)
+        st.stop()
 
 # 데이터 처리 함수
 def process_data(uploaded_file):
+    """업로드 파일을 정규화된 데이터셋(데이터프레임 + 파생 구조)으로 변환"""
     try:
-        # 엑셀 파일 로드
-        news_df = pd.read_excel(uploaded_file, engine='openpyxl')
-        
-        # 컬럼 이름 매핑
-        column_mapping = {
-            "일자": "작성/게시일자",
-            "제목": "기사제목",
-            "기관": "관련기관",
-            "특성추출(가중치순 상위 50개)": "키워드",
-            "URL": "기사링크"
-        }
-        
-        # 기존 컬럼 중 매핑된 컬럼만 선택
-        existing_columns = [col for col in column_mapping.keys() if col in news_df.columns]
-        news_df = news_df[existing_columns]
-        
-        # 컬럼 이름 변경
-        news_df = news_df.rename(columns=column_mapping)
-        
-        # 중복 컬럼 제거
-        news_df = news_df.loc[:, ~news_df.columns.duplicated()]
-        
-        # '일자' 컬럼에서 '연도' 컬럼 생성
-        if '작성/게시일자' in news_df.columns:
-            try:
-                # yyyymmdd 형식에서 앞의 4자리(연도) 추출
-                news_df['연도'] = news_df['작성/게시일자'].astype(str).str[:4]
-            except Exception as e:
-                st.error(f"'일자' 컬럼에서 연도를 추출하는 중 오류가 발생했습니다: {e}")
-                raise
-        else:
+        # 같은 내용의 파일은 한 번만 파싱하고 이후에는 캐시된 결과 사용
+        return get_ingest_cache().load_dataset(uploaded_file)
+    except ValueError as e:
+        if str(e) == "일자 컬럼 없음":
             st.error("파일에 '일자' 컬럼이 없습니다. 분석을 종료합니다.")
-            raise ValueError("일자 컬럼 없음")
-            
-        return news_df
+        st.error(f"파일 처리 중 오류가 발생했습니다: {e}")
+        raise
     except Exception as e:
         st.error(f"파일 처리 중 오류가 발생했습니다: {e}")
         raise
 
-if uploaded_file is not None:
+def merge_files(uploaded_files, corpus):
+    """업로드 파일들을 코퍼스에 추가 (이미 추가한 파일은 건너뛰고, 새 기사만 이어 붙임)"""
+    for uploaded_file in uploaded_files:
+        source = process_data(uploaded_file)
+        if source.key in corpus:
+            continue
+        name = getattr(uploaded_file, 'name', None)
+        added = corpus.add(source.key, source.news_df, name=name)
+        st.success(f"{name or '파일'}: 새 기사 {added:,}건 추가 (중복 {len(source.news_df) - added:,}건 제외)")
+    return corpus.dataset
+
+def get_session_corpus(uploaded_files):
+    """누적 모드가 아닐 때 여러 파일을 합치는 세션별 코퍼스 (파일이 빠지면 새로 만듦)"""
+    keys = {process_data(f).key for f in uploaded_files}
+    corpus = st.session_state.get('session_corpus')
+    if corpus is None or any(source['key'] not in keys for source in corpus.sources):
+        corpus = st.session_state['session_corpus'] = Corpus()
+    return corpus
+
+# 누적 모드에서는 업로드 없이도 저장된 코퍼스를 분석
+if uploaded_files or (use_corpus and len(get_corpus()) > 0):
     try:
-        # 데이터 처리
-        news_df = process_data(uploaded_file)
+        # 데이터 처리 (파일 하나는 그대로, 여러 파일이나 누적 모드는 코퍼스로 병합)
+        with profile('ingest'):
+            if use_corpus:
+                dataset = merge_files(uploaded_files, get_corpus())
+            elif len(uploaded_files) > 1:
+                dataset = merge_files(uploaded_files, get_session_corpus(uploaded_files))
+            else:
+                dataset = process_data(uploaded_files[0])
+        if dataset is None:
+            st.warning("분석할 기사가 없습니다.")
+            st.stop()
+        news_df = dataset.news_df
+        
+        from news_analysis.cube import AnalysisCube
+        from news_analysis.dates import GRANULARITIES, DateIndex
+        from news_analysis.search import SearchCache, SearchIndex
+        
+        with profile('indexes'):
+            # 검색 색인과 검색 결과 캐시 (데이터셋당 한 번 생성)
+            search_index = dataset.derived('search_index', SearchIndex)
+            search_cache = track_cache('검색', dataset.derived('search_cache', lambda df: SearchCache(search_index)))
+            
+            # 연도별 사전 집계 (키워드/기관/지명 항목은 처음 사용할 때 데이터셋당 한 번 생성)
+            analysis_cube = dataset.derived('analysis_cube', AnalysisCube)
+            
+            # 게시일 정렬 색인 (기간 필터와 기간별 추이에 사용)
+            date_index = dataset.derived('date_index', DateIndex.from_frame)
         
         # 데이터 표시
         st.markdown("---")
         st.header("📊 데이터 탐색")
         
         # 검색 기능 추가
-        search_text = st.text_input("검색어 입력", "", placeholder="여기에 검색어를 입력하세요")
+        search_text = st.text_input(
+            "검색어 입력", "", placeholder="여기에 검색어를 입력하세요",
+            help="기사제목·관련기관·키워드에서 검색합니다. 공백: 모두 포함, OR 또는 |: 하나라도 포함, "
+                 "\"탄소 중립\": 문구 그대로, 기관:환경부 / 제목:탄소 / 키워드:수소: 특정 항목에서만 검색"
+        )
+        
+        # 기간 필터 (전체 기간이 선택되어 있으면 필터 없음)
+        date_range = None
+        date_bounds = date_index.bounds()
+        if date_bounds:
+            selected_dates = st.date_input(
+                "기간", value=date_bounds, min_value=date_bounds[0], max_value=date_bounds[1]
+            )
+            if len(selected_dates) == 2 and tuple(selected_dates) != date_bounds:
+                date_range = tuple(selected_dates)
+        
+        # 유사 중복 기사 묶기 (모든 분석에 적용)
+        collapse_duplicates = st.checkbox(
+            "유사 중복 기사 묶기",
+            value=False,
+            help="기사제목 단어와 키워드가 80% 이상 겹치는 기사(통신사 전재 기사 등)는 "
+                 "가장 앞 기사 하나만 분석에 사용합니다."
+        )
     except Exception as e:
         st.error(f"데이터 처리 중 오류가 발생했습니다: {str(e)}")
         st.info("오류가 발생하여 분석을 종료합니다.")
         raise
         
     if search_text:
-            # 모든 텍스트 컬럼에서 검색어가 포함된 데이터 필터링
-            filtered_df = news_df[
-                news_df.apply(
-                    lambda row: any(search_text.lower() in str(cell).lower() 
-                                   for cell in row if pd.notna(cell)),
-                    axis=1
-                )
-            ]
-            
-            if len(filtered_df) == 0:
-                st.warning(f"'{search_text}'에 해당하는 데이터가 없습니다.")
-            else:
-                st.write(f"검색 결과: {len(filtered_df)}건")
-                display_df = filtered_df
+            # 검색 색인(또는 이전 검색 결과)에서 검색어가 포함된 기사 위치 조회
+            with profile('search'):
+                search_rows = search_cache.search(search_text)
     else:
-        display_df = news_df
+        search_rows = None
         
-    # 데이터 표시 설정
-    display_df = display_df.copy()
-    
-    # 날짜 형식 변환 (원본 데이터는 유지하고 보여주기용 컬럼 생성)
-    if '작성/게시일자' in display_df.columns:
-        display_df['표시용_작성일자'] = pd.to_datetime(
-            display_df['작성/게시일자'].astype(str).str.replace('[^0-9]', ''),  # 숫자만 남기기
-            format='%Y%m%d',
-            errors='coerce'  # 유효하지 않은 날짜는 NaT로 변환
-        ).dt.strftime('%Y.%m.%d')
+    if date_range:
+        # 정렬된 게시일에서 이진 탐색으로 기간에 해당하는 기사 위치 조회
+        with profile('date_filter'):
+            search_rows = date_index.range_rows(*date_range, rows=search_rows)
+        
+    if collapse_duplicates:
+        from news_analysis.dedup import NearDuplicates
+        
+        # MinHash/LSH 묶음은 데이터셋당 한 번 계산하고, 걸러낸 기사 안에서 묶음마다 한 건만 남김
+        with st.spinner("유사 중복 기사를 찾는 중..."), profile('dedup'):
+            near_duplicates = dataset.derived('near_duplicates', NearDuplicates)
+            n_before = row_count(news_df, search_rows)
+            search_rows = near_duplicates.collapse(search_rows)
+        st.caption(f"유사 중복 기사 {n_before - len(search_rows):,}건 제외 (전체 기사 {len(news_df):,}건 중 묶음 {near_duplicates.n_clusters:,}개)")
+        
+    if search_rows is not None:
+        if len(search_rows) == 0:
+            if search_text:
+                st.warning(f"'{search_text}'에 해당하는 데이터가 없습니다.")
+            else:
+                st.warning("선택한 기간에 해당하는 데이터가 없습니다.")
+        else:
+            st.write(f"검색 결과: {len(search_rows)}건")
         
-        # 연도 컬럼이 없는 경우 생성 (분석용)
-        if '연도' not in display_df.columns:
-            display_df['연도'] = display_df['작성/게시일자'].astype(str).str[:4]
+    # 섹션 캐시 키: 데이터셋과 검색 결과 기사 목록
+    rows_key = (dataset.key, rows_signature(search_rows))
     
-    # 표시할 컬럼 선택 (연도 컬럼은 분석용으로 유지)
-    display_columns = ["표시용_작성일자", "기사제목", "관련기관", "키워드", "기사링크"]
-    display_columns = [col for col in display_columns if col in display_df.columns]
+    total_rows = row_count(news_df, search_rows)
     
     # 페이지네이션 설정
     items_per_page = st.select_slider(
@@ -176,12 +428,12 @@ if uploaded_file is not None:
     )
     
     # 총 페이지 수 계산
-    total_pages = max(1, (len(display_df) - 1) // items_per_page + 1)
+    total_pages, _, _, _ = page_bounds(total_rows, 1, items_per_page)
     
     # 페이지 선택 버튼
     col1, col2, _ = st.columns([1, 2, 3])
     with col1:
-        st.write(f"총 {len(display_df):,}개 항목 / {total_pages}페이지")
+        st.write(f"총 {total_rows:,}개 항목 / {total_pages}페이지")
     
     # 페이지네이션 컨트롤
     if total_pages > 1:
@@ -217,17 +469,14 @@ if uploaded_file is not None:
     else:
         current_page = 1
     
-    # 현재 페이지에 해당하는 데이터 추출
-    start_idx = (current_page - 1) * items_per_page
-    end_idx = min(current_page * items_per_page, len(display_df))
-    
-    # 데이터 표시 (컬럼명을 깔끔하게 표시)
-    display_df_renamed = display_df[display_columns].rename(columns={
-        '표시용_작성일자': '작성/게시일자'
-    })
+    # 현재 페이지에 해당하는 범위 (검색 결과가 줄어 페이지가 사라진 경우 마지막 페이지)
+    total_pages, current_page, start_idx, end_idx = page_bounds(total_rows, current_page, items_per_page)
     
+    # 현재 페이지의 기사만 골라 날짜 형식/컬럼명 변환 후 표시
+    with profile('table'):
+        page_df = page_frame(news_df, search_rows, start_idx, end_idx)
     st.dataframe(
-        display_df_renamed.iloc[start_idx:end_idx],
+        page_df,
         use_container_width=True,
         hide_index=True,
         column_config={
@@ -236,168 +485,89 @@ if uploaded_file is not None:
     )
     
     # 현재 표시 중인 데이터 범위 표시
-    st.caption(f"{start_idx + 1:,} - {end_idx:,} / 총 {len(display_df):,}개 (페이지 {current_page}/{total_pages})")
+    st.caption(f"{start_idx + 1:,} - {end_idx:,} / 총 {total_rows:,}개 (페이지 {current_page}/{total_pages})")
         
     
     # 지명 빈도수 히트맵
     st.markdown("---")
     st.header("🗺️ 분석 1: 지명 빈도수 히트맵")
     
-    if '관련기관' in display_df.columns:
-        @st.cache_data(ttl=3600)  # 1시간 동안 캐시 유지
-        def load_sigungu_coordinates():
-            """GitHub에서 시군구 좌표 데이터 로드"""
-            import pandas as pd
-            
-            # GitHub raw URL - 여기를 실제 GitHub raw URL로 변경해주세요
-            GITHUB_RAW_URL = "https://raw.githubusercontent.com/GEOeduHJ/news_analyzer_py/refs/heads/main/sigungu_coordinates.csv"
+    if '관련기관' in news_df.columns:
+        import streamlit.components.v1 as components
+        from news_analysis.gazetteer import load_gazetteer, load_remote_gazetteer
+        from news_analysis.heatmap import MAP_HEIGHT, MAP_WIDTH, HeatmapCache
+        from news_analysis.locations import LocationMatcher, OrgResolutionTable, gazetteer_fingerprint
+        from news_analysis.parallel import chunked_org_location_lists
+        
+        @st.cache_resource(ttl=3600)  # 원격 갱신 시 1시간 동안 캐시 유지
+        def load_sigungu_coordinates(refresh=False):
+            """시군구 좌표 데이터 로드 (저장소에 포함된 파일, refresh=True이면 GitHub의 최신 CSV)"""
+            if refresh:
+                try:
+                    return load_remote_gazetteer()
+                except Exception as e:
+                    st.warning(f"GitHub에서 시군구 좌표 데이터를 로드하지 못해 내장 데이터를 사용합니다: {e}")
             
             try:
-                # GitHub에서 CSV 파일 로드
-                df = pd.read_csv(GITHUB_RAW_URL)
-                
-                # 필요한 컬럼이 있는지 확인
-                required_columns = ['sido', 'sigungu', 'lat', 'lon']
-                if not all(col in df.columns for col in required_columns):
-                    st.error("CSV 파일 형식이 올바르지 않습니다. 'sido', 'sigungu', 'lat', 'lon' 컬럼이 필요합니다.")
-                    return {}
-                
-                # 시군구명을 키로, 위도와 경도를 값으로 하는 딕셔너리 생성
-                coords_dict = {}
-                for _, row in df.iterrows():
-                    location = row['sigungu']
-                    try:
-                        coords_dict[location] = {
-                            'lat': float(row['lat']),
-                            'lon': float(row['lon'])
-                        }
-                    except (ValueError, TypeError):
-                        continue  # 유효하지 않은 좌표는 건너뜁니다
-                
-                if not coords_dict:
-                    st.error("유효한 좌표 데이터를 찾을 수 없습니다.")
-                    return {}
-                    
-                return coords_dict
-                
-            except Exception as e:
-                st.error(f"GitHub에서 시군구 좌표 데이터를 로드하는 중 오류가 발생했습니다: {e}")
-                st.info(f"URL 확인: {GITHUB_RAW_URL}")
-                return {}
+                return load_gazetteer()
+            except (OSError, ValueError) as e:
+                st.error(f"시군구 좌표 데이터를 로드하는 중 오류가 발생했습니다: {e}")
+                return None
                 
-        # 시군구 좌표 데이터 로드
-        coords_dict = load_sigungu_coordinates()
+        # 시군구 좌표 데이터 로드 (기본은 오프라인, 사이드바에서 원격 갱신 선택)
+        refresh_gazetteer = st.sidebar.checkbox("GitHub에서 최신 시군구 좌표 사용", value=False)
+        gazetteer = load_sigungu_coordinates(refresh_gazetteer)
             
-        if coords_dict:
-            def get_org_location_frequency(org_series, coords_dict):
-                """관련기관 시리즈에서 지명 빈도수를 계산"""
-                location_counts = defaultdict(int)
-                
-                # 제외할 일반적인 구 이름 목록
-                excluded_districts = {'북구', '남구', '동구', '서구', '중구'}
-                
-                # 시군구명에서 제외할 구 이름을 필터링하여 저장
-                filtered_locations = {
-                    loc: loc.replace('시', '').replace('군', '').replace('구', '')
-                    for loc in coords_dict.keys()
-                    if not any(excluded in loc for excluded in excluded_districts)
-                }
-                
-                for orgs in org_series.dropna():
-                    if not isinstance(orgs, str):
-                        continue
-                        
-                    # 관련기관을 쉼표로 분리하고 공백 제거
-                    org_list = [org.strip() for org in orgs.split(',') if org.strip()]
-                    
-                    for org in org_list:
-                        # 괄호 안의 내용 제거 (예: '서울시청(서울특별시)' -> '서울시청')
-                        org = re.sub(r'\([^)]*\)', '', org).strip()
-                        
-                        # 기관명에서 시/군/구 추출
-                        for location, base_name in filtered_locations.items():
-                            if base_name and base_name in org:
-                                location_counts[location] += 1
-                                break
-                                
-                return location_counts
-                
-            # 지명 빈도수 계산
-            location_counts = get_org_location_frequency(display_df['관련기관'], coords_dict)
+        @st.cache_resource
+        def get_org_resolution_table(location_names):
+            """기관명 -> 시군구 변환표 (가제티어당 한 번 생성, 디스크에 누적 저장)"""
+            try:
+                return OrgResolutionTable.for_gazetteer(location_names)
+            except OSError:
+                return OrgResolutionTable(LocationMatcher(location_names))
+            
+        @st.cache_resource
+        def get_heatmap_cache():
+            """히트맵 HTML 캐시 (빈도표가 같으면 folium 지도를 다시 만들지 않음)"""
+            return HeatmapCache(max_entries=16)
+            
+        def compute_heatmap_section(gazetteer):
+            """(지명 빈도수, 히트맵 HTML) 계산 (처음 보는 기관명만 변환하고 변환표에 추가)"""
+            org_resolution_table = get_org_resolution_table(tuple(gazetteer.names))
+            location_dimension = f"location-{gazetteer_fingerprint(gazetteer.names)}"
+            analysis_cube.dimension(
+                location_dimension,
+                lambda df: chunked_org_location_lists(df['관련기관'], org_resolution_table, analysis_workers)
+            )
+            with profile('location_matching'):
+                location_counts = analysis_cube.frequency(location_dimension, search_rows)
+                try:
+                    org_resolution_table.save()
+                except OSError:
+                    pass
+            
+            heatmap_html = None
+            if location_counts and sum(location_counts.values()) > 0:
+                with profile('heatmap_render'):
+                    heatmap_html = get_heatmap_cache().html(location_counts, gazetteer)
+            return location_counts, heatmap_html
+            
+        track_cache('히트맵', get_heatmap_cache())
+        if gazetteer:
+            # 지명 빈도수와 히트맵 (검색 결과나 좌표 데이터가 바뀔 때만 다시 계산)
+            location_counts, heatmap_html = run_section(
+                'heatmap', rows_key + (gazetteer.fingerprint(),),
+                lambda: compute_heatmap_section(gazetteer)
+            )
     
             if location_counts and sum(location_counts.values()) > 0:
-                # 히트맵 생성
-                def create_heatmap(location_counts, coords_dict):
-                    """지명 빈도수를 기반으로 히트맵 생성"""
-                    # 데이터프레임 생성
-                    df_locations = pd.DataFrame({
-                        'location': list(location_counts.keys()),
-                        'count': list(location_counts.values())
-                        })
-                        
-                    # 좌표 추가
-                    df_locations['lat'] = df_locations['location'].apply(
-                        lambda x: coords_dict.get(x, {}).get('lat') if x in coords_dict else None
-                    )
-                    df_locations['lon'] = df_locations['location'].apply(
-                        lambda x: coords_dict.get(x, {}).get('lon') if x in coords_dict else None
-                    )
-                        
-                    # 좌표가 없는 행 제거
-                    df_locations = df_locations.dropna(subset=['lat', 'lon'])
-                        
-                    if df_locations.empty:
-                        st.warning("유효한 좌표 데이터가 없습니다.")
-                        return None
-                        
-                    # 지도 생성 (한국 중심)
-                    m = folium.Map(location=[36.5, 127.5], zoom_start=7, tiles='cartodbpositron')
-                        
-                    # 히트맵 데이터 준비 (정규화된 가중치 적용)
-                    max_count = df_locations['count'].max()
-                    min_count = df_locations['count'].min()
-                    
-                    # 최소값이 최대값과 같은 경우를 대비해 분모 조정
-                    count_range = max(1, max_count - min_count)
-                    
-                    heat_data = []
-                    for _, row in df_locations.iterrows():
-                        # 정규화된 가중치 계산 (1.0 ~ 5.0 범위로 스케일링)
-                        normalized_weight = 1.0 + 4.0 * (row['count'] - min_count) / count_range
-                        heat_data.append([row['lat'], row['lon'], normalized_weight])
-                        
-                    # 히트맵 추가 (radius와 blur 조정)
-                    HeatMap(
-                        heat_data,
-                        radius=20,  # 반경 증가
-                        blur=15,     # 블러 효과 증가
-                        max_zoom=12,  # 최대 줌 레벨 제한
-                        min_opacity=0.5,  # 최소 불투명도 설정
-                        gradient={0.4: 'blue', 0.6: 'lime', 0.8: 'orange', 1.0: 'red'}  # 그라데이션 색상 지정
-                    ).add_to(m)
-                        
-                    # 상위 10개 지명에 마커 추가
-                    top_locations = df_locations.nlargest(10, 'count')
-                    for _, row in top_locations.iterrows():
-                        folium.CircleMarker(
-                            location=[row['lat'], row['lon']],
-                            radius=row['count']/max(df_locations['count'])*10 + 5,
-                            popup=f"{row['location']}: {row['count']}건",
-                            color='blue',
-                            fill=True,
-                            fill_opacity=0.4
-                            ).add_to(m)
-                        
-                    return m
-                    
                 # 히트맵 생성 및 표시 (반응형)
                 st.markdown("### 🗺️ 지명 빈도수 히트맵")
                 
                 # 컨테이너에 지도 표시 (좌우 여백 조정)
                 col1, col2, col3 = st.columns([1, 8, 1])
                 with col2:
-                    heatmap = create_heatmap(location_counts, coords_dict)
-                    if heatmap:
+                    if heatmap_html:
                         # 스타일을 적용한 컨테이너
                         st.markdown(
                             """
@@ -412,8 +582,10 @@ if uploaded_file is not None:
                             """,
                             unsafe_allow_html=True
                         )
-                        folium_static(heatmap, width=400, height=600)
+                        components.html(heatmap_html, width=MAP_WIDTH, height=MAP_HEIGHT + 10)
                         st.markdown("</div>", unsafe_allow_html=True)
+                    else:
+                        st.warning("유효한 좌표 데이터가 없습니다.")
                     
                 # 상위 20개 지명 표시
                 st.markdown("### 📊 지명 빈도수 Top 20")
@@ -432,18 +604,34 @@ if uploaded_file is not None:
             
         # 연도별 기사 수 분석
         st.markdown("---")
-        st.header("🗺️ 분석 2: 연도별 기사 수 분석")
+        st.header("🗺️ 분석 2: 기간별 기사 수 분석")
         
-        if '연도' in display_df.columns:
-            year_counts = display_df["연도"].value_counts().sort_index()
+        if '연도' in news_df.columns:
+            import plotly.express as px
             
-            fig1 = px.bar(
-                x=year_counts.index,
-                y=year_counts.values,
-                labels={"x": "연도", "y": "기사 수"},
-                title="연도별 기사 수 분석"
-            )
-            st.plotly_chart(fig1, use_container_width=True)
+            granularity_label = st.selectbox("집계 단위", list(GRANULARITIES.values()))
+            granularity = next(key for key, label in GRANULARITIES.items() if label == granularity_label)
+            
+            def compute_trend_chart(granularity):
+                """기간별 기사 수 막대 그래프 생성 (게시일을 단위 기간 시작일로 내려 집계)"""
+                trend_counts = date_index.trend(granularity, search_rows)
+                if len(trend_counts) == 0:
+                    # 검색 결과가 없거나 게시일이 없는 기사뿐이면 그릴 막대가 없음
+                    return None
+                # 연도는 기존처럼 '2020' 같은 항목으로, 나머지는 날짜 축으로 표시
+                x = trend_counts.index.strftime('%Y') if granularity == 'year' else trend_counts.index
+                return px.bar(
+                    x=x,
+                    y=trend_counts.values,
+                    labels={"x": granularity_label, "y": "기사 수"},
+                    title=f"{granularity_label}별 기사 수 분석"
+                )
+            
+            fig1 = run_section('trend', rows_key + (granularity,), lambda: compute_trend_chart(granularity))
+            if fig1 is not None:
+                st.plotly_chart(fig1, use_container_width=True)
+            else:
+                st.info("기간별로 집계할 기사가 없습니다.")
         else:
             st.error("'연도' 컬럼이 생성되지 않았습니다. 데이터를 다시 확인해주세요.")
             st.stop()
@@ -452,58 +640,40 @@ if uploaded_file is not None:
         st.markdown("---")
         st.header("☁️ 분석 3: 키워드 워드클라우드")
         
-        if '키워드' in display_df.columns:
-            # 키워드 처리
-            all_keywords = ",".join(display_df["키워드"].dropna().astype(str)).split(",")
-            filtered_keywords = [kw.strip() for kw in all_keywords if len(kw.strip()) > 1]
-            keyword_freq = Counter(filtered_keywords)
+        if '키워드' in news_df.columns:
+            from news_analysis.parallel import chunked_keyword_store
+            from news_analysis.wordcloud_images import WordCloudCache
+            
+            # 키워드 처리 (데이터셋당 한 번 정수 코드로 변환, 검색 결과 기사의 빈도수만 집계)
+            analysis_cube.dimension('keyword', lambda df: chunked_keyword_store(df['키워드'], analysis_workers))
             
             # 워드클라우드에 표시할 상위 키워드 수 조정
             st.subheader("워드클라우드 설정")
             top_n = st.slider("표시할 상위 키워드 수", 10, 100, 20, 10)
-            top_keywords = dict(keyword_freq.most_common(top_n))
             
-            # 워드클라우드 생성
+            @st.cache_resource
+            def get_wordcloud_cache():
+                """렌더링한 워드클라우드 PNG 캐시 (빈도표/표시 수/크기/폰트 기준, 최대 32MB)"""
+                return WordCloudCache(max_bytes=32 * 1024 ** 2)
+            
+            def compute_wordcloud_section(top_n):
+                """(상위 키워드, 워드클라우드 PNG 또는 생성 오류) 계산"""
+                top_keywords = analysis_cube.top('keyword', top_n, search_rows)
+                try:
+                    return top_keywords, get_wordcloud_cache().render(top_keywords, top_n, width=500, height=200)
+                except Exception as e:
+                    return top_keywords, e
+            
+            track_cache('워드클라우드', get_wordcloud_cache())
+            
+            # 워드클라우드 생성 (검색 결과나 표시 수가 바뀔 때만 다시 계산)
+            top_keywords, wordcloud_png = run_section(
+                'wordcloud', rows_key + (top_n,), lambda: compute_wordcloud_section(top_n)
+            )
             try:
-                import json
-                import random
-                
-                # 워드클라우드 데이터 준비
-                words_js = []
-                max_count = max(top_keywords.values()) if top_keywords else 1
-                
-                for word, count in top_keywords.items():
-                    # 폰트 크기 계산 (빈도수에 비례)
-                    size = 12 + int(40 * (count / max_count))
-                    words_js.append({
-                        'text': word,
-                        'size': size,
-                        'color': f'hsl({random.randint(0, 360)}, 70%, 50%)'
-                    })
-                
-                # wordcloud 라이브러리를 사용하여 워드클라우드 생성
-                from wordcloud import WordCloud
-                import matplotlib.pyplot as plt
-                
-                # 워드클라우드 생성
-                wordcloud = WordCloud(
-                    width=500,
-                    height=200,
-                    background_color='white',
-                    font_path='CookieRun Regular.ttf',  # 프로젝트 폴더의 CookieRun 폰트 사용
-                    max_words=top_n,
-                    max_font_size=100,
-                    random_state=42
-                )
-                
-                # 워드클라우드에 단어 추가 및 표시
-                wordcloud.generate_from_frequencies(top_keywords)
-                plt.figure(figsize=(10, 6))
-                plt.imshow(wordcloud, interpolation='bilinear')
-                plt.axis('off')
-                plt.tight_layout(pad=0)
-                st.pyplot(plt.gcf())
-                plt.close()
+                if isinstance(wordcloud_png, Exception):
+                    raise wordcloud_png
+                st.image(wordcloud_png, use_column_width=True)
                 
             except Exception as e:
                 st.error(f'워드클라우드 생성 중 오류가 발생했습니다: {str(e)}')
@@ -524,98 +694,113 @@ if uploaded_file is not None:
         st.markdown("---")
         st.header("🕸️ 분석 4: 기관 네트워크 분석")
         
-        if '관련기관' in display_df.columns:
-            # 기관 네트워크 분석
-            co_occurrence = Counter()
-            for row in display_df["관련기관"].dropna():
-                orgs = list(set([o.strip() for o in str(row).split(",") if len(o.strip()) > 1]))
-                for i in range(len(orgs)):
-                    for j in range(i+1, len(orgs)):
-                        edge = tuple(sorted([orgs[i], orgs[j]]))
-                        co_occurrence[edge] += 1
+        if '관련기관' in news_df.columns:
+            import plotly.graph_objects as go
+            from news_analysis.layout import LAYOUT_METHODS, LayoutCache
+            from news_analysis.network import incidence_matrix, org_graph
+            from news_analysis.parallel import chunked_org_lists
+            
+            # 기관 네트워크 분석 (희소 행렬 AᵀA, 동시출현 2회 이상만 엣지로 사용)
+            def compute_org_graph():
+                """검색 결과 기사의 기관 동시출현 그래프 생성"""
+                org_codes = analysis_cube.dimension('org', lambda df: chunked_org_lists(df['관련기관'], analysis_workers))
+                return org_graph(incidence_matrix(org_codes, search_rows), org_codes.vocab, min_weight=2,
+                                 workers=analysis_workers)
             
-            # 동시출현 2회 이상만 필터링
-            filtered_edges = {pair: w for pair, w in co_occurrence.items() if w >= 2}
+            G = run_section('network_graph', rows_key, compute_org_graph, label="그래프")
             
-            G = nx.Graph()
-            for (a, b), weight in filtered_edges.items():
-                G.add_edge(a, b, weight=weight)
+            @st.cache_resource
+            def get_layout_cache():
+                """네트워크 배치 캐시 (그래프 서명 기준, 슬라이더 변경 시 이전 배치에서 웜 스타트)"""
+                return LayoutCache(max_entries=32)
+            
+            track_cache('네트워크 배치', get_layout_cache())
             
             if len(G.nodes()) > 0:
                 # 상위 노드 수 조절 슬라이더
-                max_nodes = min(30, len(G.nodes()))  # 최대 50개 노드로 제한
+                max_nodes = min(300, len(G.nodes()))  # 최대 300개 노드로 제한
                 node_count = st.slider("분석할 상위 기관 수", 5, max_nodes, min(20, max_nodes), 1)
+                layout_label = st.selectbox("배치 방식", list(LAYOUT_METHODS.values()))
+                layout_method = next(key for key, label in LAYOUT_METHODS.items() if label == layout_label)
                 
-                # 선택한 노드 수만큼 상위 노드 필터링
-                top_nodes = sorted(G.degree, key=lambda x: x[1], reverse=True)[:node_count]
-                G_filtered = G.subgraph([n for n, _ in top_nodes])
-                
-                st.write(f"선택된 기관 수: {len(G_filtered.nodes())}")
-                st.write(f"연결 수: {len(G_filtered.edges())}")
-                
-                # 노드 위치 계산
-                pos = nx.spring_layout(G_filtered, seed=42)
+                def compute_network_figure(node_count, layout_method):
+                    """(선택된 기관 수, 연결 수, 네트워크 그림) 계산"""
+                    # 선택한 노드 수만큼 상위 노드 필터링
+                    top_nodes = sorted(G.degree, key=lambda x: x[1], reverse=True)[:node_count]
+                    G_filtered = G.subgraph([n for n, _ in top_nodes])
+                    
+                    # 노드 위치 계산 (같은 부분 그래프는 캐시된 배치 재사용)
+                    pos = get_layout_cache().layout(G_filtered, method=layout_method)
                 
-                # 엣지 좌표 추출
-                edge_x, edge_y = [], []
-                for edge in G_filtered.edges():
-                    x0, y0 = pos[edge[0]]
-                    x1, y1 = pos[edge[1]]
-                    edge_x += [x0, x1, None]
-                    edge_y += [y0, y1, None]
+                    # 엣지 좌표 추출
+                    edge_x, edge_y = [], []
+                    for edge in G_filtered.edges():
+                        x0, y0 = pos[edge[0]]
+                        x1, y1 = pos[edge[1]]
+                        edge_x += [x0, x1, None]
+                        edge_y += [y0, y1, None]
                 
-                # 엣지 트레이스
-                edge_trace = go.Scatter(
-                    x=edge_x, y=edge_y,
-                    line=dict(width=0.5, color="#888"),
-                    hoverinfo='none',
-                    mode='lines'
-                )
+                    # 엣지 트레이스
+                    edge_trace = go.Scatter(
+                        x=edge_x, y=edge_y,
+                        line=dict(width=0.5, color="#888"),
+                        hoverinfo='none',
+                        mode='lines'
+                    )
                 
-                # 노드 트레이스
-                node_x, node_y, node_text = [], [], []
-                for node in G_filtered.nodes():
-                    x, y = pos[node]
-                    node_x.append(x)
-                    node_y.append(y)
-                    node_text.append(f"{node}<br>연결 수: {G_filtered.degree[node]}")
+                    # 노드 트레이스
+                    node_x, node_y, node_text = [], [], []
+                    for node in G_filtered.nodes():
+                        x, y = pos[node]
+                        node_x.append(x)
+                        node_y.append(y)
+                        node_text.append(f"{node}<br>연결 수: {G_filtered.degree[node]}")
                 
-                # 노드의 연결 수에 따라 색상 계산
-                node_degrees = [G_filtered.degree[node] for node in G_filtered.nodes()]
+                    # 노드의 연결 수에 따라 색상 계산
+                    node_degrees = [G_filtered.degree[node] for node in G_filtered.nodes()]
                 
-                node_trace = go.Scatter(
-                    x=node_x, y=node_y,
-                    mode='markers+text',
-                    text=[node[:10] + '...' if len(node) > 10 else node for node in G_filtered.nodes()],
-                    textposition="bottom center",
-                    hovertext=node_text,
-                    hoverinfo='text',
-                    marker=dict(
-                        size=10,
-                        color=node_degrees,
-                        colorscale='YlGnBu',
-                        showscale=True,
-                        colorbar=dict(
-                            thickness=15,
-                            title='연결 수',
-                            xanchor='left',
-                            titleside='right'
-                        ),
-                        line=dict(width=2, color='DarkSlateGrey')
+                    node_trace = go.Scatter(
+                        x=node_x, y=node_y,
+                        mode='markers+text' if len(G_filtered) <= 50 else 'markers',  # 노드가 많으면 이름은 마우스오버로만 표시
+                        text=[node[:10] + '...' if len(node) > 10 else node for node in G_filtered.nodes()],
+                        textposition="bottom center",
+                        hovertext=node_text,
+                        hoverinfo='text',
+                        marker=dict(
+                            size=10,
+                            color=node_degrees,
+                            colorscale='YlGnBu',
+                            showscale=True,
+                            colorbar=dict(
+                                thickness=15,
+                                title='연결 수',
+                                xanchor='left',
+                                titleside='right'
+                            ),
+                            line=dict(width=2, color='DarkSlateGrey')
+                        )
                     )
-                )
                 
-                # 네트워크 그래프 생성
-                fig = go.Figure(
-                    data=[edge_trace, node_trace],
-                    layout=go.Layout(
-                        showlegend=False,
-                        hovermode='closest',
-                        margin=dict(b=20,l=5,r=5,t=40),
-                        xaxis=dict(showgrid=False, zeroline=False, showticklabels=False),
-                        yaxis=dict(showgrid=False, zeroline=False, showticklabels=False)
+                    # 네트워크 그래프 생성
+                    fig = go.Figure(
+                        data=[edge_trace, node_trace],
+                        layout=go.Layout(
+                            showlegend=False,
+                            hovermode='closest',
+                            margin=dict(b=20,l=5,r=5,t=40),
+                            xaxis=dict(showgrid=False, zeroline=False, showticklabels=False),
+                            yaxis=dict(showgrid=False, zeroline=False, showticklabels=False)
+                        )
                     )
+                
+                    return len(G_filtered.nodes()), len(G_filtered.edges()), fig
+                
+                n_nodes, n_edges, fig = run_section(
+                    'network', rows_key + (node_count, layout_method),
+                    lambda: compute_network_figure(node_count, layout_method), label="배치"
                 )
+                st.write(f"선택된 기관 수: {n_nodes}")
+                st.write(f"연결 수: {n_edges}")
                 
                 st.plotly_chart(fig, use_container_width=True)
             else:
@@ -623,6 +808,45 @@ if uploaded_file is not None:
         else:
             st.warning("업로드한 파일에 '관련기관' 열이 없습니다.")
 
+# 진단 모드: 이번 실행의 섹션별 기록, 캐시 적중 횟수, 실행별 추이
+if profiler is not None:
+    run = profiler.end_run()
+    with diagnostics_panel:
+        st.caption(f"실행 {run['run']}회차 · 전체 {run['seconds']:.2f}초 · 최근 {len(profiler.runs)}회 보관")
+        st.caption("최대 메모리는 프로세스 전체 기준입니다 (동시에 실행된 다른 세션의 할당 포함 가능).")
+        sections = pd.DataFrame(profiler.section_rows(run), columns=['section', 'depth', 'seconds', 'peak_mb'])
+        if not sections.empty:
+            st.dataframe(
+                pd.DataFrame({
+                    '섹션': ['　' * depth + DIAGNOSTIC_LABELS.get(name, name)
+                           for name, depth in zip(sections['section'], sections['depth'])],
+                    '시간(초)': sections['seconds'].round(3),
+                    '최대 메모리(MB)': sections['peak_mb'],
+                }),
+                hide_index=True,
+                use_container_width=True
+            )
+        caches = pd.DataFrame(profiler.cache_rows(run))
+        if not caches.empty:
+            st.dataframe(
+                caches.rename(columns={
+                    'cache': '캐시', 'run_hits': '이번 적중', 'run_misses': '이번 계산',
+                    'hits': '누적 적중', 'misses': '누적 계산', 'entries': '항목 수'
+                })[['캐시', '이번 적중', '이번 계산', '누적 적중', '누적 계산', '항목 수']],
+                hide_index=True,
+                use_container_width=True
+            )
+        history = pd.DataFrame(profiler.history_rows())
+        if len(profiler.runs) > 1 and not history.empty:
+            st.caption("실행별 섹션 시간(초)")
+            st.line_chart(history.pivot_table(index='run', columns='section', values='seconds', aggfunc='sum'))
+        st.download_button(
+            "기록 내보내기 (JSON)", profiler.to_json(), file_name="news_analyzer_diagnostics.json",
+            mime="application/json"
+        )
+        if st.button("기록 지우기", key="clear_diagnostics"):
+            profiler.clear()
+
 # 스타일 설정
 st.markdown("""
     <style>
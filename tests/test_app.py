@@ -0,0 +1,33 @@
+"""대시보드 스크립트 테스트 (streamlit AppTest)"""
+import io
+import os
+
+import pytest
+
+pytest.importorskip('streamlit.testing.v1')
+from streamlit.testing.v1 import AppTest
+
+APP_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'news_analyzer.py')
+
+CSV = (
+    '일자,제목,기관,특성추출(가중치순 상위 50개),URL\n'
+    '20200101,탄소 중립 정책,환경부,"탄소,중립",https://news.example.com/1\n'
+    '20210315,수소 경제 확대,산업통상자원부,"수소,경제",https://news.example.com/2\n'
+).encode('utf-8')
+
+
+@pytest.fixture
+def app(tmp_path, monkeypatch):
+    monkeypatch.setenv('NEWS_ANALYZER_CACHE_DIR', str(tmp_path))
+    at = AppTest.from_file(APP_PATH, default_timeout=120)
+    at.session_state['uploaded_files'] = [io.BytesIO(CSV)]
+    return at
+
+
+def test_zero_result_search_shows_info_instead_of_trend(app):
+    app.run()
+    app.text_input[0].set_value('zzzzqq').run()
+
+    assert not app.exception
+    assert any("'zzzzqq'에 해당하는 데이터가 없습니다." in w.value for w in app.warning)
+    assert any('기간별로 집계할 기사가 없습니다.' in i.value for i in app.info)
@@ -0,0 +1,22 @@
+"""일괄 분석 출력 이름 테스트"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+from news_analysis.batch import output_names
+
+
+def test_output_names_keep_subdirectories(tmp_path):
+    paths = [str(tmp_path / '2023' / 'news.xlsx'), str(tmp_path / '2024' / 'news.xlsx')]
+    assert output_names(paths, str(tmp_path)) == [os.path.join('2023', 'news'), os.path.join('2024', 'news')]
+    # 입력 루트를 주지 않으면 공통 상위 디렉토리 기준
+    assert output_names(paths) == [os.path.join('2023', 'news'), os.path.join('2024', 'news')]
+
+
+def test_output_names_fail_on_collision(tmp_path):
+    paths = [str(tmp_path / 'news.xlsx'), str(tmp_path / 'news.csv')]
+    with pytest.raises(ValueError, match='news'):
+        output_names(paths, str(tmp_path))
@@ -0,0 +1,32 @@
+"""누적 기사 코퍼스 테스트"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd
+
+from news_analysis.corpus import Corpus
+from news_analysis.ingest import normalize_news_df
+
+
+def export(dates, prefix):
+    return normalize_news_df(pd.DataFrame({
+        '일자': pd.Series(dates, dtype=object),
+        '제목': [f'{prefix} 기사 {i}' for i in range(len(dates))],
+        'URL': [f'https://news.example.com/{prefix}/{i}' for i in range(len(dates))],
+    }))
+
+
+def test_unstorable_source_is_dropped_alone_on_reload(tmp_path, caplog):
+    corpus = Corpus(str(tmp_path))
+    assert corpus.add('good', export([20200101, 20200102], 'a'), name='good.xlsx') == 2
+    # 정수와 문자열이 섞인 일자 컬럼은 Arrow로 변환할 수 없어 저장되지 않음
+    assert corpus.add('mixed', export([20200103, '20200104'], 'b'), name='mixed.csv') == 2
+    assert 'mixed.csv' in caplog.text
+    assert len(corpus) == 4
+
+    reloaded = Corpus(str(tmp_path))
+    assert [source['key'] for source in reloaded.sources] == ['good']
+    assert len(reloaded) == 2
+    assert list(reloaded.dataset.news_df['기사제목']) == ['a 기사 0', 'a 기사 1']
@@ -0,0 +1,45 @@
+"""게시일 파싱과 기간별 추이 테스트"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import pandas as pd
+
+from news_analysis.dates import DateIndex
+from news_analysis.ingest import DATE_COLUMN, normalize_news_df, parse_dates
+
+EXPECTED = pd.to_datetime(['2020-01-01', None, '2021-03-15'])
+
+
+def test_parse_dates_numeric_with_blank_cell():
+    # 빈 셀 하나로 실수형이 된 컬럼 (20200101.0)
+    dates = pd.Series([20200101, np.nan, 20210315])
+    assert dates.dtype == np.float64
+    pd.testing.assert_series_equal(parse_dates(dates), pd.Series(EXPECTED), check_names=False)
+
+
+def test_parse_dates_datetime_column():
+    dates = pd.Series(EXPECTED)
+    pd.testing.assert_series_equal(parse_dates(dates), pd.Series(EXPECTED), check_names=False)
+
+
+def test_parse_dates_mixed_object_column():
+    # 엑셀 날짜 셀을 복원한 값과 yyyymmdd 숫자/문자열이 섞인 컬럼
+    dates = pd.Series([pd.Timestamp('2020-01-01'), None, '2021.03.15', 20220102.0], dtype=object)
+    expected = pd.to_datetime(['2020-01-01', None, '2021-03-15', '2022-01-02'])
+    pd.testing.assert_series_equal(parse_dates(dates), pd.Series(expected), check_names=False)
+
+
+def test_normalize_keeps_dates_with_blank_cell():
+    news_df = normalize_news_df(pd.DataFrame({'일자': [20200101, np.nan, 20210315], '제목': ['a', 'b', 'c']}))
+    assert news_df[DATE_COLUMN].notna().sum() == 2
+    trend = DateIndex.from_frame(news_df).trend('year')
+    assert list(trend.values) == [1, 1]
+
+
+def test_trend_of_empty_rows_is_empty():
+    date_index = DateIndex(pd.to_datetime(['2020-01-01', '2021-03-15']))
+    trend = date_index.trend('month', np.array([], dtype=np.int64))
+    assert len(trend) == 0
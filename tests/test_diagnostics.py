@@ -0,0 +1,35 @@
+"""진단 모드 기록 테스트"""
+import gc
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from news_analysis.diagnostics import SectionProfiler
+
+
+def test_tracing_is_shared_across_profilers():
+    assert not tracemalloc.is_tracing()
+    first, second = SectionProfiler(), SectionProfiler()
+    first.start_run()
+    second.start_run()
+
+    # 한 세션이 진단 모드를 꺼도 다른 세션이 기록 중이면 추적 유지
+    first.stop()
+    assert tracemalloc.is_tracing()
+    with second.section('work'):
+        data = [bytes(1024) for _ in range(100)]
+    assert second.end_run()['sections'][0]['peak_mb'] is not None
+    assert not tracemalloc.is_tracing()
+    del data
+
+
+def test_tracing_stops_when_session_goes_away():
+    profiler = SectionProfiler()
+    profiler.start_run()
+    assert tracemalloc.is_tracing()
+    # 실행 도중 세션이 닫혀 프로파일러가 사라진 경우
+    del profiler
+    gc.collect()
+    assert not tracemalloc.is_tracing()
@@ -0,0 +1,62 @@
+"""업로드 데이터 캐시와 스냅샷 저장소 테스트"""
+import errno
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd
+
+from news_analysis.ingest import IngestCache
+from news_analysis.snapshot import SnapshotStore
+
+CSV = (
+    '일자,제목,기관,특성추출(가중치순 상위 50개),URL\n'
+    '20200101,탄소 중립 정책,환경부,"탄소,중립",https://news.example.com/1\n'
+).encode('utf-8')
+
+
+class FullDiskStore(SnapshotStore):
+    """저장할 때마다 디스크 부족 오류를 내는 저장소"""
+
+    def save(self, key, news_df):
+        raise OSError(errno.ENOSPC, 'No space left on device')
+
+
+def test_snapshot_save_error_falls_back_to_memory(tmp_path):
+    cache = IngestCache(snapshot_store=FullDiskStore(str(tmp_path)))
+    news_df = cache.load(CSV)
+    assert list(news_df['기사제목']) == ['탄소 중립 정책']
+    # 메모리 캐시에는 보관됨
+    assert cache.load(CSV) is news_df
+    assert cache.stats()['hits'] == 1
+
+
+def test_snapshot_load_on_read_only_store(tmp_path, monkeypatch):
+    store = SnapshotStore(str(tmp_path))
+    IngestCache(snapshot_store=store).load(CSV)
+
+    def read_only(path, times):
+        raise PermissionError(errno.EROFS, 'Read-only file system', path)
+
+    monkeypatch.setattr(os, 'utime', read_only)
+    cache = IngestCache(snapshot_store=store)
+    news_df = cache.load(CSV)
+    assert cache.stats()['snapshot_hits'] == 1
+    assert isinstance(news_df, pd.DataFrame) and len(news_df) == 1
+
+
+def test_corrupt_snapshot_is_reparsed(tmp_path):
+    store = SnapshotStore(str(tmp_path))
+    IngestCache(snapshot_store=store).load(CSV)
+    (key,) = [entry['key'] for entry in store.list()]
+    with open(store.path_for(key), 'wb') as f:
+        f.write(b'not an arrow file')
+
+    cache = IngestCache(snapshot_store=store)
+    news_df = cache.load(CSV)
+    assert list(news_df['기사제목']) == ['탄소 중립 정책']
+    assert cache.stats()['snapshot_hits'] == 0
+    # 다시 파싱한 결과로 스냅샷을 새로 저장
+    assert IngestCache(snapshot_store=store).load(CSV) is not None
+    assert [entry['key'] for entry in store.list()] == [key]
@@ -0,0 +1,34 @@
+"""구간별 분할 처리 테스트"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd
+
+from news_analysis import parallel
+from news_analysis.locations import LocationMatcher, OrgResolutionTable, org_location_lists
+
+LOCATION_NAMES = ['수원시', '강릉시', '제주시']
+ORGS = pd.Series(['수원시청,환경부', '강릉시의회', '제주시청,수원시의회', None])
+
+
+def test_location_workers_reuse_persisted_table(tmp_path, monkeypatch):
+    monkeypatch.setattr(parallel, '_worker_tables', {})
+    table = OrgResolutionTable.for_gazetteer(LOCATION_NAMES, root=str(tmp_path))
+    expected = org_location_lists(ORGS, table)
+    table.save()
+
+    # 작업 프로세스와 같은 함수: 저장된 변환표를 읽으므로 새로 변환한 기관명이 없음
+    lists, entries = parallel._location_chunk(ORGS, tuple(LOCATION_NAMES), table.path)
+    assert entries == {}
+    assert lists.frequency() == expected.frequency()
+
+
+def test_location_workers_receive_in_memory_table(monkeypatch):
+    monkeypatch.setattr(parallel, '_worker_tables', {})
+    table = OrgResolutionTable(LocationMatcher(LOCATION_NAMES))
+    org_location_lists(ORGS, table)
+
+    _, entries = parallel._location_chunk(ORGS, tuple(LOCATION_NAMES), None, table.entries())
+    assert entries == {}
@@ -0,0 +1,40 @@
+"""빅카인즈 내보내기 파일 리더 테스트"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+from news_analysis.ingest import COLUMN_MAPPING
+from news_analysis.readers import detect_csv_encoding, read_news_table
+
+CSV = (
+    '일자,제목,기관,본문\n'
+    '20200101,탄소 중립 정책 발표,환경부,본문 내용\n'
+    '20210315,수소 경제 확대,"산업통상자원부,수원시청",본문 내용\n'
+)
+
+
+@pytest.mark.parametrize('encoding, detected', [
+    ('utf-8', 'utf-8'),
+    ('utf-8-sig', 'utf-8-sig'),
+    ('cp949', 'cp949'),
+    ('euc-kr', 'cp949'),
+])
+def test_read_csv_in_korean_encodings(encoding, detected):
+    data = CSV.encode(encoding)
+    assert detect_csv_encoding(data) == detected
+
+    news_df = read_news_table(data, COLUMN_MAPPING.keys(), name='export.csv')
+    assert list(news_df.columns) == ['일자', '제목', '기관']
+    assert list(news_df['제목']) == ['탄소 중립 정책 발표', '수소 경제 확대']
+    assert news_df['기관'][1] == '산업통상자원부,수원시청'
+
+
+def test_csv_without_some_mapped_columns():
+    from news_analysis.ingest import load_news_bytes
+
+    news_df = load_news_bytes(CSV.encode('utf-8'), name='nourl.csv')
+    assert list(news_df.columns) == ['작성/게시일자', '기사제목', '관련기관', '연도', '게시일']
+    assert len(news_df) == 2